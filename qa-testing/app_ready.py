@@ -0,0 +1,359 @@
+"""
+App readiness and route warm-up
+Starts the Next.js app (optionally), probes /login with exponential backoff
+until it renders without the Next.js error page, then warms every app route and
+the read-only server actions concurrently, so the first test of a route does not
+absorb its cold-start cost. Cold (first) and warm (second) latencies are written
+to reports/warmup.json.
+
+The ready state lives in .warmup/ready.json behind a lock file: the first pytest
+worker (or the CI step) does the work, everyone else waits on the lock and
+reuses the result while it is fresh.
+
+    python app_ready.py start --cwd .. -- npm run start    # start, wait, warm (CI)
+    python app_ready.py wait                               # app already running
+    python app_ready.py status
+"""
+import argparse
+import contextlib
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import auth_state
+from helpers import write_json
+from impact_map import REPO_ROOT, app_routes
+from local_supabase import accounts_from_env
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process lock, workers may warm up in parallel
+    fcntl = None
+
+
+QA_DIR = Path(__file__).resolve().parent
+STATE_DIR = QA_DIR / ".warmup"
+READY_PATH = STATE_DIR / "ready.json"
+LOCK_PATH = STATE_DIR / "ready.lock"
+REPORT_PATH = QA_DIR / "reports" / "warmup.json"
+
+ENABLED = os.getenv("WARMUP", "true").lower() == "true"
+READY_TIMEOUT = float(os.getenv("WARMUP_TIMEOUT", "120"))
+# pytest expects the app to be up already, so it gives up sooner
+TEST_TIMEOUT = float(os.getenv("WARMUP_TEST_TIMEOUT", "20"))
+# A ready state older than this is re-checked with a full warm-up
+READY_TTL = float(os.getenv("WARMUP_TTL", "900"))
+CONCURRENCY = int(os.getenv("WARMUP_CONCURRENCY", "8"))
+REQUEST_TIMEOUT = 60
+
+INITIAL_DELAY = 0.25
+MAX_DELAY = 5.0
+BACKOFF_FACTOR = 2
+
+PROBE_PATH = "/login"
+# Dynamic segments ([id]) are filled with this; the page renders its not-found state
+PLACEHOLDER_ID = "00000000-0000-0000-0000-000000000000"
+
+# Server actions that only read, with the arguments to call them with. Actions that
+# write live in the same modules, so calling these loads their code as well.
+READ_ONLY_ACTIONS = {
+    "listEventsAction": [],
+    "getEventAction": [PLACEHOLDER_ID],
+}
+# Client chunks reference an action as createServerReference("<id>", callServer, void 0, findSourceMapURL, "<name>")
+_ACTION_REF_RE = re.compile(
+    r'\("([0-9a-f]{40,})",\s*[\w$.]*callServer\s*,\s*void 0\s*,\s*[\w$.]*findSourceMapURL\s*,\s*"([\w$]+)"\)'
+)
+
+
+class AppNotReady(RuntimeError):
+    """The app did not serve a healthy /login within the timeout"""
+
+
+# ---------------------------------------------------------------------------
+# Readiness
+# ---------------------------------------------------------------------------
+
+def _session(cookies=None):
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=CONCURRENCY)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    for cookie in cookies or []:
+        session.cookies.set(cookie["name"], cookie["value"], domain=cookie["domain"], path=cookie.get("path", "/"))
+    return session
+
+
+def probe(session, base_url, timeout=10):
+    """None when /login renders its form, otherwise why not"""
+    try:
+        response = session.get(f"{base_url}{PROBE_PATH}", timeout=timeout)
+    except requests.RequestException as e:
+        return type(e).__name__
+    if response.status_code != 200:
+        return f"HTTP {response.status_code}"
+    if "__next_error__" in response.text:
+        return "Next.js error page"
+    if 'name="email"' not in response.text:
+        return "login form missing"
+    return None
+
+
+def wait_until_ready(base_url, timeout=READY_TIMEOUT, process=None):
+    """
+    Probe with exponential backoff (0.25s doubling up to 5s) until /login is healthy.
+    Returns (seconds until ready, probes). Raises AppNotReady on timeout or when
+    `process` (the app we started) exits.
+    """
+    session = _session()
+    start = time.monotonic()
+    delay = INITIAL_DELAY
+    probes = 0
+    while True:
+        probes += 1
+        problem = probe(session, base_url)
+        if problem is None:
+            return time.monotonic() - start, probes
+        if process is not None and process.poll() is not None:
+            raise AppNotReady(f"App exited with code {process.returncode} before it was ready ({problem})")
+        remaining = start + timeout - time.monotonic()
+        if remaining <= 0:
+            raise AppNotReady(f"{base_url}{PROBE_PATH} not ready after {timeout:.0f}s and {probes} probes: {problem}")
+        time.sleep(min(delay, remaining))
+        delay = min(delay * BACKOFF_FACTOR, MAX_DELAY)
+
+
+def start_app(command, cwd=REPO_ROOT, log_path="/tmp/nextjs.log"):
+    """Start the app in the background (its own process group) with output going to `log_path`"""
+    log = open(log_path, "ab")
+    return subprocess.Popen(command, cwd=cwd, stdout=log, stderr=subprocess.STDOUT, start_new_session=True)
+
+
+# ---------------------------------------------------------------------------
+# Warm-up
+# ---------------------------------------------------------------------------
+
+def warm_paths():
+    """Every app route (pages and route handlers), dynamic segments filled with PLACEHOLDER_ID"""
+    paths = set()
+    for segments, _ in app_routes():
+        if any(segment.startswith("[...") or segment.startswith("[[...") for segment in segments):
+            continue
+        parts = [PLACEHOLDER_ID if segment.startswith("[") else segment for segment in segments]
+        paths.add("/" + "/".join(parts))
+    return sorted(paths)
+
+
+def server_actions(build_dir=REPO_ROOT / ".next"):
+    """
+    {name: (action id, page path)} for READ_ONLY_ACTIONS found in the production
+    build: ids and names from the client chunks, the page from the server manifest.
+    """
+    found = {}
+    for chunk in (build_dir / "static" / "chunks").rglob("*.js"):
+        try:
+            text = chunk.read_text(encoding="utf-8", errors="ignore")
+        except OSError:
+            continue
+        for action_id, name in _ACTION_REF_RE.findall(text):
+            if name in READ_ONLY_ACTIONS:
+                found[name] = action_id
+    try:
+        manifest = json.loads((build_dir / "server" / "server-reference-manifest.json").read_text())["node"]
+    except (OSError, ValueError, KeyError):
+        manifest = {}
+
+    actions = {}
+    for name, action_id in found.items():
+        page = "/dashboard"
+        for worker in manifest.get(action_id, {}).get("workers", {}):
+            # "app/(app)/dashboard/page" -> "/dashboard"
+            parts = [p for p in worker.split("/")[1:-1] if not (p.startswith("(") and p.endswith(")"))]
+            if not any(p.startswith("[") for p in parts):
+                page = "/" + "/".join(parts)
+                break
+        actions[name] = (action_id, page)
+    return actions
+
+
+def _timed(session, method, url, **kwargs):
+    start = time.perf_counter()
+    try:
+        response = session.request(method, url, timeout=REQUEST_TIMEOUT, allow_redirects=False, **kwargs)
+        error = "Next.js error page" if "__next_error__" in response.text else None
+        status = response.status_code
+    except requests.RequestException as e:
+        status, error = None, type(e).__name__
+    return round((time.perf_counter() - start) * 1000, 1), status, error
+
+
+def _warm_one(session, method, url, **kwargs):
+    cold_ms, status, error = _timed(session, method, url, **kwargs)
+    warm_ms, _, _ = _timed(session, method, url, **kwargs)
+    return {"cold_ms": cold_ms, "warm_ms": warm_ms, "status": status, "error": error}
+
+
+def warm(base_url, cookies=None, concurrency=CONCURRENCY):
+    """Request every route and read-only server action twice, concurrently; returns the latencies"""
+    session = _session(cookies)
+    jobs = {}
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for path in warm_paths():
+            jobs[("route", path)] = pool.submit(_warm_one, session, "GET", f"{base_url}{path}")
+        for name, (action_id, page) in server_actions().items():
+            jobs[("action", name)] = pool.submit(
+                _warm_one, session, "POST", f"{base_url}{page}",
+                data=json.dumps(READ_ONLY_ACTIONS[name]),
+                headers={"Next-Action": action_id, "Accept": "text/x-component",
+                         "Content-Type": "text/plain;charset=UTF-8"},
+            )
+    results = {"routes": {}, "actions": {}}
+    for (kind, key), job in jobs.items():
+        results[f"{kind}s"][key] = job.result()
+    return results
+
+
+def _stored_auth_cookies(base_url):
+    """Cookies of a stored login (auth_state.py), so protected pages render instead of redirecting"""
+    for email, _ in accounts_from_env():
+        state = auth_state.load_state(base_url, email)
+        if state:
+            return state["cookies"]
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Shared ready state
+# ---------------------------------------------------------------------------
+
+@contextlib.contextmanager
+def ready_lock():
+    """Exclusive lock around checking and writing the ready state"""
+    STATE_DIR.mkdir(parents=True, exist_ok=True)
+    with open(LOCK_PATH, "w") as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def load_ready(base_url):
+    """The stored ready state for `base_url` if it is younger than READY_TTL"""
+    try:
+        with open(READY_PATH, encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if state.get("base_url") != base_url or time.time() - state.get("ready_at", 0) > READY_TTL:
+        return None
+    return state
+
+
+def ensure_ready(base_url, timeout=READY_TIMEOUT, process=None, warm_up=ENABLED):
+    """
+    Wait for the app and warm it up once per READY_TTL across all processes.
+    A fresh ready state only costs one probe. Returns the ready state.
+    """
+    base_url = base_url.rstrip("/")
+    with ready_lock():
+        state = load_ready(base_url)
+        if state is not None and probe(_session(), base_url) is None:
+            state["reused"] = True
+            return state
+
+        ready_s, probes = wait_until_ready(base_url, timeout, process)
+        state = {"base_url": base_url, "ready_at": time.time(), "ready_after_s": round(ready_s, 2),
+                 "probes": probes, "warmed": False}
+        if warm_up:
+            started = time.perf_counter()
+            cookies = _stored_auth_cookies(base_url)
+            results = warm(base_url, cookies)
+            state.update(warmed=True, warm_seconds=round(time.perf_counter() - started, 2),
+                         signed_in=cookies is not None)
+            write_json(REPORT_PATH, {**state, **results}, indent=2)
+            state["results"] = results
+        write_json(READY_PATH, {k: v for k, v in state.items() if k != "results"}, indent=2)
+        state["reused"] = False
+        return state
+
+
+def print_summary(state):
+    if state.get("reused"):
+        print(f"✅ App ready (warmed {time.time() - state['ready_at']:.0f}s ago by another process)")
+        return
+    print(f"✅ App ready after {state['ready_after_s']}s ({state['probes']} probes)")
+    results = state.get("results")
+    if not results:
+        return
+    print(f"🔥 Warmed {len(results['routes'])} routes and {len(results['actions'])} server actions "
+          f"in {state['warm_seconds']}s ({'signed in' if state['signed_in'] else 'signed out'}):")
+    for kind in ("routes", "actions"):
+        for key, entry in sorted(results[kind].items(), key=lambda kv: kv[1]["cold_ms"], reverse=True):
+            flag = f"  ⚠️ {entry['error']}" if entry["error"] else ""
+            print(f"   {key:<52} cold {entry['cold_ms']:>8.0f}ms  warm {entry['warm_ms']:>7.0f}ms  "
+                  f"{entry['status']}{flag}")
+
+
+def _log_tail(log_path, lines=100):
+    try:
+        with open(log_path, encoding="utf-8", errors="replace") as f:
+            return "".join(f.readlines()[-lines:])
+    except OSError:
+        return ""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Wait for the app and warm up its routes")
+    parser.add_argument("--base-url", default=os.getenv("BASE_URL", "http://localhost:3000"))
+    parser.add_argument("--timeout", type=float, default=READY_TIMEOUT)
+    commands = parser.add_subparsers(dest="command", required=True)
+    start = commands.add_parser("start", help="Start the app, then wait and warm up")
+    start.add_argument("--cwd", default=str(REPO_ROOT))
+    start.add_argument("--log", default="/tmp/nextjs.log")
+    start.add_argument("app_command", nargs=argparse.REMAINDER, help="-- npm run start")
+    commands.add_parser("wait", help="Wait for a running app and warm up")
+    commands.add_parser("status", help="Show the stored ready state")
+    args = parser.parse_args()
+    base_url = args.base_url.rstrip("/")
+
+    if args.command == "status":
+        state = load_ready(base_url)
+        print(json.dumps(state, indent=2) if state else f"❌ No fresh ready state for {base_url}")
+        sys.exit(0 if state else 1)
+
+    process = None
+    if args.command == "start":
+        # Only the leading separator belongs to us: `-- npm run start -- -p 3001` keeps npm's own `--`
+        app_command = args.app_command[1:] if args.app_command[:1] == ["--"] else args.app_command
+        app_command = app_command or ["npm", "run", "start"]
+        process = start_app(app_command, args.cwd, args.log)
+        print(f"🚀 Started {' '.join(app_command)} (pid {process.pid}, log {args.log})")
+        # A state from an earlier app process says nothing about this one
+        READY_PATH.unlink(missing_ok=True)
+    try:
+        state = ensure_ready(base_url, args.timeout, process)
+    except AppNotReady as e:
+        print(f"❌ {e}")
+        if process is not None:
+            print(f"Last lines of {args.log}:\n{_log_tail(args.log)}")
+        sys.exit(1)
+    print_summary(state)
+    failing = [key for kind in ("routes", "actions") for key, entry in state.get("results", {}).get(kind, {}).items()
+               if entry["error"]]
+    if failing:
+        print(f"⚠️ Errors while warming: {', '.join(failing)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,318 @@
+"""
+Failure artifacts written off the test thread
+When a browser test fails, grabs a screenshot, the live DOM, the browser
+console and - from the DevTools timings - a HAR of the test's network traffic,
+and hands them to a background writer. Text artifacts are gzipped, every
+capture gets its own directory under reports/artifacts/ (worker + test + random
+suffix, so parallel workers never overwrite each other) and the oldest captures
+are evicted once the directory passes ARTIFACT_QUOTA_MB.
+
+The failing test only pays for the WebDriver reads; compression and disk writes
+happen on the writer thread. When the bounded queue is full, artifacts are
+dropped (and counted) rather than stalling the suite.
+"""
+import gzip
+import json
+import os
+import queue
+import re
+import shutil
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import urlparse, parse_qsl
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+try:
+    from pytest_html import extras as html_extras
+except ImportError:  # report links are skipped without pytest-html
+    html_extras = None
+
+
+ENABLED = os.getenv("CAPTURE_ON_FAILURE", "true").lower() == "true"
+ARTIFACTS_DIR = Path(__file__).parent / "reports" / "artifacts"
+QUOTA_BYTES = int(float(os.getenv("ARTIFACT_QUOTA_MB", "200")) * 1024 * 1024)
+QUEUE_SIZE = int(os.getenv("ARTIFACT_QUEUE_SIZE", "32"))
+
+# Seconds the session waits at the end for queued artifacts
+FLUSH_TIMEOUT = 30
+
+# Console entries older than this many seconds before the failure are left out
+CONSOLE_WINDOW = 120
+
+_capture_key = pytest.StashKey()
+
+# One outerHTML read instead of page_source, plus what the report needs to label the capture
+_DOM_JS = """
+return {
+  html: '<!DOCTYPE html>\\n' + document.documentElement.outerHTML,
+  url: location.href,
+  title: document.title,
+  viewport: [window.innerWidth, window.innerHeight],
+  scroll: [window.scrollX, window.scrollY],
+};
+"""
+
+
+# ---------------------------------------------------------------------------
+# Background writer
+# ---------------------------------------------------------------------------
+
+class ArtifactWriter:
+    """
+    Writes artifacts from a daemon thread. `submit` never blocks: a full queue
+    drops the artifact. Each capture directory counts against the quota as a
+    whole; the oldest directories go first, the newest is always kept.
+    """
+
+    def __init__(self, root=ARTIFACTS_DIR, quota_bytes=QUOTA_BYTES, queue_size=QUEUE_SIZE):
+        self.root = Path(root)
+        self.quota_bytes = quota_bytes
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = None
+        self._lock = threading.Lock()
+        self.written = 0
+        self.bytes_written = 0
+        self.dropped = 0
+        self.evicted = 0
+
+    def submit(self, directory, name, data, compress=False):
+        """Queue `data` (str or bytes) for directory/name; False when it had to be dropped"""
+        self._start()
+        try:
+            self._queue.put_nowait((Path(directory), name, data, compress))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            print(f"⚠️ Artifact queue full - dropped {Path(directory).name}/{name}")
+            return False
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="artifact-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            try:
+                self._write(*job)
+            except OSError as e:
+                print(f"⚠️ Could not write artifact {job[0].name}/{job[1]}: {e}")
+
+    def _write(self, directory, name, data, compress):
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        if compress:
+            data = gzip.compress(data, compresslevel=6)
+            name += ".gz"
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / name
+        tmp_path = directory / f".{name}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        self.written += 1
+        self.bytes_written += len(data)
+        self._enforce_quota(keep=directory)
+
+    def _enforce_quota(self, keep):
+        """Delete the oldest capture directories until the total fits the quota"""
+        captures = []
+        total = 0
+        for entry in os.scandir(self.root):
+            if not entry.is_dir():
+                continue
+            size = sum(f.stat().st_size for f in os.scandir(entry.path) if f.is_file())
+            captures.append((entry.stat().st_mtime, entry.path, size))
+            total += size
+        if total <= self.quota_bytes:
+            return
+        for _, path, size in sorted(captures):
+            if total <= self.quota_bytes:
+                break
+            if Path(path) == keep:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+            self.evicted += 1
+
+    def close(self, timeout=FLUSH_TIMEOUT):
+        """Write what is queued (up to `timeout` seconds) and stop the thread"""
+        if self._thread is None:
+            return True
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                self._queue.put(None, timeout=max(deadline - time.monotonic(), 0.01))
+                break
+            except queue.Full:
+                if time.monotonic() >= deadline:
+                    return False
+        self._thread.join(max(deadline - time.monotonic(), 0))
+        alive = self._thread.is_alive()
+        self._thread = None
+        return not alive
+
+
+WRITER = ArtifactWriter()
+
+
+# ---------------------------------------------------------------------------
+# Capture
+# ---------------------------------------------------------------------------
+
+def capture_name(label):
+    """Unique directory name: worker, test label and a random suffix"""
+    worker = os.getenv("PYTEST_XDIST_WORKER", "master")
+    slug = re.sub(r"[^A-Za-z0-9_.-]+", "-", label).strip("-")[:80]
+    return f"{worker}-{slug}-{uuid.uuid4().hex[:8]}"
+
+
+def captured_directory(item):
+    """Capture directory of a failed test, or None"""
+    state = item.stash.get(_capture_key, None)
+    return state["directory"] if state else None
+
+
+def configure_options(options):
+    """Enable the browser console log on driver options, next to any other log types"""
+    if not ENABLED:
+        return
+    prefs = dict(options.capabilities.get("goog:loggingPrefs", {}))
+    prefs["browser"] = "ALL"
+    options.set_capability("goog:loggingPrefs", prefs)
+
+
+def capture(driver, label, since=None):
+    """
+    Read screenshot, DOM and console from `driver` and queue them for writing.
+    `since` (epoch seconds) limits the console log to this test.
+    Returns the capture directory (it appears once the writer gets to it).
+    """
+    directory = ARTIFACTS_DIR / capture_name(label)
+    meta = {"label": label, "captured_at": time.time(), "worker": os.getenv("PYTEST_XDIST_WORKER", "master")}
+
+    try:
+        WRITER.submit(directory, "screenshot.png", driver.get_screenshot_as_png())
+    except WebDriverException as e:
+        meta["screenshot_error"] = str(e).splitlines()[0]
+
+    try:
+        dom = driver.execute_script(_DOM_JS)
+        meta.update(url=dom["url"], title=dom["title"], viewport=dom["viewport"], scroll=dom["scroll"])
+        WRITER.submit(directory, "dom.html", dom["html"], compress=True)
+    except WebDriverException as e:
+        meta["dom_error"] = str(e).splitlines()[0]
+
+    try:
+        cutoff = (since if since is not None else time.time() - CONSOLE_WINDOW) * 1000
+        entries = [e for e in driver.get_log("browser") if e.get("timestamp", 0) >= cutoff]
+        meta["console_errors"] = sum(1 for e in entries if e.get("level") == "SEVERE")
+        WRITER.submit(directory, "console.json", json.dumps(entries, indent=1), compress=True)
+    except WebDriverException as e:
+        meta["console_error"] = str(e).splitlines()[0]
+
+    WRITER.submit(directory, "meta.json", json.dumps(meta, indent=2))
+    return directory
+
+
+def har(requests, title=""):
+    """HAR 1.2 document from devtools_timing request records"""
+    entries = []
+    for r in requests:
+        url = urlparse(r["url"])
+        started = datetime.fromtimestamp(r.get("wall_time") or 0, tz=timezone.utc)
+        total = r.get("duration_ms") or 0
+        wait = r.get("ttfb_ms") or 0
+        entries.append({
+            "startedDateTime": started.isoformat().replace("+00:00", "Z"),
+            "time": total,
+            "request": {
+                "method": r["method"], "url": r["url"], "httpVersion": "HTTP/1.1",
+                "headers": [], "cookies": [],
+                "queryString": [{"name": k, "value": v} for k, v in parse_qsl(url.query)],
+                "headersSize": -1, "bodySize": -1,
+            },
+            "response": {
+                "status": r.get("status") or 0, "statusText": r.get("error") or "", "httpVersion": "HTTP/1.1",
+                "headers": [], "cookies": [],
+                "content": {"size": r.get("bytes") or 0, "mimeType": r.get("type") or ""},
+                "redirectURL": "", "headersSize": -1, "bodySize": r.get("bytes") or -1,
+            },
+            "cache": {},
+            "timings": {"send": 0, "wait": wait, "receive": max(total - wait, 0)},
+            "_serverAction": r.get("server_action", False),
+        })
+    return {"log": {
+        "version": "1.2",
+        "creator": {"name": "qa-testing devtools_timing", "version": "1"},
+        "pages": [],
+        "entries": entries,
+        "comment": title,
+    }}
+
+
+# ---------------------------------------------------------------------------
+# pytest plugin
+# ---------------------------------------------------------------------------
+
+def pytest_runtest_setup(item):
+    item.stash[_capture_key] = {"since": time.time(), "directory": None}
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    Capture the browser when setup or the test fails (fixtures are still up),
+    then add the network HAR at teardown once devtools_timing has collected it.
+    """
+    outcome = yield
+    report = outcome.get_result()
+    state = item.stash.get(_capture_key, None)
+    if not ENABLED or state is None:
+        return
+
+    if report.when in ("setup", "call") and report.failed and state["directory"] is None:
+        driver = item.funcargs.get("driver")
+        if driver is None:
+            return
+        directory = capture(driver, item.nodeid, since=state["since"])
+        state["directory"] = directory
+        report.sections.append(("artifacts", str(directory)))
+        if html_extras is not None:
+            # report.html sits in reports/, next to artifacts/
+            base = f"{ARTIFACTS_DIR.name}/{directory.name}"
+            report.extras = getattr(report, "extras", []) + [
+                html_extras.url(f"{base}/screenshot.png", name="Screenshot"),
+                html_extras.url(f"{base}/dom.html.gz", name="DOM"),
+                html_extras.url(f"{base}/console.json.gz", name="Console"),
+            ]
+        return
+
+    if report.when == "teardown" and state["directory"] is not None:
+        from devtools_timing import timing_key
+        timing = item.stash.get(timing_key, None)
+        if timing is not None:
+            WRITER.submit(state["directory"], "network.har", json.dumps(har(timing["requests"], item.nodeid)),
+                          compress=True)
+
+
+def pytest_sessionfinish(session):
+    if not WRITER.close():
+        print(f"⚠️ Artifact writer did not finish within {FLUSH_TIMEOUT}s - some artifacts may be missing")
+
+
+def pytest_terminal_summary(terminalreporter):
+    if WRITER.written or WRITER.dropped:
+        terminalreporter.write_line(
+            f"📸 Failure artifacts: {WRITER.written} files ({WRITER.bytes_written / 1024:.0f} KB) in "
+            f"{ARTIFACTS_DIR}, {WRITER.dropped} dropped, {WRITER.evicted} evicted over the quota"
+        )
@@ -0,0 +1,198 @@
+"""
+Reusable authentication state for the Selenium suites
+Captures the Supabase auth cookies and localStorage after a successful UI login,
+stores them in .auth/ with an expiry, and injects them into later Chrome sessions
+through the DevTools protocol so they can skip the /login page entirely.
+"""
+import base64
+import contextlib
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+from helpers import write_json
+
+try:
+    import fcntl
+except ImportError:  # Windows - fall back to unlocked access
+    fcntl = None
+
+
+STATE_DIR = Path(__file__).parent / ".auth"
+
+# Default lifetime when the session expiry cannot be read from the auth cookie
+DEFAULT_TTL = int(os.getenv("AUTH_STATE_TTL", "1800"))
+
+# Stop reusing a snapshot this long before its access token expires. Reusing an
+# expired token makes the server refresh it, which rotates the refresh token and
+# would invalidate the snapshot for every other worker.
+EXPIRY_MARGIN = 300
+
+# Fields accepted by Network.setCookies (Network.getAllCookies returns extras)
+_COOKIE_FIELDS = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expires")
+
+
+def state_path(base_url, email):
+    """One state file per app origin and account"""
+    key = hashlib.sha1(f"{base_url}|{email}".encode()).hexdigest()[:16]
+    return STATE_DIR / f"{key}.json"
+
+
+@contextlib.contextmanager
+def state_lock(base_url, email):
+    """
+    Exclusive lock around login for one account, so when several workers start at
+    once only the first drives the UI login and the rest reuse its snapshot.
+    """
+    STATE_DIR.mkdir(parents=True, exist_ok=True)
+    lock_path = state_path(base_url, email).with_suffix(".lock")
+    with open(lock_path, "w") as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _session_expiry(cookies):
+    """
+    Read `expires_at` from the Supabase session cookie (sb-<ref>-auth-token).
+    @supabase/ssr stores it as JSON or "base64-<b64url json>", chunked into
+    .0/.1/... cookies when large. Returns None if it cannot be parsed.
+    """
+    chunks = {}
+    for cookie in cookies:
+        name = cookie["name"]
+        if not (name.startswith("sb-") and "-auth-token" in name):
+            continue
+        _, _, suffix = name.partition("-auth-token")
+        index = int(suffix[1:]) if suffix.startswith(".") and suffix[1:].isdigit() else 0
+        chunks[index] = cookie["value"]
+    if not chunks:
+        return None
+
+    raw = "".join(chunks[i] for i in sorted(chunks))
+    try:
+        if raw.startswith("base64-"):
+            payload = raw[len("base64-"):]
+            raw = base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)).decode()
+        session = json.loads(raw)
+        return float(session["expires_at"])
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+# @supabase/ssr splits cookie values longer than this into .0/.1/... chunks
+_COOKIE_CHUNK_SIZE = 3180
+
+
+def session_cookies(supabase_url, session):
+    """
+    Build the auth cookies @supabase/ssr would set for a GoTrue `session`
+    (the JSON returned by /auth/v1/token), as {name: value}. Lets HTTP clients
+    act as a signed-in user without going through the login page.
+    """
+    ref = urlparse(supabase_url).hostname.split(".")[0]
+    name = f"sb-{ref}-auth-token"
+    encoded = base64.urlsafe_b64encode(json.dumps(session, separators=(",", ":")).encode()).decode().rstrip("=")
+    value = f"base64-{encoded}"
+    if len(value) <= _COOKIE_CHUNK_SIZE:
+        return {name: value}
+    return {
+        f"{name}.{i}": value[start:start + _COOKIE_CHUNK_SIZE]
+        for i, start in enumerate(range(0, len(value), _COOKIE_CHUNK_SIZE))
+    }
+
+
+def capture_state(driver, base_url):
+    """Snapshot cookies (including httpOnly) and localStorage for the app origin"""
+    cookies = driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+    host = urlparse(base_url).hostname
+    cookies = [c for c in cookies if c["domain"].lstrip(".") == host]
+    local_storage = driver.execute_script(
+        "const out = {};"
+        "for (let i = 0; i < localStorage.length; i++) {"
+        "  const k = localStorage.key(i); out[k] = localStorage.getItem(k);"
+        "}"
+        "return out;"
+    )
+
+    now = time.time()
+    session_expiry = _session_expiry(cookies)
+    expires_at = session_expiry - EXPIRY_MARGIN if session_expiry else now + DEFAULT_TTL
+
+    return {
+        "base_url": base_url,
+        "captured_at": now,
+        "expires_at": expires_at,
+        "cookies": cookies,
+        "local_storage": local_storage,
+    }
+
+
+def save_state(driver, base_url, email):
+    """Capture the current browser state and write it atomically"""
+    state = capture_state(driver, base_url)
+    write_json(state_path(base_url, email), state)
+    return state
+
+
+def load_state(base_url, email):
+    """Return the stored state, or None if it is missing or expired"""
+    path = state_path(base_url, email)
+    try:
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if state.get("expires_at", 0) <= time.time():
+        return None
+    return state
+
+
+def clear_state(base_url, email):
+    """Drop the stored state, e.g. after a test signed the account out"""
+    with contextlib.suppress(FileNotFoundError):
+        state_path(base_url, email).unlink()
+
+
+def inject_state(driver, state):
+    """
+    Load a snapshot into the browser without visiting any page.
+    Cookies go through Network.setCookies and localStorage through DOMStorage,
+    both of which work before the origin has a document.
+    """
+    cookies = []
+    for cookie in state["cookies"]:
+        param = {k: cookie[k] for k in _COOKIE_FIELDS if k in cookie}
+        if cookie.get("session") or param.get("expires", -1) < 0:
+            param.pop("expires", None)
+        cookies.append(param)
+
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+
+    if state.get("local_storage"):
+        parsed = urlparse(state["base_url"])
+        storage_id = {"securityOrigin": f"{parsed.scheme}://{parsed.netloc}", "isLocalStorage": True}
+        driver.execute_cdp_cmd("DOMStorage.enable", {})
+        for key, value in state["local_storage"].items():
+            driver.execute_cdp_cmd("DOMStorage.setDOMStorageItem", {
+                "storageId": storage_id,
+                "key": key,
+                "value": value,
+            })
+
+
+def restore_state(driver, base_url, email):
+    """Inject the stored state if there is a fresh one. Returns True when injected."""
+    state = load_state(base_url, email)
+    if state is None:
+        return False
+    inject_state(driver, state)
+    return True
@@ -0,0 +1,201 @@
+"""
+Fixtures for the backend benchmarks
+Seeds one user per dataset size, times search plans against the Supabase REST API
+and compares every result with the committed baseline.json.
+No browser or running app is needed.
+"""
+import json
+import os
+import statistics
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from dataset import seeder_events
+from helpers import git_commit
+from local_supabase import DEFAULT_PORT, anon_key, ensure_running
+from search_plans import CountingRest
+from seeding import SupabaseSeeder, supabase_config
+
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+HISTORY_PATH = Path(__file__).parent.parent / "reports" / "benchmark-history.jsonl"
+
+BENCHMARK_PASSWORD = os.getenv("BENCHMARK_PASSWORD", "benchmark-password-123")
+
+_results = {}
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("search benchmarks")
+    group.addoption("--save-baseline", action="store_true",
+                    help="Write this run's numbers to benchmarks/baseline.json")
+    group.addoption("--fail-on-slowdown", action="store_true",
+                    help="Fail when a median is slower than the baseline by more than --baseline-tolerance")
+    group.addoption("--baseline-tolerance", type=float, default=0.25,
+                    help="Allowed relative slowdown against the baseline (default: 0.25)")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def verify_app_running():
+    """Benchmarks talk to the backend directly - overrides the app check in ../conftest.py"""
+
+
+@pytest.fixture(scope="session")
+def bench_backend():
+    """
+    (supabase_url, anon_key) to benchmark against. Defaults to the local stand-in
+    (booted if needed); BENCHMARK_BACKEND=remote uses SUPABASE_URL instead, where
+    the bench-<size>@example.com accounts must already exist.
+    """
+    if os.getenv("BENCHMARK_BACKEND", "local") == "remote":
+        url, key = supabase_config()
+        if not url:
+            pytest.skip("BENCHMARK_BACKEND=remote needs SUPABASE_URL / SUPABASE_ANON_KEY")
+        yield url, key
+        return
+    port = int(os.getenv("LOCAL_SUPABASE_PORT", DEFAULT_PORT))
+    server = ensure_running(port)
+    yield f"http://127.0.0.1:{port}", anon_key()
+    if server is not None:
+        server.stop()
+
+
+def _existing_count(seeder):
+    response = seeder.http.get(
+        f"{seeder.supabase_url}/rest/v1/events",
+        params={"select": "id", "name": f"like.{seeder.namespace}*", "limit": 1},
+        headers={"Prefer": "count=exact"},
+        timeout=60,
+    )
+    response.raise_for_status()
+    return int(response.headers.get("Content-Range", "*/0").split("/")[-1])
+
+
+@pytest.fixture(scope="session")
+def dataset(bench_backend):
+    """
+    dataset(size) -> {"user_id", "rest", "size"} for a user owning exactly `size`
+    events. Data is generated deterministically and reused when the backend
+    already holds it.
+    """
+    url, key = bench_backend
+    cache = {}
+
+    def _get(size):
+        if size in cache:
+            return cache[size]
+        email = f"bench-{size}@example.com"
+        if url.startswith("http://127.0.0.1"):
+            ensure_running(int(url.rsplit(":", 1)[1]), [(email, BENCHMARK_PASSWORD)])
+        seeder = SupabaseSeeder.sign_in(email, BENCHMARK_PASSWORD, url, key, namespace=f"bench-{size}")
+        if _existing_count(seeder) != size:
+            seeder.teardown()
+            started = time.perf_counter()
+            seeder.bulk_insert_events(seeder_events(size, seed=size))
+            print(f"\n🌱 Seeded {size} events in {time.perf_counter() - started:.1f}s")
+        cache[size] = {
+            "user_id": seeder.user_id,
+            "rest": CountingRest(url, key, seeder.access_token),
+            "size": size,
+        }
+        return cache[size]
+
+    return _get
+
+
+@pytest.fixture(scope="session")
+def baseline():
+    try:
+        with open(BASELINE_PATH, encoding="utf-8") as f:
+            return json.load(f).get("results", {})
+    except (OSError, ValueError):
+        return {}
+
+
+@pytest.fixture
+def bench(request, baseline):
+    """
+    bench(name, fn, rounds) runs `fn` once to warm up and `rounds` more times.
+    `fn` returns (rows, seconds, queries, max_url_bytes). Records the stats and
+    checks them against the baseline:
+    - more backend queries per request than the baseline always fails
+    - a slower median fails only with --fail-on-slowdown
+    """
+    config = request.config
+
+    def _run(name, fn, rounds=5):
+        fn()
+        timings, queries, url_bytes, rows = [], set(), 0, 0
+        for _ in range(rounds):
+            result_rows, seconds, query_count, max_url = fn()
+            timings.append(seconds)
+            queries.add(query_count)
+            url_bytes = max(url_bytes, max_url)
+            rows = len(result_rows)
+        timings.sort()
+        stats = {
+            "rounds": rounds,
+            "min_ms": round(timings[0] * 1000, 3),
+            "median_ms": round(statistics.median(timings) * 1000, 3),
+            "max_ms": round(timings[-1] * 1000, 3),
+            "queries": max(queries),
+            "max_url_bytes": url_bytes,
+            "rows": rows,
+        }
+        _results[name] = stats
+
+        previous = baseline.get(name)
+        if previous:
+            if stats["queries"] > previous["queries"]:
+                pytest.fail(f"{name}: {stats['queries']} backend queries per search, baseline {previous['queries']}")
+            limit = previous["median_ms"] * (1 + config.getoption("baseline_tolerance"))
+            if stats["median_ms"] > limit:
+                message = f"{name}: median {stats['median_ms']}ms vs baseline {previous['median_ms']}ms"
+                if config.getoption("fail_on_slowdown"):
+                    pytest.fail(message)
+                print(f"\n⚠️ {message}")
+        return stats
+
+    return _run
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Print the benchmark table, append to the history file and optionally save the baseline"""
+    if not _results:
+        return
+    terminalreporter.write_sep("-", "search benchmarks")
+    terminalreporter.write_line(
+        f"{'benchmark':<32}{'median ms':>11}{'min ms':>10}{'queries':>9}{'url bytes':>11}{'rows':>8}"
+    )
+    for name, stats in sorted(_results.items()):
+        terminalreporter.write_line(
+            f"{name:<32}{stats['median_ms']:>11}{stats['min_ms']:>10}{stats['queries']:>9}"
+            f"{stats['max_url_bytes']:>11}{stats['rows']:>8}"
+        )
+
+    entry = {
+        "commit": git_commit(),
+        "recorded_at": datetime.now(timezone.utc).isoformat(),
+        "backend": os.getenv("BENCHMARK_BACKEND", "local"),
+        "results": _results,
+    }
+    HISTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(HISTORY_PATH, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry) + "\n")
+
+    if config.getoption("save_baseline"):
+        merged = {}
+        try:
+            with open(BASELINE_PATH, encoding="utf-8") as f:
+                merged = json.load(f).get("results", {})
+        except (OSError, ValueError):
+            pass
+        merged.update(_results)
+        entry["results"] = dict(sorted(merged.items()))
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(entry, f, indent=2)
+            f.write("\n")
+        terminalreporter.write_line(f"Baseline saved to {BASELINE_PATH}")
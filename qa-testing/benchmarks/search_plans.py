@@ -0,0 +1,116 @@
+"""
+Dashboard search query plans, replayed over the Supabase REST API
+`fanout` reproduces the requests listEventsAction (src/lib/actions/events.ts)
+sends for a search; `fts_name` is the single-query candidate that would use the
+idx_events_name GIN index. Keep `fanout` in step with events.ts.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+
+# Same select as listEventsAction (supabase-js strips the whitespace)
+EVENT_SELECT = "id,name,sport,starts_at,description,location,created_at,event_venues(venue:venues(id,name))"
+
+# Typical gateway limit on the request line; longer `in.(...)` filters fail on hosted Supabase
+GATEWAY_URL_LIMIT = 16 * 1024
+
+NO_MATCH_ID = "00000000-0000-0000-0000-000000000000"
+
+
+class CountingRest:
+    """
+    Thin PostgREST client that counts every request (one request = one SQL
+    statement) and remembers the longest URL it sent.
+    """
+
+    def __init__(self, supabase_url, anon_key, access_token):
+        self.base = f"{supabase_url.rstrip('/')}/rest/v1"
+        self.http = requests.Session()
+        self.http.headers.update({"apikey": anon_key, "Authorization": f"Bearer {access_token}"})
+        self._lock = threading.Lock()
+        self.queries = 0
+        self.max_url_bytes = 0
+
+    def get(self, table, params):
+        request = self.http.prepare_request(requests.Request("GET", f"{self.base}/{table}", params=params))
+        with self._lock:
+            self.queries += 1
+            self.max_url_bytes = max(self.max_url_bytes, len(request.url))
+        response = self.http.send(request, timeout=120)
+        response.raise_for_status()
+        return response.json()
+
+    def reset(self):
+        with self._lock:
+            self.queries = 0
+            self.max_url_bytes = 0
+
+
+def escape_ilike(term):
+    """The escaping listEventsAction applies before building %term%"""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def fanout_search(rest, user_id, term, pool):
+    """
+    Current plan: five parallel ilike lookups (name, sport, description, location,
+    venue name), an event_venues lookup for matching venues, then the event
+    select filtered with in('id', ...).
+    """
+    pattern = f"ilike.%{escape_ilike(term.strip())}%"
+    owner = f"eq.{user_id}"
+    lookups = [
+        ("events", {"select": "id", "user_id": owner, "name": pattern}),
+        ("events", {"select": "id", "user_id": owner, "sport": pattern}),
+        ("events", {"select": "id", "user_id": owner, "description": pattern}),
+        ("events", {"select": "id", "user_id": owner, "location": pattern}),
+        ("venues", {"select": "id", "name": pattern}),
+    ]
+    *event_matches, venue_matches = pool.map(lambda args: rest.get(*args), lookups)
+
+    matching_ids = {row["id"] for rows in event_matches for row in rows}
+    venue_ids = [row["id"] for row in venue_matches]
+    if venue_ids:
+        links = rest.get("event_venues", {"select": "event_id", "venue_id": f"in.({','.join(venue_ids)})"})
+        matching_ids.update(link["event_id"] for link in links)
+
+    id_filter = f"in.({','.join(matching_ids)})" if matching_ids else f"eq.{NO_MATCH_ID}"
+    return rest.get("events", {
+        "select": EVENT_SELECT,
+        "user_id": owner,
+        "id": id_filter,
+        "order": "starts_at.asc",
+    })
+
+
+def fts_name_search(rest, user_id, term, pool):
+    """
+    Candidate plan: one select with websearch_to_tsquery on events.name, which
+    Postgres can answer from idx_events_name. Matches whole words in the name
+    only - the benchmark quantifies the cost side, not result parity.
+    """
+    return rest.get("events", {
+        "select": EVENT_SELECT,
+        "user_id": f"eq.{user_id}",
+        "name": f"wfts(english).{term.strip()}",
+        "order": "starts_at.asc",
+    })
+
+
+PLANS = {
+    "fanout": fanout_search,
+    "fts_name": fts_name_search,
+}
+
+
+def run_plan(plan, rest, user_id, term):
+    """Run one search and return (rows, seconds, queries, max_url_bytes)"""
+    rest.reset()
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        start = time.perf_counter()
+        rows = PLANS[plan](rest, user_id, term, pool)
+        elapsed = time.perf_counter() - start
+    return rows, elapsed, rest.queries, rest.max_url_bytes
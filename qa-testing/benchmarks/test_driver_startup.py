@@ -0,0 +1,101 @@
+"""
+Cold browser startup benchmark
+Time from "no browser" to the first completed driver.get(), resolving the
+driver the old way (webdriver-manager install() on every session) and through
+the driver_resolver manifest. Target: under one second with the manifest.
+
+Run:
+    pytest benchmarks/test_driver_startup.py -s
+    STARTUP_ROUNDS=10 pytest benchmarks/test_driver_startup.py -s
+"""
+import json
+import os
+import statistics
+import time
+from pathlib import Path
+
+import pytest
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+import driver_resolver
+
+
+ROUNDS = int(os.getenv("STARTUP_ROUNDS", "5"))
+TARGET_SECONDS = 1.0
+RESULTS_PATH = Path(__file__).parent.parent / "reports" / "driver-startup.json"
+
+_medians = {}
+
+
+def _webdriver_manager():
+    """Resolution as the driver fixture did it before the manifest"""
+    return driver_resolver._download()
+
+
+STRATEGIES = {
+    "webdriver-manager": _webdriver_manager,
+    "manifest": driver_resolver.resolve,
+}
+
+
+def _options():
+    options = Options()
+    options.add_argument("--headless")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    for flag in driver_resolver.FAST_START_ARGS:
+        options.add_argument(flag)
+    chrome = driver_resolver.find_chrome()
+    if chrome:
+        options.binary_location = chrome
+    return options
+
+
+def _cold_session(resolve_driver):
+    """Seconds from resolving the driver to the end of the first navigation"""
+    started = time.perf_counter()
+    driver = webdriver.Chrome(service=Service(resolve_driver()), options=_options())
+    try:
+        driver.get("about:blank")
+        return time.perf_counter() - started
+    finally:
+        driver.quit()
+
+
+@pytest.mark.benchmark
+class TestDriverStartup:
+    """Cold-session startup by driver resolution strategy"""
+
+    @pytest.mark.parametrize("strategy", list(STRATEGIES))
+    def test_cold_start(self, strategy):
+        """Start and quit a browser ROUNDS times and compare the median with the target"""
+        if driver_resolver.find_chrome() is None:
+            pytest.skip("Chrome is not installed")
+        resolve_driver = STRATEGIES[strategy]
+        try:
+            # Untimed: fills the manifest / webdriver-manager cache like any earlier run would
+            resolve_driver()
+        except Exception as e:
+            pytest.skip(f"{strategy} cannot resolve a driver here: {e}")
+
+        timings = sorted(_cold_session(resolve_driver) for _ in range(ROUNDS))
+        median = statistics.median(timings)
+        _medians[strategy] = round(median, 3)
+        print(f"\n⏱️ {strategy}: median {median * 1000:.0f}ms "
+              f"(min {timings[0] * 1000:.0f}ms, max {timings[-1] * 1000:.0f}ms, {ROUNDS} rounds)")
+
+        RESULTS_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(RESULTS_PATH, "w", encoding="utf-8") as f:
+            json.dump({"rounds": ROUNDS, "median_seconds": _medians}, f, indent=2)
+
+        if strategy == "manifest":
+            before = _medians.get("webdriver-manager")
+            if before:
+                print(f"  {before * 1000:.0f}ms -> {median * 1000:.0f}ms "
+                      f"({(before - median) * 1000:.0f}ms saved per cold session)")
+            assert median < TARGET_SECONDS, (
+                f"cold start took {median:.2f}s, target {TARGET_SECONDS:.0f}s"
+            )
@@ -0,0 +1,54 @@
+"""
+Search fan-out benchmarks
+Latency and backend query count of the dashboard search per dataset size,
+for the current listEventsAction plan and the full-text candidate.
+
+Run:
+    pytest benchmarks/                          # compare with baseline.json
+    pytest benchmarks/ --save-baseline          # record a new baseline
+    BENCHMARK_SIZES=10,1000 pytest benchmarks/  # quick run
+"""
+import os
+
+import pytest
+
+from search_plans import GATEWAY_URL_LIMIT, PLANS, run_plan
+
+
+SIZES = [int(s) for s in os.getenv("BENCHMARK_SIZES", "10,1000,10000,100000").split(",")]
+
+# A word dataset.py builds event names from (see dataset.NAME_WORDS)
+SEARCH_TERM = "tournament"
+
+# Fewer rounds where a single search takes seconds
+ROUNDS = {10: 20, 1000: 10, 10000: 5, 100000: 3}
+
+
+@pytest.mark.benchmark
+class TestSearchFanout:
+    """Dashboard search cost by dataset size"""
+
+    @pytest.mark.parametrize("size", SIZES, ids=lambda s: f"{s}-events")
+    @pytest.mark.parametrize("plan", list(PLANS))
+    def test_search(self, plan, size, dataset, bench):
+        """Time one search and record its query count"""
+        data = dataset(size)
+        stats = bench(
+            f"search[{plan}-{size}]",
+            lambda: run_plan(plan, data["rest"], data["user_id"], SEARCH_TERM),
+            rounds=ROUNDS.get(size, 5),
+        )
+
+        if plan == "fanout":
+            # 5 ilike lookups + event_venues lookup (only when a venue matched) + final select
+            assert stats["queries"] in (6, 7)
+        else:
+            assert stats["queries"] == 1
+        if size >= 1000:
+            assert stats["rows"] > 0, f"'{SEARCH_TERM}' should match seeded events"
+
+        print(f"\n✓ {plan} @ {size}: median {stats['median_ms']}ms, {stats['queries']} queries, "
+              f"{stats['rows']} rows, longest URL {stats['max_url_bytes']} bytes")
+        if stats["max_url_bytes"] > GATEWAY_URL_LIMIT:
+            print(f"⚠️ longest request line exceeds {GATEWAY_URL_LIMIT} bytes - "
+                  "a hosted gateway would reject this search")
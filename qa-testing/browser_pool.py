@@ -0,0 +1,128 @@
+"""
+Pool of warm Chrome sessions shared by the tests of one pytest process
+Every test leases a browser whose context has been reset in a few milliseconds:
+extra tabs closed, the tab parked on about:blank, cookies and storage cleared for
+the app origins and the window size restored. Chrome itself is only restarted
+when a session has died, so no test pays for a driver start or a UI login.
+"""
+import time
+from urllib.parse import urlparse
+
+from selenium.common.exceptions import WebDriverException
+
+
+# Cleared per origin with Storage.clearDataForOrigin. The HTTP cache is kept on
+# purpose so static chunks stay warm between tests.
+_STORAGE_TYPES = "cookies,local_storage,indexeddb,websql,service_workers,cache_storage"
+
+
+def _origin(url):
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+def reset_context(driver, origins, window_size=None):
+    """
+    Return a browser to a clean state without restarting it: close every tab but
+    the first, navigate to about:blank (so no page can write state back), clear
+    cookies and storage for `origins`, drop any cookie left on other domains and
+    restore `window_size`.
+    """
+    handles = driver.window_handles
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(handles[0])
+    driver.get("about:blank")
+
+    driver.execute_cdp_cmd("DOMStorage.enable", {})
+    for origin in {_origin(o) for o in origins}:
+        driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": _STORAGE_TYPES})
+        # sessionStorage belongs to the tab and survives the navigation above
+        driver.execute_cdp_cmd("DOMStorage.clear", {
+            "storageId": {"securityOrigin": origin, "isLocalStorage": False},
+        })
+    if driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]:
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+
+    if window_size and driver.get_window_size() != window_size:
+        driver.set_window_size(window_size["width"], window_size["height"])
+
+
+class BrowserPool:
+    """
+    Leases warm drivers created by `factory` and closed by `dispose` (default
+    driver.quit). Up to `size` idle drivers are kept; a lease never waits, it
+    starts another browser when none is idle (e.g. a session fixture logging in
+    while a test already holds one).
+    """
+
+    def __init__(self, factory, origins, size=1, dispose=None):
+        self.factory = factory
+        self.dispose = dispose or (lambda driver: driver.quit())
+        self.origins = list(origins)
+        self.size = size
+        self._idle = []
+        self._window_sizes = {}
+        self.started = 0
+        self.leases = 0
+        self.reset_seconds = 0.0
+
+    def _start(self):
+        driver = self.factory()
+        self._window_sizes[id(driver)] = driver.get_window_size()
+        # The factory may attach to an already used browser (chrome_daemon.py)
+        reset_context(driver, self.origins)
+        self.started += 1
+        return driver
+
+    def _discard(self, driver):
+        self._window_sizes.pop(id(driver), None)
+        try:
+            self.dispose(driver)
+        except WebDriverException:
+            pass
+
+    def acquire(self):
+        """A driver with a clean context, parked on about:blank"""
+        while self._idle:
+            driver = self._idle.pop()
+            start = time.perf_counter()
+            try:
+                reset_context(driver, self.origins, self._window_sizes.get(id(driver)))
+            except WebDriverException as e:
+                # The only case that costs a browser start: the session is gone
+                print(f"⚠️ Discarding a dead browser session: {e.msg}")
+                self._discard(driver)
+                continue
+            self.reset_seconds += time.perf_counter() - start
+            self.leases += 1
+            return driver
+
+        driver = self._start()
+        self.leases += 1
+        return driver
+
+    def release(self, driver):
+        """Hand a driver back; browsers beyond `size` are closed"""
+        if len(self._idle) < self.size:
+            self._idle.append(driver)
+        else:
+            self._discard(driver)
+
+    def close(self):
+        while self._idle:
+            self._discard(self._idle.pop())
+
+    def stats(self):
+        return {"leases": self.leases, "started": self.started, "reset_seconds": self.reset_seconds}
+
+    def summary(self):
+        return pool_summary(self.stats())
+
+
+def pool_summary(stats):
+    """One line for the counters of a pool, or of several pools added up"""
+    resets = stats["leases"] - stats["started"]
+    average = 1000 * stats["reset_seconds"] / resets if resets else 0
+    return f"{stats['leases']} leases, {stats['started']} Chrome start(s), {resets} resets averaging {average:.0f}ms"
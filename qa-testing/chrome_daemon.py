@@ -0,0 +1,404 @@
+"""
+Pre-warmed Chrome daemon shared across pytest invocations
+Keeps N headless Chrome instances alive with remote-debugging ports and leases
+them to test processes over a small HTTP API, so repeated runs attach to a
+running browser instead of launching one. Returned instances get their tabs
+reset; a monitor thread restarts crashed browsers and reclaims leases held by
+processes that have exited.
+
+    python chrome_daemon.py start [--size 3] [--warm-url URL]   # foreground
+    python chrome_daemon.py ensure                              # start in background unless running
+    python chrome_daemon.py status | stop
+
+API (127.0.0.1:CHROME_DAEMON_PORT):
+    POST /lease    {"pid": 123, "timeout": 30}  -> {"id": 0, "debugger_address": "127.0.0.1:40123"}
+    POST /release  {"id": 0}
+    GET  /status
+    POST /shutdown
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from selenium.common.exceptions import TimeoutException
+
+import driver_resolver
+from waits import wait_for
+
+
+DEFAULT_PORT = 9300
+DEFAULT_SIZE = 2
+
+# Seconds between health checks, and idle time after which the daemon exits
+HEALTH_INTERVAL = 5
+IDLE_TIMEOUT = int(os.getenv("CHROME_DAEMON_IDLE_TIMEOUT", "3600"))
+
+LOG_PATH = Path(__file__).parent / "reports" / "chrome-daemon.log"
+
+CHROME_ARGS = (
+    "--headless=new",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--window-size=1920,1080",
+    "--remote-debugging-port=0",
+) + driver_resolver.FAST_START_ARGS
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _devtools(address, path, method="GET", timeout=2):
+    """Call Chrome's DevTools HTTP endpoint (/json/...) and return the decoded body"""
+    request = urllib.request.Request(f"http://{address}{path}", method=method)
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        body = response.read()
+    try:
+        return json.loads(body)
+    except ValueError:
+        return body.decode(errors="replace")
+
+
+def _page_loaded(target_id, url):
+    """
+    DevTools condition for wait_for: Chrome answers /json/version and the tab
+    has a title of its own (it shows the URL until the page has loaded)
+    """
+    def _predicate(address):
+        _devtools(address, "/json/version")
+        target = next((t for t in _devtools(address, "/json/list") if t.get("id") == target_id), None)
+        return target is not None and target.get("title") not in ("", url, target.get("url"))
+    _predicate.wait_name = "warm_page_loaded"
+    return _predicate
+
+
+class ChromeInstance:
+    """One headless Chrome with its own profile and DevTools port"""
+
+    def __init__(self, index, chrome_binary, profile_root):
+        self.index = index
+        self.chrome_binary = chrome_binary
+        self.profile = Path(profile_root) / f"chrome-{index}"
+        self.process = None
+        self.address = None
+        self.lease_pid = None
+        self.leased_at = None
+        self.restarts = -1
+
+    def start(self, timeout=15):
+        shutil.rmtree(self.profile, ignore_errors=True)
+        self.profile.mkdir(parents=True)
+        self.process = subprocess.Popen(
+            [self.chrome_binary, f"--user-data-dir={self.profile}", *CHROME_ARGS, "about:blank"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        # Chrome picks a free port for --remote-debugging-port=0 and writes it here
+        port_file = self.profile / "DevToolsActivePort"
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if port_file.exists():
+                port = port_file.read_text().split("\n")[0].strip()
+                if port:
+                    self.address = f"127.0.0.1:{port}"
+                    if self.healthy():
+                        self.restarts += 1
+                        return self
+            if self.process.poll() is not None:
+                break
+            time.sleep(0.05)
+        self.stop()
+        raise RuntimeError(f"Chrome {self.index} did not expose a DevTools port within {timeout}s")
+
+    def healthy(self):
+        if self.process is None or self.process.poll() is not None or not self.address:
+            return False
+        try:
+            _devtools(self.address, "/json/version")
+            return True
+        except (OSError, urllib.error.URLError):
+            return False
+
+    def reset(self):
+        """Leave a single fresh about:blank tab; cookies and storage are cleared by the client (browser_pool.py)"""
+        pages = [t for t in _devtools(self.address, "/json/list") if t.get("type") == "page"]
+        _devtools(self.address, "/json/new?about:blank", method="PUT")
+        for page in pages:
+            _devtools(self.address, f"/json/close/{page['id']}")
+
+    def stop(self):
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        shutil.rmtree(self.profile, ignore_errors=True)
+
+    def describe(self):
+        return {
+            "id": self.index,
+            "debugger_address": self.address,
+            "pid": self.process.pid if self.process else None,
+            "leased_by": self.lease_pid,
+            "leased_for_s": round(time.monotonic() - self.leased_at, 1) if self.leased_at else None,
+            "restarts": self.restarts,
+        }
+
+
+class ChromeDaemon:
+    """Pool of ChromeInstances behind a threading HTTP server"""
+
+    def __init__(self, size=DEFAULT_SIZE, port=DEFAULT_PORT, warm_urls=()):
+        chrome = driver_resolver.find_chrome()
+        if chrome is None:
+            raise RuntimeError("Chrome is not installed (set CHROME_BIN)")
+        self.port = port
+        self.warm_urls = list(warm_urls)
+        self.profile_root = tempfile.mkdtemp(prefix="qa-chrome-daemon-")
+        self.instances = [ChromeInstance(i, chrome, self.profile_root) for i in range(size)]
+        self.lock = threading.Condition()
+        self.leases = 0
+        self.reclaimed = 0
+        self.last_activity = time.monotonic()
+        self.stopping = threading.Event()
+        self.server = None
+
+    def _warm(self, instance, timeout=60):
+        """Open each warm URL once (e.g. /login) so the app compiles it before the first test"""
+        for url in self.warm_urls:
+            try:
+                target = _devtools(instance.address, f"/json/new?{url}", method="PUT", timeout=timeout)
+                wait_for(instance.address, _page_loaded(target["id"], url), timeout=timeout)
+                _devtools(instance.address, f"/json/close/{target['id']}")
+            except (OSError, urllib.error.URLError, KeyError, TypeError, TimeoutException) as e:
+                print(f"⚠️ Could not warm {url}: {e}")
+
+    def lease(self, pid, timeout=30):
+        deadline = time.monotonic() + timeout
+        with self.lock:
+            while True:
+                for instance in self.instances:
+                    if instance.lease_pid is None and instance.address:
+                        instance.lease_pid = pid
+                        instance.leased_at = time.monotonic()
+                        self.leases += 1
+                        self.last_activity = time.monotonic()
+                        return instance
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self.lock.wait(remaining)
+
+    def release(self, index):
+        instance = self.instances[index]
+        try:
+            instance.reset()
+        except (OSError, urllib.error.URLError, ValueError):
+            self._restart(instance)
+        with self.lock:
+            instance.lease_pid = None
+            instance.leased_at = None
+            self.last_activity = time.monotonic()
+            self.lock.notify_all()
+
+    def _restart(self, instance):
+        print(f"⚠️ Chrome {instance.index} is unhealthy - restarting")
+        instance.stop()
+        try:
+            instance.start()
+        except RuntimeError as e:
+            print(f"❌ {e}")
+
+    def _monitor(self):
+        """Restart dead browsers, reclaim leases of exited processes, exit when idle"""
+        while not self.stopping.wait(HEALTH_INTERVAL):
+            for instance in self.instances:
+                if instance.lease_pid is not None and not _pid_alive(instance.lease_pid):
+                    print(f"♻️ Reclaiming Chrome {instance.index} from exited process {instance.lease_pid}")
+                    self.reclaimed += 1
+                    self.release(instance.index)
+                elif instance.lease_pid is None and not instance.healthy():
+                    self._restart(instance)
+            with self.lock:
+                idle = all(i.lease_pid is None for i in self.instances)
+            if idle and time.monotonic() - self.last_activity > IDLE_TIMEOUT:
+                print(f"💤 Idle for {IDLE_TIMEOUT}s - shutting down")
+                self.shutdown()
+
+    def status(self):
+        return {
+            "pid": os.getpid(),
+            "size": len(self.instances),
+            "leases": self.leases,
+            "reclaimed": self.reclaimed,
+            "healthy": sum(1 for i in self.instances if i.healthy()),
+            "instances": [i.describe() for i in self.instances],
+        }
+
+    def serve(self):
+        started = time.perf_counter()
+        for instance in self.instances:
+            instance.start()
+        if self.instances:
+            self._warm(self.instances[0])
+        print(f"✓ {len(self.instances)} Chrome instance(s) ready in {time.perf_counter() - started:.1f}s")
+
+        daemon = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status, payload):
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _body(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                return json.loads(self.rfile.read(length) or b"{}")
+
+            def do_GET(self):
+                if self.path == "/status":
+                    return self._send(200, daemon.status())
+                self._send(404, {"error": "not found"})
+
+            def do_POST(self):
+                if self.path == "/lease":
+                    body = self._body()
+                    instance = daemon.lease(int(body.get("pid", 0)), float(body.get("timeout", 30)))
+                    if instance is None:
+                        return self._send(503, {"error": "no free Chrome instance"})
+                    return self._send(200, {"id": instance.index, "debugger_address": instance.address})
+                if self.path == "/release":
+                    daemon.release(int(self._body()["id"]))
+                    return self._send(200, {})
+                if self.path == "/shutdown":
+                    self._send(200, {})
+                    return threading.Thread(target=daemon.shutdown, daemon=True).start()
+                self._send(404, {"error": "not found"})
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", self.port), Handler)
+        threading.Thread(target=self._monitor, daemon=True).start()
+        print(f"Chrome daemon listening on http://127.0.0.1:{self.port}")
+        try:
+            self.server.serve_forever()
+        finally:
+            self.stopping.set()
+            for instance in self.instances:
+                instance.stop()
+            shutil.rmtree(self.profile_root, ignore_errors=True)
+
+    def shutdown(self):
+        self.stopping.set()
+        if self.server:
+            self.server.shutdown()
+
+
+# Client side, used by conftest.py
+
+def daemon_url(port=None):
+    return f"http://127.0.0.1:{port or int(os.getenv('CHROME_DAEMON_PORT', DEFAULT_PORT))}"
+
+
+def _call(path, payload=None, port=None, timeout=5):
+    data = json.dumps(payload).encode() if payload is not None else None
+    request = urllib.request.Request(
+        daemon_url(port) + path, data=data, method="POST" if data is not None else "GET",
+        headers={"Content-Type": "application/json"},
+    )
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return json.loads(response.read() or b"{}")
+
+
+def status(port=None):
+    """Daemon status, or None when no daemon is listening"""
+    try:
+        return _call("/status", port=port, timeout=2)
+    except (OSError, urllib.error.URLError, ValueError):
+        return None
+
+
+def lease(timeout=30, port=None):
+    """(lease id, debugger address) of a free instance; raises OSError if none frees up in time"""
+    payload = _call("/lease", {"pid": os.getpid(), "timeout": timeout}, port=port, timeout=timeout + 5)
+    return payload["id"], payload["debugger_address"]
+
+
+def release(lease_id, port=None):
+    _call("/release", {"id": lease_id}, port=port)
+
+
+def ensure(size, port, warm_urls, timeout=60):
+    """Start the daemon in the background unless it is already running"""
+    if status(port):
+        return
+    LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+    command = [sys.executable, str(Path(__file__).resolve()), "start", "--size", str(size), "--port", str(port)]
+    for url in warm_urls:
+        command += ["--warm-url", url]
+    with open(LOG_PATH, "a") as log:
+        subprocess.Popen(command, stdout=log, stderr=subprocess.STDOUT, start_new_session=True,
+                         cwd=str(Path(__file__).parent))
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if status(port):
+            return
+        time.sleep(0.2)
+    raise RuntimeError(f"Chrome daemon did not start within {timeout}s (see {LOG_PATH})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-warmed headless Chrome pool for the Selenium suites")
+    parser.add_argument("command", choices=["start", "ensure", "status", "stop"])
+    parser.add_argument("--size", type=int, default=int(os.getenv("CHROME_DAEMON_SIZE", DEFAULT_SIZE)))
+    parser.add_argument("--port", type=int, default=int(os.getenv("CHROME_DAEMON_PORT", DEFAULT_PORT)))
+    parser.add_argument("--warm-url", action="append", default=[],
+                        help="URL every run needs compiled first, e.g. http://localhost:3000/login")
+    args = parser.parse_args()
+
+    if args.command == "start":
+        daemon = ChromeDaemon(args.size, args.port, args.warm_url)
+        try:
+            daemon.serve()
+        except KeyboardInterrupt:
+            pass
+    elif args.command == "ensure":
+        ensure(args.size, args.port, args.warm_url)
+        print(f"✓ Chrome daemon running on {daemon_url(args.port)}")
+    elif args.command == "status":
+        current = status(args.port)
+        if current is None:
+            print("Chrome daemon is not running")
+            sys.exit(1)
+        print(json.dumps(current, indent=2))
+    else:
+        try:
+            _call("/shutdown", {}, port=args.port)
+            print("✓ Chrome daemon stopped")
+        except (OSError, urllib.error.URLError):
+            print("Chrome daemon is not running")
+
+
+if __name__ == "__main__":
+    main()
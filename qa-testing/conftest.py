@@ -3,68 +3,201 @@ Shared pytest fixtures for all test files
 """
 import pytest
 import os
-import socket
-import urllib.request
-import urllib.error
 from pathlib import Path
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException
-from webdriver_manager.chrome import ChromeDriverManager
 from dotenv import load_dotenv
+import re
 import time
+import auth_state
+import chrome_daemon
+import driver_resolver
+from browser_pool import BrowserPool, pool_summary
+from http_smoke import HttpClient, shared_adapter
+from local_supabase import DEFAULT_PORT as LOCAL_SUPABASE_DEFAULT_PORT, anon_key, ensure_running
+from pages import DashboardPage, EventFormPage, LoginPage
+from seeding import SupabaseSeeder, supabase_config
+import uuid
+from datetime import datetime, timedelta
+from waits import (
+    WAIT_LOG,
+    IMPLICIT_WAIT_MISS,
+    wait_for,
+    probe,
+    track_implicit_waits,
+    get_and_settle,
+    navigation_settled,
+)
 
 
 def save_debug_artifacts(driver, prefix="test-failure"):
     """
-    Save debugging artifacts (screenshot and page source) when a test fails.
-    Useful for debugging CI failures and timing issues.
+    Capture debugging artifacts (screenshot, DOM, console log) from `driver`.
+    Written in the background to reports/artifacts/ (see artifacts.py), so the
+    caller is not held up by disk I/O. Failing tests are captured automatically;
+    call this for failures outside a test, or to keep a state the test recovers from.
     """
+    import artifacts
     try:
-        ts = int(time.time())
-        # Use reports directory if it exists, otherwise use /tmp
-        reports_dir = Path(__file__).parent / "reports"
-        if not reports_dir.exists():
-            reports_dir.mkdir(parents=True, exist_ok=True)
-        
-        screenshot_path = reports_dir / f"{prefix}-{ts}.png"
-        html_path = reports_dir / f"{prefix}-{ts}.html"
-        
-        try:
-            driver.save_screenshot(str(screenshot_path))
-            print(f"📸 Screenshot saved: {screenshot_path}")
-        except Exception as e:
-            print(f"⚠️ Could not save screenshot: {e}")
-        
-        try:
-            with open(html_path, "w", encoding="utf-8") as f:
-                f.write(driver.page_source)
-            print(f"📄 Page source saved: {html_path}")
-        except Exception as e:
-            print(f"⚠️ Could not save page source: {e}")
-        
-        print(f"🔍 Debug artifacts saved with prefix: {prefix}")
-        print(f"   Current URL: {driver.current_url}")
-        print(f"   Page title: {driver.title}")
+        directory = artifacts.capture(driver, prefix)
+        print(f"🔍 Debug artifacts queued: {directory}")
     except Exception as e:
         print(f"⚠️ Error saving debug artifacts: {e}")
 
+# Per-test CDP network/paint timings attached to the HTML report (see devtools_timing.py)
+# and the routes each test visits, for diff-based test selection (see impact_map.py);
+# sharding.py splits the suite across CI runners by recorded durations; artifacts.py
+# captures screenshot, DOM, console and HAR of failing tests; phase_timing.py splits
+# each test's time into navigation, waits, commands, fixtures...; results.py stores
+# per-test records and renders reports/report.html; flaky.py reruns failing tests and
+# quarantines flaky ones
+pytest_plugins = ["devtools_timing", "impact_map", "sharding", "artifacts", "phase_timing", "results", "flaky"]
+
 # Load environment variables from .env file
 env_path = Path(__file__).parent / '.env'
 load_dotenv(env_path)
 
+# Reuse the login snapshot in .auth/ across sessions and workers (see auth_state.py)
+REUSE_AUTH_STATE = os.getenv("REUSE_AUTH_STATE", "true").lower() == "true"
 
-@pytest.fixture(scope="session")
-def driver():
+# Attach to the pre-warmed Chrome daemon started by run_tests.sh (see chrome_daemon.py)
+CHROME_DAEMON = os.getenv("CHROME_DAEMON", "false").lower() == "true"
+
+# Implicit wait in seconds. 0 by default: lookups either wait explicitly
+# (waits.expect_present, pages.Page.wait) or probe without waiting (waits.probe)
+IMPLICIT_WAIT = float(os.getenv("IMPLICIT_WAIT", "0"))
+
+# Idle Chrome sessions kept warm per process (see browser_pool.py)
+BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "1"))
+_browser_pool = None
+
+# Latest auth snapshot per (base_url, email), injected into every authenticated test
+_auth_snapshots = {}
+
+# Run against the in-memory Supabase stand-in instead of a hosted project (see local_supabase.py)
+LOCAL_SUPABASE = os.getenv("LOCAL_SUPABASE", "false").lower() == "true"
+LOCAL_SUPABASE_PORT = int(os.getenv("LOCAL_SUPABASE_PORT", LOCAL_SUPABASE_DEFAULT_PORT))
+_local_supabase = None
+
+
+def current_worker():
+    """
+    Name of the pytest-xdist worker running this process ("gw0", "gw1", ...),
+    or "master" when the suite runs without -n.
+    """
+    return os.getenv("PYTEST_XDIST_WORKER", "master")
+
+
+def _worker_index():
+    worker = current_worker()
+    return int(worker[2:]) if worker.startswith("gw") else 0
+
+
+def _load_test_accounts():
     """
-    Setup and teardown driver for the entire test session
-    This keeps the browser open for all tests, allowing session persistence
+    Accounts available to parallel workers.
+    TEST_ACCOUNTS holds comma-separated "email:password" pairs, one per worker;
+    without it every worker shares TEST_EMAIL / TEST_PASSWORD.
     """
+    accounts = []
+    for entry in os.getenv("TEST_ACCOUNTS", "").split(","):
+        email, _, password = entry.strip().partition(":")
+        if email and password:
+            accounts.append({"email": email, "password": password})
+    if not accounts:
+        accounts.append({
+            "email": os.getenv("TEST_EMAIL", "test@example.com"),
+            "password": os.getenv("TEST_PASSWORD", "testpassword123"),
+        })
+    return accounts
+
+
+def _worker_credentials():
+    """Account owned by this worker - accounts are handed out round-robin by worker index"""
+    accounts = _load_test_accounts()
+    return accounts[_worker_index() % len(accounts)]
+
+
+def pytest_configure(config):
+    """
+    Boot the local Supabase stand-in when LOCAL_SUPABASE=true.
+    Runs once in the controlling process (not in xdist workers) so every worker
+    talks to the same in-memory database. A stand-in that is already listening -
+    e.g. started by CI before the app was built against it - is reused.
+    The app itself must point NEXT_PUBLIC_SUPABASE_URL at the same port.
+    """
+    global _local_supabase
+    if not LOCAL_SUPABASE or hasattr(config, "workerinput"):
+        return
+    
+    accounts = [(a["email"], a["password"]) for a in _load_test_accounts()]
+    _local_supabase = ensure_running(LOCAL_SUPABASE_PORT, accounts)
+    if _local_supabase is not None:
+        print(f"✓ Local Supabase stand-in started on {_local_supabase.url}")
+    url = f"http://127.0.0.1:{LOCAL_SUPABASE_PORT}"
+    
+    # Inherited by xdist workers, which are spawned after configure
+    os.environ["SUPABASE_URL"] = url
+    os.environ["SUPABASE_ANON_KEY"] = anon_key()
+
+
+def pytest_unconfigure(config):
+    if _local_supabase is not None:
+        _local_supabase.stop()
+
+
+def _attach_to_daemon():
+    """
+    Lease a running Chrome from the daemon and attach to it, or return None
+    when no daemon answers or every instance is taken
+    """
+    try:
+        lease_id, debugger_address = chrome_daemon.lease()
+    except (OSError, ValueError, KeyError) as e:
+        print(f"⚠️ Chrome daemon unavailable ({e}) - launching Chrome instead")
+        return None
+    
+    options = Options()
+    options.debugger_address = debugger_address
+    from devtools_timing import configure_options
+    from artifacts import configure_options as configure_console_log
+    configure_options(options)
+    configure_console_log(options)
+    driver = webdriver.Chrome(service=Service(driver_resolver.resolve()), options=options)
+    driver._qa_daemon_lease = lease_id
+    track_implicit_waits(driver)
+    driver.implicitly_wait(IMPLICIT_WAIT)
+    driver.set_page_load_timeout(30)
+    return driver
+
+
+def _dispose_driver(driver):
+    """Quit a driver; daemon browsers are handed back (and reset) instead of closed"""
+    lease_id = getattr(driver, "_qa_daemon_lease", None)
+    try:
+        driver.quit()
+    finally:
+        if lease_id is not None:
+            try:
+                chrome_daemon.release(lease_id)
+            except OSError:
+                pass
+
+
+def _create_driver():
+    """Start a Chrome session with the suite's options (or attach to the Chrome daemon)"""
+    if CHROME_DAEMON:
+        driver = _attach_to_daemon()
+        if driver is not None:
+            return driver
+    
     options = Options()
     
     # Check if we should run in headless mode (default: False - show browser for visual testing)
-    headless = os.getenv("HEADLESS", "false").lower() == "true"
+    # Parallel workers always run headless - a grid of visible windows helps nobody
+    headless = os.getenv("HEADLESS", "false").lower() == "true" or current_worker() != "master"
     if headless:
         options.add_argument("--headless")
     else:
@@ -76,107 +209,79 @@ def driver():
     options.add_argument("--disable-dev-shm-usage")
     options.add_argument("--disable-gpu")
     options.add_argument("--window-size=1920,1080")
+    # Skip first-run work and background network traffic - both slow down a cold start
+    for flag in driver_resolver.FAST_START_ARGS:
+        options.add_argument(flag)
+    
+    # Imported here so pytest can register (and assert-rewrite) it via pytest_plugins first
+    from devtools_timing import configure_options
+    from artifacts import configure_options as configure_console_log
+    configure_options(options)
+    configure_console_log(options)
     
     # Use system Chrome binary if available (e.g., in CI environments)
     chrome_bin = os.getenv("CHROME_BIN")
     if chrome_bin and os.path.isfile(chrome_bin):
         options.binary_location = chrome_bin
     
-    # Use system chromedriver if available (e.g., in CI environments)
-    driver_path = os.getenv("CHROMEDRIVER_PATH")
-    is_system_driver = driver_path and os.path.isfile(driver_path)
-    
-    if not is_system_driver:
-        # Fallback to webdriver-manager for local development
-        driver_path = ChromeDriverManager().install()
-    
-    # webdriver-manager sometimes returns the wrong file (e.g., THIRD_PARTY_NOTICES.chromedriver)
-    # We need to find the actual chromedriver executable
-    if not driver_path.endswith('chromedriver') or 'THIRD_PARTY' in driver_path or 'LICENSE' in driver_path:
-        # Get the directory containing the driver
-        driver_dir = os.path.dirname(driver_path) if os.path.isfile(driver_path) else driver_path
-        
-        # Look for the actual chromedriver executable (just "chromedriver", not other files)
-        if os.path.isdir(driver_dir):
-            chromedriver_path = os.path.join(driver_dir, 'chromedriver')
-            if os.path.isfile(chromedriver_path):
-                driver_path = chromedriver_path
-            else:
-                # Fallback: search for any file named exactly "chromedriver"
-                for file in os.listdir(driver_dir):
-                    if file == 'chromedriver':
-                        potential_path = os.path.join(driver_dir, file)
-                        if os.path.isfile(potential_path):
-                            driver_path = potential_path
-                            break
-    
-    # Make sure the driver is executable (only for webdriver-manager downloads, not system binaries)
-    # System-installed chromedriver should already have correct permissions
-    if not is_system_driver and os.path.isfile(driver_path):
-        try:
-            os.chmod(driver_path, 0o755)
-        except PermissionError:
-            # If we can't chmod, assume it's already executable (e.g., system driver)
-            pass
+    # CHROMEDRIVER_PATH in CI, otherwise the cached driver for the installed Chrome (no network)
+    driver_path = driver_resolver.resolve()
     
     driver = webdriver.Chrome(
         service=Service(driver_path), options=options
     )
-    driver.implicitly_wait(10)
+    track_implicit_waits(driver)
+    driver.implicitly_wait(IMPLICIT_WAIT)
     driver.set_page_load_timeout(30)
-    
+    return driver
+
+
+@pytest.fixture(scope="session")
+def browser_pool(base_url):
+    """
+    Warm Chrome sessions for this process (see browser_pool.py).
+    Browsers stay open for the whole session; tests only pay for a context reset.
+    """
+    global _browser_pool
+    supabase_url, _ = supabase_config()
+    origins = [base_url] + ([supabase_url] if supabase_url else [])
+    _browser_pool = BrowserPool(_create_driver, origins, size=BROWSER_POOL_SIZE, dispose=_dispose_driver)
+    yield _browser_pool
+    _browser_pool.close()
+
+
+@pytest.fixture(scope="function")
+def driver(browser_pool):
+    """
+    A browser for one test: no cookies, no storage, a single tab on about:blank.
+    Signed out - use authenticated_driver for a signed-in browser.
+    """
+    driver = browser_pool.acquire()
     yield driver
-    
-    # Only quit at the end of the entire test session
-    driver.quit()
+    browser_pool.release(driver)
 
 
 @pytest.fixture(scope="session")
-def base_url():
-    """Base URL for the application - session scoped for reuse"""
-    return os.getenv("BASE_URL", "http://localhost:3000")
+def http_adapter():
+    """Keep-alive connection pool shared by every http_client in this process"""
+    adapter = shared_adapter()
+    yield adapter
+    adapter.close()
 
 
-def _check_app_running(base_url, timeout=5):
+@pytest.fixture(scope="function")
+def http_client(http_adapter, base_url):
     """
-    Check if the application is running and accessible.
-    Returns True if accessible, False otherwise.
+    Browserless client for server-rendered pages (see http_smoke.py).
+    A fresh cookie jar per test; connections come from the shared pool.
     """
-    try:
-        # Parse URL
-        if base_url.startswith("http://"):
-            host = base_url.replace("http://", "").split("/")[0].split(":")[0]
-            port = int(base_url.split(":")[-1].split("/")[0]) if ":" in base_url.replace("http://", "") else 80
-        elif base_url.startswith("https://"):
-            host = base_url.replace("https://", "").split("/")[0].split(":")[0]
-            port = int(base_url.split(":")[-1].split("/")[0]) if ":" in base_url.replace("https://", "") else 443
-        else:
-            # Assume localhost:3000 if no protocol
-            host = base_url.split(":")[0] if ":" in base_url else "localhost"
-            port = int(base_url.split(":")[-1].split("/")[0]) if ":" in base_url else 3000
-        
-        # Try to connect via socket first (faster)
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(timeout)
-        result = sock.connect_ex((host, port))
-        sock.close()
-        
-        if result == 0:
-            # Socket connection successful, try HTTP request
-            try:
-                req = urllib.request.Request(base_url)
-                req.add_header('User-Agent', 'pytest-selenium-check')
-                with urllib.request.urlopen(req, timeout=timeout) as response:
-                    return response.status in [200, 301, 302, 303, 307, 308]
-            except (urllib.error.URLError, urllib.error.HTTPError, socket.timeout):
-                # Socket works but HTTP doesn't - might be a different service
-                # Still return True since we can connect
-                return True
-        
-        return False
-    except Exception as e:
-        print(f"Warning: Could not check if app is running: {e}")
-        return False
+    return HttpClient(base_url, http_adapter)
+
+
+@pytest.fixture(scope="session")
+def base_url():
+    """Base URL for the application - session scoped for reuse"""
+    return os.getenv("BASE_URL", "http://localhost:3000")
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -184,14 +289,20 @@ def verify_app_running(base_url):
     """
     Automatically verify the app is running before any tests start.
     This fixture runs automatically for all tests (autouse=True).
+    The first worker also warms every route (app_ready.py); the rest reuse its ready state.
     """
+    # Imported here, not at the top: app_ready imports impact_map, which pytest_plugins must register
+    # (and assert-rewrite) before anything else imports it
+    import app_ready
     print(f"\n🔍 Checking if application is running at {base_url}...")
     
-    if not _check_app_running(base_url):
+    try:
+        state = app_ready.ensure_ready(base_url, timeout=app_ready.TEST_TIMEOUT)
+    except app_ready.AppNotReady as e:
         error_msg = f"""
 ❌ APPLICATION NOT RUNNING
 
-The application is not accessible at {base_url}
+The application is not accessible at {base_url}: {e}
 
 To fix this:
 1. Start the application: npm run dev
@@ -204,16 +315,24 @@ If your app runs on a different URL, set BASE_URL in your .env file:
 """
         pytest.fail(error_msg)
     
-    print(f"✅ Application is running at {base_url}\n")
+    app_ready.print_summary(state)
 
 
 @pytest.fixture(scope="session")
 def test_credentials():
-    """Test user credentials from environment variables - session scoped for reuse"""
-    return {
-        "email": os.getenv("TEST_EMAIL", "test@example.com"),
-        "password": os.getenv("TEST_PASSWORD", "testpassword123"),
-    }
+    """
+    Test user credentials for this worker - session scoped for reuse.
+    Under pytest-xdist each worker gets its own account from TEST_ACCOUNTS so
+    sign-out and seeded data never leak between workers.
+    """
+    credentials = _worker_credentials()
+    workers = int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1"))
+    if workers > len(_load_test_accounts()):
+        print(
+            f"⚠️ {workers} workers share {len(_load_test_accounts())} test account(s); "
+            "set TEST_ACCOUNTS to give each worker its own account"
+        )
+    return credentials
 
 
 def _perform_login(driver, base_url, test_credentials):
@@ -228,35 +347,16 @@ def _perform_login(driver, base_url, test_credentials):
     
     print(f"Attempting login to {base_url}/login with email: {test_credentials['email']}")
     
-    driver.get(f"{base_url}/login")
-    
-    # Wait for login page to load
+    # open() waits for hydration - the form posts natively if submitted before React attaches
+    login_page = LoginPage(driver, base_url)
     try:
-        WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located((By.NAME, "email"))
-        )
-    except Exception as e:
+        login_page.open()
+    except TimeoutException as e:
         current_url = driver.current_url
         page_source_preview = driver.page_source[:1000] if driver.page_source else "No page source"
         raise Exception(f"Login page did not load. URL: {current_url}. Page preview: {page_source_preview[:200]}") from e
     
-    # Fill in email
-    email_input = driver.find_element(By.NAME, "email")
-    email_input.clear()
-    email_input.send_keys(test_credentials["email"])
-    time.sleep(0.5)
-    
-    # Fill in password
-    password_input = driver.find_element(By.NAME, "password")
-    password_input.clear()
-    password_input.send_keys(test_credentials["password"])
-    time.sleep(0.5)
-    
-    # Click sign in button
-    sign_in_button = driver.find_element(
-        By.XPATH, "//button[contains(text(), 'Sign In')]"
-    )
-    sign_in_button.click()
+    login_page.login(test_credentials["email"], test_credentials["password"])
     
     # Wait for redirect to dashboard with better error handling
     try:
@@ -272,7 +372,7 @@ def _perform_login(driver, base_url, test_credentials):
         # Check if there's an error message on the page
         try:
             # Look for toast messages or error text
-            error_elements = driver.find_elements(By.XPATH, "//*[contains(@class, 'error') or contains(@class, 'destructive') or contains(@role, 'alert')]")
+            error_elements = probe(driver, By.XPATH, "//*[contains(@class, 'error') or contains(@class, 'destructive') or contains(@role, 'alert')]")
             if error_elements:
                 error_texts = [el.text for el in error_elements if el.text]
                 if error_texts:
@@ -300,22 +400,21 @@ def _perform_login(driver, base_url, test_credentials):
     
     # Verify we're on the dashboard
     try:
-        WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located((By.XPATH, "//*[contains(text(), 'Events Dashboard')]"))
-        )
+        DashboardPage(driver, base_url).wait(DashboardPage.HEADING, timeout=15)
     except Exception as e:
         current_url = driver.current_url
         page_source_preview = driver.page_source[:500] if driver.page_source else "No page source"
         raise Exception(f"Dashboard verification failed. URL: {current_url}. Page preview: {page_source_preview[:200]}") from e
     
     print("✓ Login successful - on dashboard")
-    time.sleep(1)  # Brief pause for page to fully load
+    wait_for(driver, navigation_settled("/dashboard"))
 
 
 def ui_login(driver, base_url, test_credentials=None):
     """
     Public helper function to perform UI login.
     Can be called from tests when re-authentication is needed.
+    Refreshes the stored auth state so other sessions pick up the new login.
     
     Args:
         driver: Selenium WebDriver instance
@@ -324,95 +423,271 @@ def ui_login(driver, base_url, test_credentials=None):
                           If None, will use environment variables.
     """
     if test_credentials is None:
-        test_credentials = {
-            "email": os.getenv("TEST_EMAIL", "test@example.com"),
-            "password": os.getenv("TEST_PASSWORD", "testpassword123"),
-        }
+        test_credentials = _worker_credentials()
     
     _perform_login(driver, base_url, test_credentials)
+    email = test_credentials["email"]
+    if REUSE_AUTH_STATE:
+        _auth_snapshots[(base_url, email)] = auth_state.save_state(driver, base_url, email)
+    else:
+        _auth_snapshots[(base_url, email)] = auth_state.capture_state(driver, base_url)
 
 
-@pytest.fixture(scope="session")
-def authenticated_driver(driver, base_url, test_credentials):
+def _is_authenticated(driver, base_url):
+    """Load the dashboard and report whether it rendered instead of redirecting to /login"""
+    try:
+        get_and_settle(driver, f"{base_url}/dashboard")
+        
+        # If redirected to login, we're not authenticated
+        if "/dashboard" not in driver.current_url:
+            return False
+        heading, = DashboardPage(driver, base_url).find(DashboardPage.HEADING)
+        return heading is not None
+    except Exception as e:
+        print(f"⚠️ Error checking authentication status: {e}")
+        return False
+
+
+def _login_with_state(driver, base_url, test_credentials):
     """
-    Create an authenticated session by signing in ONCE for the entire test session
-    This fixture logs in once and reuses the session for all tests
-    Re-authenticates if session was invalidated (e.g., by sign out test)
+    Authenticate from the stored auth snapshot when there is a fresh one,
+    otherwise log in through the UI and write a new snapshot.
+    Holds a per-account lock so concurrent workers log in only once.
+    Returns "snapshot" or "ui" depending on the path taken.
     """
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
+    email = test_credentials["email"]
+    if not REUSE_AUTH_STATE:
+        _perform_login(driver, base_url, test_credentials)
+        return "ui"
     
-    # Always ensure we're logged in at the start of the session
+    with auth_state.state_lock(base_url, email):
+        if auth_state.restore_state(driver, base_url, email):
+            if _is_authenticated(driver, base_url):
+                return "snapshot"
+            print("⚠️ Stored auth state was rejected - falling back to UI login")
+            auth_state.clear_state(base_url, email)
+            driver.delete_all_cookies()
+        
+        _perform_login(driver, base_url, test_credentials)
+        auth_state.save_state(driver, base_url, email)
+        return "ui"
+
+
+@pytest.fixture(scope="session")
+def auth_snapshot(browser_pool, base_url, test_credentials):
+    """
+    Authenticate ONCE for the entire test session and keep the resulting cookies
+    and localStorage. Injects the stored auth snapshot when available and only
+    falls back to the UI login form when there is none or it has gone stale.
+    """
     print("\n🔐 Ensuring authentication for test session...")
-    
-    # Check if we're already logged in by checking current URL and page content
-    def is_authenticated():
-        try:
-            driver.get(f"{base_url}/dashboard")
-            time.sleep(2)  # Give page time to load and check for redirects
-            current_url = driver.current_url
-            
-            # If redirected to login, we're not authenticated
-            if "/login" in current_url:
-                return False
-            
-            # Check if we're actually on dashboard (not redirected to login)
-            if "/dashboard" in current_url:
-                # Verify dashboard content is present
-                page_text = driver.page_source.lower()
-                if "events dashboard" in page_text or "dashboard" in page_text:
-                    # Double-check: look for dashboard-specific elements
-                    if driver.find_elements(By.XPATH, "//h1[contains(., 'Events Dashboard')] | //*[contains(., 'Events Dashboard')]"):
-                        return True
-            return False
-        except Exception as e:
-            print(f"⚠️ Error checking authentication status: {e}")
-            return False
-    
-    # Try to check authentication status
-    if is_authenticated():
-        print("✓ Already authenticated - reusing session")
-        return driver
-    
-    # Not authenticated - perform login
-    print("🔐 Logging in for test session...")
-    
+    driver = browser_pool.acquire()
     try:
-        _perform_login(driver, base_url, test_credentials)
+        method = _login_with_state(driver, base_url, test_credentials)
         
         # Verify login was successful
-        if not is_authenticated():
+        if not _is_authenticated(driver, base_url):
             raise Exception("Login completed but authentication verification failed")
         
-        print("✓ Successfully authenticated - session ready for all tests")
-        return driver
+        if method == "snapshot":
+            print("✓ Restored stored auth state - skipped the login form")
+        else:
+            print("✓ Successfully authenticated - session ready for all tests")
+        state = auth_state.capture_state(driver, base_url)
+        _auth_snapshots[(base_url, test_credentials["email"])] = state
+        return state
     except Exception as e:
         save_debug_artifacts(driver, "authentication-failure")
         pytest.fail(f"Could not authenticate: {str(e)}")
+    finally:
+        browser_pool.release(driver)
+
+
+def _current_auth_snapshot(driver, base_url, test_credentials):
+    """
+    The freshest snapshot for this account: the in-memory one, or the one in
+    .auth/ when another worker logged in again since (e.g. after test_sign_out
+    revoked the session). Logs in again only once the session has expired.
+    """
+    key = (base_url, test_credentials["email"])
+    state = _auth_snapshots[key]
+    if REUSE_AUTH_STATE:
+        stored = auth_state.load_state(base_url, test_credentials["email"])
+        if stored and stored["captured_at"] > state["captured_at"]:
+            state = _auth_snapshots[key] = stored
+    if state["expires_at"] <= time.time():
+        print("🔐 Auth snapshot expired - logging in again...")
+        _login_with_state(driver, base_url, test_credentials)
+        state = _auth_snapshots[key] = auth_state.capture_state(driver, base_url)
+        driver.get("about:blank")
+    return state
 
 
 @pytest.fixture(scope="function")
-def ensure_authenticated(driver, base_url, test_credentials):
+def authenticated_driver(driver, auth_snapshot, base_url, test_credentials):
     """
-    Fixture that ensures authentication before each test.
-    Use this for tests that might run after sign-out.
+    A pooled browser signed in by injecting the session's auth snapshot into its
+    freshly reset context - no page load, no login form.
     """
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
+    auth_state.inject_state(driver, _current_auth_snapshot(driver, base_url, test_credentials))
+    return driver
+
+
+@pytest.fixture(scope="function")
+def ensure_authenticated(authenticated_driver):
+    """
+    Signed-in browser for tests written against the old session-wide driver.
+    Every test now starts from a clean context with the snapshot restored, so a
+    previous sign-out can no longer leak into it.
+    """
+    return authenticated_driver
+
+
+def create_event_via_ui(driver, base_url, name, sport="Basketball", venues=("QA Venue",), days_ahead=1):
+    """
+    Create an event through /events/new and wait for the server action to finish.
+    Used to seed data for tests that need an event to exist.
+    """
+    starts_at = (datetime.now() + timedelta(days=days_ahead)).strftime("%Y-%m-%dT14:00")
+    form = EventFormPage(driver, base_url).open()
+    form.fill(name=name, sport=sport, starts_at=starts_at, venues=venues)
+    form.submit_and_wait()
+
+
+def _test_namespace(request):
+    """
+    Unique, LIKE-safe prefix for data seeded by one test on one worker.
+    Only [a-z0-9-] so `_` never acts as a wildcard in teardown filters.
+    """
+    slug = re.sub(r"[^a-z0-9]+", "-", request.node.name.lower()).strip("-")[:40]
+    return f"qa-{current_worker()}-{slug}-{uuid.uuid4().hex[:6]}"
+
+
+@pytest.fixture(scope="session")
+def api_seeder(test_credentials):
+    """
+    SupabaseSeeder signed in as this worker's account, or None when
+    SUPABASE_URL / SUPABASE_ANON_KEY (or the NEXT_PUBLIC_* names) are not set.
+    """
+    supabase_url, anon_key = supabase_config()
+    if not supabase_url:
+        return None
+    return SupabaseSeeder.sign_in(
+        test_credentials["email"], test_credentials["password"],
+        supabase_url=supabase_url, anon_key=anon_key,
+        namespace=f"qa-{current_worker()}",
+    )
+
+
+@pytest.fixture(scope="function")
+def seeder(api_seeder, request):
+    """
+    Namespaced seeder for a single test; everything it created is deleted afterwards.
+    Skips the test when the Supabase API is not configured.
+    """
+    if api_seeder is None:
+        pytest.skip("SUPABASE_URL / SUPABASE_ANON_KEY not set - API seeding unavailable")
+    scoped = api_seeder.child(_test_namespace(request))
+    yield scoped
+    scoped.teardown()
+
+
+@pytest.fixture(scope="function")
+def seeded_event(api_seeder, base_url, request):
+    """
+    An event owned by this worker's account, created fresh for the requesting test.
+    The name is unique per worker and test so tests never depend on data left
+    behind by another test or on execution order.
     
-    # Check if we need to re-authenticate
-    try:
-        driver.get(f"{base_url}/dashboard")
-        time.sleep(1)
-        if "/login" in driver.current_url:
-            print("🔐 Re-authenticating...")
-            _perform_login(driver, base_url, test_credentials)
-            print("✓ Re-authenticated successfully")
-    except Exception as e:
-        print(f"⚠️ Re-authentication needed: {e}")
-        _perform_login(driver, base_url, test_credentials)
+    Inserted through the Supabase REST API when configured (and deleted after the
+    test); otherwise created through the UI form as a slower fallback.
+    """
+    namespace = _test_namespace(request)
+    if api_seeder is None:
+        name = f"{namespace} event"
+        create_event_via_ui(request.getfixturevalue("authenticated_driver"), base_url, name)
+        yield {"name": name}
+        return
     
-    return driver
+    scoped = api_seeder.child(namespace)
+    yield scoped.create_event("event", sport="Basketball", venues=["QA Venue"])
+    scoped.teardown()
+
+
+@pytest.fixture(autouse=True)
+def _attribute_waits(request):
+    """Attribute every wait recorded by waits.py to the test that issued it"""
+    WAIT_LOG.current_test = request.node.nodeid
+    yield
+    WAIT_LOG.current_test = None
+
+
+WAIT_STATS_PATH = Path(__file__).parent / "reports" / "wait-stats.json"
+
 
+def _worker_stats_paths():
+    return sorted(WAIT_STATS_PATH.parent.glob("wait-stats-gw*.json"))
+
+
+def pytest_sessionstart(session):
+    """Drop the per-worker wait stats of an earlier run before xdist workers write new ones"""
+    if hasattr(session.config, "workerinput"):
+        return
+    for path in _worker_stats_paths():
+        path.unlink(missing_ok=True)
+
+
+def pytest_sessionfinish(session):
+    """Each xdist worker hands its waits and pool counters to the controller through a file of its own"""
+    if not hasattr(session.config, "workerinput"):
+        return
+    worker = session.config.workerinput["workerid"]
+    pool = _browser_pool.stats() if _browser_pool is not None else None
+    WAIT_LOG.dump(WAIT_STATS_PATH.with_name(f"wait-stats-{worker}.json"), browser_pool=pool)
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Print browser pool usage and time spent in condition waits (reports/wait-stats.json)"""
+    if hasattr(terminalreporter.config, "workerinput"):
+        return
+    pools = [_browser_pool.stats()] if _browser_pool is not None else []
+    # Under xdist the tests ran in the workers: fold their records in first
+    for path in _worker_stats_paths():
+        pool = WAIT_LOG.merge(path).get("browser_pool")
+        if pool:
+            pools.append(pool)
+    leases = sum(pool["leases"] for pool in pools)
+    if leases:
+        total = {key: sum(pool[key] for pool in pools) for key in ("leases", "started", "reset_seconds")}
+        workers = f" across {len(pools)} workers" if len(pools) > 1 else ""
+        terminalreporter.write_line(f"Browser pool: {pool_summary(total)}{workers}")
+    tests = {test: n for test, n in WAIT_LOG.commands.items() if test is not None}
+    if tests:
+        busiest = max(tests, key=tests.get)
+        terminalreporter.write_line(
+            f"WebDriver commands: {sum(tests.values())} over {len(tests)} tests, "
+            f"{sum(tests.values()) / len(tests):.0f} per test on average, most in {busiest} ({tests[busiest]})"
+        )
+    if not WAIT_LOG.records:
+        return
+    WAIT_LOG.dump(WAIT_STATS_PATH)
+    
+    terminalreporter.write_sep("-", "condition waits")
+    summary = sorted(WAIT_LOG.by_condition().items(), key=lambda kv: kv[1]["total"], reverse=True)
+    for name, entry in summary:
+        terminalreporter.write_line(
+            f"{name:<32} calls={entry['calls']:<4} total={entry['total']:.2f}s "
+            f"max={entry['max']:.2f}s timeouts={entry['timeouts']}"
+        )
+    terminalreporter.write_line(f"Total time waiting: {WAIT_LOG.total():.2f}s (details: {WAIT_STATS_PATH})")
+    
+    implicit = sorted(WAIT_LOG.implicit_by_test().items(), key=lambda kv: kv[1], reverse=True)
+    if implicit:
+        terminalreporter.write_sep("-", "implicit waits")
+        for test, seconds in implicit[:10]:
+            misses = sum(1 for r in WAIT_LOG.records if r["test"] == test and r["condition"] == IMPLICIT_WAIT_MISS)
+            terminalreporter.write_line(f"{seconds:7.2f}s  misses={misses:<3} {test or '(fixtures)'}")
+        terminalreporter.write_line(
+            f"Total inside implicit waits: {sum(t for _, t in implicit):.2f}s - "
+            "use waits.probe() for lookups that may find nothing"
+        )
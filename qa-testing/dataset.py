@@ -0,0 +1,417 @@
+"""
+Synthetic dataset generator for scale testing
+Streams users' events, shared venues (event_venues) and recurring series
+(parent_event_id) shaped like supabase/schema.sql, with skewed distributions:
+a few users own most events, venue popularity follows a Zipf curve (and users
+mostly book their own handful of home venues), popular sports dominate, and
+dates cluster in the coming weeks, on evenings and weekends.
+
+Output is deterministic for a given seed and anchor date. Only the venue pool
+and the per-user event counts are held in memory, so millions of rows stream
+in constant memory to:
+
+- PostgreSQL COPY (text) or CSV files, one per table, plus a load.sql for psql
+- batched REST inserts into a running local Supabase stand-in (local_supabase.py)
+
+    python dataset.py copy --users 1000 --events-per-user 2000 --out reports/dataset
+    python dataset.py csv --users 10 --events-per-user 100 --seed 7
+    python dataset.py push --users 50 --events-per-user 500       # stand-in on LOCAL_SUPABASE_PORT
+"""
+import argparse
+import bisect
+import csv
+import itertools
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+from pathlib import Path
+
+import requests
+
+from local_supabase import DEFAULT_PORT as LOCAL_SUPABASE_DEFAULT_PORT, port_open, service_role_key
+from seeding import DEFAULT_BATCH_SIZE
+
+
+TABLES = {
+    "venues": ("id", "name", "created_at"),
+    "events": ("id", "user_id", "name", "sport", "starts_at", "description", "location",
+               "is_recurring", "recurrence_pattern", "parent_event_id", "created_at"),
+    "event_venues": ("event_id", "venue_id"),
+}
+# Foreign keys point left to right: a table is flushed only after the ones before it
+TABLE_ORDER = ("venues", "events", "event_venues")
+
+# Share of events per sport - roughly how a community rec platform skews
+SPORT_WEIGHTS = {
+    "Basketball": 28, "Soccer": 20, "Football": 13, "Pickleball": 11, "Tennis": 9,
+    "Volleyball": 7, "Baseball": 6, "Hockey": 4, "Other": 2,
+}
+# (pattern, share of series, days between occurrences)
+RECURRENCE = [("weekly", 60, 7), ("biweekly", 20, 14), ("monthly", 15, 30), ("daily", 5, 1)]
+
+VENUE_PLACES = ["Riverside", "Downtown", "North", "South", "Campus", "Community", "Lakeside", "Hillcrest",
+                "Eastside", "Westfield", "Harbor", "Central", "Oak Park", "Maple", "Union", "Summit"]
+VENUE_KINDS = ["Arena", "Park", "Gym", "Courts", "Field", "Center", "Rec Hall", "Fieldhouse", "Dome", "Complex"]
+NAME_WORDS = ["league", "pickup", "final", "tournament", "practice", "scrimmage", "clinic", "showcase",
+              "open", "classic", "cup", "ladder", "social", "youth", "masters", "rookie"]
+DESCRIPTIONS = ["All levels welcome", "Bring your own gear", "Intermediate players", "Competitive play",
+                "Beginner friendly", "Registration required", "Drop-in session", "Family event"]
+
+# Share of events that belong to a recurring series of SERIES_LENGTH occurrences
+RECURRING_SHARE = 0.15
+SERIES_LENGTH = (4, 12)
+HOME_VENUES = 5
+# Chance an event books one of the user's home venues rather than any venue
+HOME_VENUE_SHARE = 0.8
+# Pareto shape of events per user: ~1.16 gives the 80/20 split
+USER_SKEW = 1.16
+VENUE_SKEW = 1.1
+
+DATASET_PASSWORD = "dataset-password-123"
+
+
+def _uuid(rng):
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _anchor(value=None):
+    """Midnight UTC of `value` (a date or YYYY-MM-DD), default today; the dataset's "now" """
+    if isinstance(value, str):
+        value = date.fromisoformat(value)
+    return datetime.combine(value or datetime.now(timezone.utc).date(), dt_time(), tzinfo=timezone.utc)
+
+
+# ---------------------------------------------------------------------------
+# Generators
+# ---------------------------------------------------------------------------
+
+def user_ids(seed, count):
+    """Deterministic user ids, for file output; push uses the stand-in's own"""
+    rng = random.Random(f"{seed}:users")
+    return [_uuid(rng) for _ in range(count)]
+
+
+def event_counts(seed, users, total):
+    """
+    Events per user: shares of `total` that add up exactly, in random order.
+    Shares come from the Pareto Lorenz curve - the top fraction p of users own
+    p ** (1 - 1 / USER_SKEW) of the events - so the split holds at any user
+    count, where sampled Pareto weights undershoot it until the tail is seen.
+    """
+    rng = random.Random(f"{seed}:counts")
+    exponent = 1 - 1 / USER_SKEW
+    weights = [((i + 1) / users) ** exponent - (i / users) ** exponent for i in range(users)]
+    rng.shuffle(weights)
+    scale = total / sum(weights)
+    counts = [int(w * scale) for w in weights]
+    # Largest remainders get the events lost to rounding
+    by_remainder = sorted(range(users), key=lambda i: weights[i] * scale - counts[i], reverse=True)
+    for i in by_remainder[:total - sum(counts)]:
+        counts[i] += 1
+    return counts
+
+
+def venue_pool(seed, count, anchor):
+    """(id, name, created_at) for `count` venues with unique names, most popular first"""
+    rng = random.Random(f"{seed}:venues")
+    names = (f"{place} {kind}" for place, kind in itertools.product(VENUE_PLACES, VENUE_KINDS))
+    pool = []
+    for i in range(count):
+        name = next(names, None) or f"{rng.choice(VENUE_PLACES)} {rng.choice(VENUE_KINDS)} {i + 1}"
+        pool.append((_uuid(rng), name, anchor - timedelta(days=rng.uniform(30, 720))))
+    return pool
+
+
+class _Weighted:
+    """rng.choices with precomputed cumulative weights - O(log n) per draw"""
+
+    def __init__(self, items, weights):
+        self.items = list(items)
+        self.cumulative = list(itertools.accumulate(weights))
+
+    def draw(self, rng):
+        return self.items[bisect.bisect(self.cumulative, rng.random() * self.cumulative[-1])]
+
+
+def _starts_at(rng, anchor):
+    """Mostly the coming weeks, a tail into the past year; evenings and weekends weigh more"""
+    while True:
+        if rng.random() < 0.7:
+            day = int(rng.expovariate(1 / 14)) % 120
+        else:
+            day = -1 - int(rng.expovariate(1 / 60)) % 365
+        when = anchor + timedelta(days=day)
+        # Weekends are 2.5x as likely as a weekday
+        if when.weekday() >= 5 or rng.random() < 0.4:
+            break
+    hour = rng.choices((7, 9, 12, 17, 18, 19, 20), weights=(1, 2, 2, 4, 6, 6, 3))[0]
+    return when + timedelta(hours=hour, minutes=15 * rng.randrange(4))
+
+
+def user_events(seed, index, user_id, count, venues, anchor):
+    """
+    Events of one user as (event row, [venue ids]): one-off events and recurring
+    series, a series' parent before its occurrences. Seeded by the user's index,
+    so the stream is the same whatever id the user has.
+    """
+    rng = random.Random(f"{seed}:user:{index}")
+    sports = _Weighted(SPORT_WEIGHTS, SPORT_WEIGHTS.values())
+    home = [venues.draw(rng) for _ in range(HOME_VENUES)]
+    patterns = _Weighted(RECURRENCE, [share for _, share, _ in RECURRENCE])
+    mean_length = sum(SERIES_LENGTH) / 2
+    series_chance = RECURRING_SHARE / (RECURRING_SHARE + (1 - RECURRING_SHARE) * mean_length)
+
+    remaining = count
+    while remaining > 0:
+        sport = sports.draw(rng)
+        words = rng.sample(NAME_WORDS, 2)
+        picks = [rng.choice(home) if rng.random() < HOME_VENUE_SHARE else venues.draw(rng)
+                 for _ in range(rng.choices((1, 2, 3), weights=(6, 3, 1))[0])]
+        event_venues = list(dict.fromkeys(picks))
+        starts_at = _starts_at(rng, anchor)
+        row = {
+            "id": _uuid(rng),
+            "user_id": user_id,
+            "name": f"{words[0].title()} {sport} {words[1]}",
+            "sport": sport,
+            "starts_at": starts_at,
+            "description": rng.choice(DESCRIPTIONS) if rng.random() < 0.7 else None,
+            "location": rng.choice(VENUE_PLACES) if rng.random() < 0.9 else None,
+            "is_recurring": False,
+            "recurrence_pattern": None,
+            "parent_event_id": None,
+            "created_at": min(starts_at, anchor) - timedelta(days=rng.uniform(1, 60)),
+        }
+        occurrences = rng.randint(*SERIES_LENGTH) if remaining > 1 and rng.random() < series_chance else 1
+        occurrences = min(occurrences, remaining)
+        if occurrences > 1:
+            pattern, _, step = patterns.draw(rng)
+            row.update(is_recurring=True, recurrence_pattern=pattern)
+        yield row, event_venues
+        for n in range(1, occurrences):
+            yield {**row, "id": _uuid(rng), "is_recurring": False, "recurrence_pattern": None,
+                   "parent_event_id": row["id"], "starts_at": starts_at + timedelta(days=step * n)}, event_venues
+        remaining -= occurrences
+
+
+def rows(users, events_per_user, seed=1, venues=2000, anchor=None):
+    """
+    (table, row) for the whole dataset in foreign-key order: every venue, then
+    each user's events, each followed by its event_venues links.
+    `users` is a count or a list of existing user ids.
+    """
+    anchor = _anchor(anchor)
+    ids = user_ids(seed, users) if isinstance(users, int) else list(users)
+    pool = venue_pool(seed, venues, anchor)
+    for venue_id, name, created_at in pool:
+        yield "venues", {"id": venue_id, "name": name, "created_at": created_at}
+
+    ranks = range(1, len(pool) + 1)
+    popularity = _Weighted([venue_id for venue_id, _, _ in pool], [1 / r ** VENUE_SKEW for r in ranks])
+    for index, (user_id, count) in enumerate(zip(ids, event_counts(seed, len(ids), len(ids) * events_per_user))):
+        for event, venue_ids in user_events(seed, index, user_id, count, popularity, anchor):
+            yield "events", event
+            for venue_id in venue_ids:
+                yield "event_venues", {"event_id": event["id"], "venue_id": venue_id}
+
+
+def seeder_events(count, seed=1, anchor=None):
+    """
+    One user's worth of events, series included, as SupabaseSeeder.bulk_insert_events()
+    takes them: venue names instead of ids, no user id (the seeder sets its own).
+    Ids repeat for the same seed, so use another seed to insert twice into one database.
+    """
+    anchor = _anchor(anchor)
+    pool = venue_pool(seed, 200, anchor)
+    names = {venue_id: name for venue_id, name, _ in pool}
+    popularity = _Weighted(names, [1 / r ** VENUE_SKEW for r in range(1, len(pool) + 1)])
+    for event, venue_ids in user_events(seed, 0, None, count, popularity, anchor):
+        yield {
+            **{c: event[c] for c in TABLES["events"] if c not in ("user_id", "created_at")},
+            "venues": [names[v] for v in venue_ids],
+        }
+
+
+# ---------------------------------------------------------------------------
+# Sinks
+# ---------------------------------------------------------------------------
+
+def _copy_value(value):
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return (str(value).replace("\\", "\\\\").replace("\t", "\\t")
+            .replace("\n", "\\n").replace("\r", "\\r"))
+
+
+def _csv_value(value):
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _load_sql(fmt, user_file, counts, meta):
+    """psql script loading the files in foreign-key order, users included"""
+    options = "(FORMAT csv, HEADER true)" if fmt == "csv" else "(FORMAT text)"
+    ext = "csv" if fmt == "csv" else "copy"
+    lines = [
+        f"-- Generated by qa-testing/dataset.py: {meta}",
+        f"-- {', '.join(f'{n} {t}' for t, n in counts.items())}",
+        "-- Load into an empty schema from this directory:  psql \"$DATABASE_URL\" -f load.sql",
+        "BEGIN;",
+        "CREATE TEMP TABLE dataset_users (id UUID, email TEXT) ON COMMIT DROP;",
+        f"\\copy dataset_users FROM '{user_file}' {options}",
+        "INSERT INTO auth.users (id, email, aud, role, created_at, updated_at)",
+        "  SELECT id, email, 'authenticated', 'authenticated', NOW(), NOW() FROM dataset_users",
+        "  ON CONFLICT (id) DO NOTHING;",
+    ]
+    lines += [f"\\copy {table} ({', '.join(TABLES[table])}) FROM '{table}.{ext}' {options}" for table in TABLE_ORDER]
+    lines.append("COMMIT;")
+    return "\n".join(lines) + "\n"
+
+
+def write_files(stream, directory, fmt="copy", users=(), meta=""):
+    """
+    Write `stream` to one file per table (PostgreSQL COPY text format, or CSV
+    with a header) plus users and load.sql. Returns rows written per table.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    ext = "csv" if fmt == "csv" else "copy"
+    counts = dict.fromkeys(TABLE_ORDER, 0)
+    files = {table: open(directory / f"{table}.{ext}", "w", encoding="utf-8", newline="") for table in TABLE_ORDER}
+    try:
+        if fmt == "csv":
+            writers = {table: csv.writer(f) for table, f in files.items()}
+            for table, writer in writers.items():
+                writer.writerow(TABLES[table])
+            for table, row in stream:
+                writers[table].writerow([_csv_value(row[c]) for c in TABLES[table]])
+                counts[table] += 1
+        else:
+            for table, row in stream:
+                files[table].write("\t".join(_copy_value(row[c]) for c in TABLES[table]) + "\n")
+                counts[table] += 1
+    finally:
+        for f in files.values():
+            f.close()
+
+    user_file = f"users.{ext}"
+    with open(directory / user_file, "w", encoding="utf-8", newline="") as f:
+        if fmt == "csv":
+            writer = csv.writer(f)
+            writer.writerow(("id", "email"))
+            writer.writerows((user_id, f"dataset-{i}@example.com") for i, user_id in enumerate(users))
+        else:
+            f.writelines(f"{user_id}\tdataset-{i}@example.com\n" for i, user_id in enumerate(users))
+    (directory / "load.sql").write_text(_load_sql(fmt, user_file, counts, meta), encoding="utf-8")
+    return counts
+
+
+def create_users(supabase_url, count, password=DATASET_PASSWORD):
+    """Create (or look up) dataset-<i>@example.com on the stand-in; returns their ids in order"""
+    ids = []
+    with requests.Session() as http:
+        for i in range(count):
+            response = http.post(f"{supabase_url}/__admin/users",
+                                 json={"email": f"dataset-{i}@example.com", "password": password}, timeout=10)
+            response.raise_for_status()
+            ids.append(response.json()["id"])
+    return ids
+
+
+def push(stream, supabase_url, key=None, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    POST `stream` to PostgREST in batches of `batch_size` rows per table,
+    with the service role key (RLS would only let each user insert their own
+    rows). Tables are flushed in foreign-key order. Returns rows per table.
+    """
+    key = key or service_role_key()
+    http = requests.Session()
+    http.headers.update({"apikey": key, "Authorization": f"Bearer {key}", "Prefer": "return=minimal"})
+    buffers = {table: [] for table in TABLE_ORDER}
+    counts = dict.fromkeys(TABLE_ORDER, 0)
+
+    def flush(upto):
+        for table in TABLE_ORDER[:TABLE_ORDER.index(upto) + 1]:
+            if not buffers[table]:
+                continue
+            payload = [{c: row[c].isoformat() if isinstance(row[c], datetime) else row[c] for c in TABLES[table]}
+                       for row in buffers[table]]
+            response = http.post(f"{supabase_url}/rest/v1/{table}", json=payload, timeout=120)
+            if response.status_code >= 400:
+                raise RuntimeError(f"POST {table} failed ({response.status_code}): {response.text[:300]}")
+            counts[table] += len(buffers[table])
+            buffers[table].clear()
+
+    try:
+        for table, row in stream:
+            buffers[table].append(row)
+            if len(buffers[table]) >= batch_size:
+                flush(table)
+        flush(TABLE_ORDER[-1])
+    finally:
+        http.close()
+    return counts
+
+
+def _progress(stream, every=100_000):
+    """Pass `stream` through, printing the row rate every `every` rows"""
+    started = time.perf_counter()
+    n = 0
+    for n, item in enumerate(stream, 1):
+        if n % every == 0:
+            print(f"   {n:,} rows ({n / (time.perf_counter() - started):,.0f}/s)")
+        yield item
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stream a synthetic events/venues dataset")
+    parser.add_argument("sink", choices=("copy", "csv", "push"))
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--events-per-user", type=int, default=100, help="Average; the split is skewed")
+    parser.add_argument("--venues", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--anchor", default=None, help="The dataset's today, YYYY-MM-DD (default: today)")
+    parser.add_argument("--out", default="reports/dataset", help="Directory for copy/csv")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Rows per POST for push")
+    args = parser.parse_args()
+
+    anchor = _anchor(args.anchor)
+    meta = (f"seed={args.seed} users={args.users} events_per_user={args.events_per_user} "
+            f"venues={args.venues} anchor={anchor.date()}")
+    print(f"🌱 {args.users * args.events_per_user:,} events for {args.users} users, {args.venues} venues ({meta})")
+    started = time.perf_counter()
+
+    if args.sink == "push":
+        port = int(os.getenv("LOCAL_SUPABASE_PORT", LOCAL_SUPABASE_DEFAULT_PORT))
+        if not port_open(port):
+            print(f"❌ No stand-in on port {port} - start one with: python3 local_supabase.py --port {port}")
+            sys.exit(1)
+        supabase_url = f"http://127.0.0.1:{port}"
+        ids = create_users(supabase_url, args.users)
+        stream = rows(ids, args.events_per_user, args.seed, args.venues, anchor)
+        counts = push(_progress(stream), supabase_url, batch_size=args.batch_size)
+        target = f"{supabase_url} (users dataset-<i>@example.com / {DATASET_PASSWORD})"
+    else:
+        ids = user_ids(args.seed, args.users)
+        stream = rows(ids, args.events_per_user, args.seed, args.venues, anchor)
+        counts = write_files(_progress(stream), args.out, args.sink, ids, meta)
+        target = f"{args.out}/ (load with: psql -f load.sql)"
+
+    seconds = time.perf_counter() - started
+    total = sum(counts.values())
+    print(f"✓ {', '.join(f'{n:,} {t}' for t, n in counts.items())} in {seconds:.1f}s "
+          f"({total / seconds:,.0f} rows/s) -> {target}")
+
+
+if __name__ == "__main__":
+    main()
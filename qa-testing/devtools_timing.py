@@ -0,0 +1,278 @@
+"""
+Per-test network and rendering timings from the Chrome DevTools Protocol
+Turns on Chrome performance logging, collects every request (with TTFB and
+server-action POST durations), paint/LCP/long-task entries and CDP Performance
+metrics for each test that uses the browser, and attaches a waterfall to the
+pytest-html report.
+
+Cost per test is one performance-log drain, one execute_script and two
+Performance.getMetrics calls, so it stays on in CI. Set DEVTOOLS_TIMING=false
+to turn it off.
+"""
+import html
+import json
+import os
+from pathlib import Path
+from urllib.parse import urlparse
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from waits import WAIT_LOG
+
+try:
+    from pytest_html import extras as html_extras
+except ImportError:  # report attachment is skipped without pytest-html
+    html_extras = None
+
+
+ENABLED = os.getenv("DEVTOOLS_TIMING", "true").lower() == "true"
+TIMINGS_PATH = Path(__file__).parent / "reports" / "devtools-timing.jsonl"
+
+# Requests shown in the report waterfall (slowest first when trimmed)
+WATERFALL_ROWS = 40
+
+# Metrics from Performance.getMetrics reported as per-test deltas
+CDP_METRICS = ("TaskDuration", "ScriptDuration", "LayoutDuration", "RecalcStyleDuration")
+
+timing_key = pytest.StashKey()
+
+# Runs in every new document: records navigation TTFB, paints, LCP and long tasks.
+# Entries go to sessionStorage so they survive full navigations within the test.
+VITALS_JS = """
+(() => {
+  const KEY = '__qaVitals';
+  const page = {url: location.href, timeOrigin: performance.timeOrigin,
+                ttfb: null, fcp: null, lcp: null, longTasks: []};
+  const save = () => {
+    try {
+      const pages = JSON.parse(sessionStorage.getItem(KEY) || '[]')
+        .filter(p => p.timeOrigin !== page.timeOrigin);
+      pages.push(page);
+      sessionStorage.setItem(KEY, JSON.stringify(pages.slice(-20)));
+    } catch (e) {}
+  };
+  const observe = (type, onEntry) => {
+    try {
+      new PerformanceObserver(list => { list.getEntries().forEach(onEntry); save(); })
+        .observe({type: type, buffered: true});
+    } catch (e) {}
+  };
+  observe('navigation', e => { page.ttfb = Math.round(e.responseStart); });
+  observe('paint', e => { if (e.name === 'first-contentful-paint') page.fcp = Math.round(e.startTime); });
+  observe('largest-contentful-paint', e => { page.lcp = Math.round(e.startTime); });
+  observe('longtask', e => { page.longTasks.push([Math.round(e.startTime), Math.round(e.duration)]); });
+})();
+"""
+
+_READ_VITALS_JS = """
+try {
+  const pages = JSON.parse(sessionStorage.getItem('__qaVitals') || '[]');
+  sessionStorage.removeItem('__qaVitals');
+  return pages;
+} catch (e) { return []; }
+"""
+
+
+def configure_options(options):
+    """Enable the Chrome performance log (network events) on driver options"""
+    if not ENABLED:
+        return
+    prefs = dict(options.capabilities.get("goog:loggingPrefs", {}))
+    prefs["performance"] = "ALL"
+    options.set_capability("goog:loggingPrefs", prefs)
+    options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+
+
+def _install(driver):
+    """Register the vitals script and the Performance domain once per browser"""
+    if getattr(driver, "_qa_devtools_installed", False):
+        return
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": VITALS_JS})
+    driver.execute_cdp_cmd("Performance.enable", {})
+    driver._qa_devtools_installed = True
+
+
+def _metrics(driver):
+    result = driver.execute_cdp_cmd("Performance.getMetrics", {})
+    return {m["name"]: m["value"] for m in result.get("metrics", []) if m["name"] in CDP_METRICS}
+
+
+def start(driver):
+    """Begin a measurement window: drop buffered log entries and snapshot metrics"""
+    _install(driver)
+    driver.get_log("performance")
+    driver.execute_script("try { sessionStorage.removeItem('__qaVitals'); } catch (e) {}")
+    return _metrics(driver)
+
+
+def network_requests(log_entries):
+    """
+    Fold Network.* events from the performance log into one record per request:
+    url, method, type, status, start/end (seconds, CDP clock), ttfb_ms, bytes,
+    server_action (POST carrying a Next-Action header) and error.
+    """
+    requests = {}
+    for entry in log_entries:
+        message = json.loads(entry["message"])["message"]
+        method = message.get("method", "")
+        params = message.get("params", {})
+        request_id = params.get("requestId")
+        if not method.startswith("Network.") or request_id is None:
+            continue
+
+        if method == "Network.requestWillBeSent":
+            request = params["request"]
+            headers = {k.lower() for k in request.get("headers", {})}
+            requests[request_id] = {
+                "url": request["url"],
+                "method": request["method"],
+                "type": params.get("type"),
+                "start": params["timestamp"],
+                "wall_time": params.get("wallTime"),
+                "end": None,
+                "status": None,
+                "ttfb_ms": None,
+                "bytes": 0,
+                "server_action": request["method"] == "POST" and "next-action" in headers,
+                "error": None,
+            }
+            continue
+
+        record = requests.get(request_id)
+        if record is None:
+            continue
+        if method == "Network.responseReceived":
+            response = params["response"]
+            record["status"] = response.get("status")
+            timing = response.get("timing")
+            if timing and timing.get("receiveHeadersEnd", -1) >= 0:
+                record["ttfb_ms"] = round(timing["receiveHeadersEnd"] - max(timing.get("sendEnd", 0), 0), 1)
+        elif method == "Network.loadingFinished":
+            record["end"] = params["timestamp"]
+            record["bytes"] = params.get("encodedDataLength", 0)
+        elif method == "Network.loadingFailed":
+            record["end"] = params["timestamp"]
+            record["error"] = params.get("errorText")
+
+    ordered = sorted(requests.values(), key=lambda r: r["start"])
+    origin = ordered[0]["start"] if ordered else 0
+    for record in ordered:
+        record["offset_ms"] = round((record["start"] - origin) * 1000, 1)
+        record["duration_ms"] = round((record["end"] - record["start"]) * 1000, 1) if record["end"] else None
+    return ordered
+
+
+def collect(driver, metrics_before, test_id=None):
+    """Close the measurement window and return the timing summary for one test"""
+    requests = network_requests(driver.get_log("performance"))
+    pages = driver.execute_script(_READ_VITALS_JS) or []
+    metrics_after = _metrics(driver)
+
+    actions = [r for r in requests if r["server_action"]]
+    documents = [r for r in requests if r["type"] == "Document"]
+    long_tasks = [task for page in pages for task in page.get("longTasks", [])]
+    return {
+        "test": test_id,
+        "requests": requests,
+        "pages": pages,
+        "summary": {
+            "requests": len(requests),
+            "failed_requests": sum(1 for r in requests if r["error"] or (r["status"] or 0) >= 400),
+            "transfer_bytes": sum(r["bytes"] for r in requests),
+            "document_ttfb_ms": [r["ttfb_ms"] for r in documents],
+            "server_action_ms": [r["duration_ms"] for r in actions],
+            "lcp_ms": [p["lcp"] for p in pages if p.get("lcp") is not None],
+            "long_tasks": len(long_tasks),
+            "long_task_ms": sum(duration for _, duration in long_tasks),
+            "waits_s": round(WAIT_LOG.total(test_id), 3) if test_id else None,
+            **{
+                f"{name}_ms": round((metrics_after.get(name, 0) - metrics_before.get(name, 0)) * 1000, 1)
+                for name in CDP_METRICS
+            },
+        },
+    }
+
+
+def render_waterfall(timing):
+    """Compact HTML waterfall plus the headline numbers for the pytest-html report"""
+    requests = [r for r in timing["requests"] if r["duration_ms"] is not None]
+    if len(requests) > WATERFALL_ROWS:
+        keep = sorted(requests, key=lambda r: r["duration_ms"], reverse=True)[:WATERFALL_ROWS]
+        requests = sorted(keep, key=lambda r: r["offset_ms"])
+    span = max((r["offset_ms"] + r["duration_ms"] for r in requests), default=1) or 1
+
+    rows = []
+    for r in requests:
+        path = urlparse(r["url"]).path or r["url"]
+        label = html.escape((path[:60] + "…") if len(path) > 60 else path)
+        color = "#e8a33d" if r["server_action"] else ("#5b8def" if r["type"] == "Document" else "#9bb4d6")
+        left = 100 * r["offset_ms"] / span
+        width = max(100 * r["duration_ms"] / span, 0.3)
+        rows.append(
+            f"<tr><td>{html.escape(r['method'])}</td><td title='{html.escape(r['url'])}'>{label}</td>"
+            f"<td>{r['status'] or r['error'] or ''}</td><td>{r['ttfb_ms'] or ''}</td><td>{r['duration_ms']}</td>"
+            f"<td style='width:40%'><div style='margin-left:{left:.2f}%;width:{width:.2f}%;"
+            f"background:{color};height:10px'></div></td></tr>"
+        )
+
+    summary = timing["summary"]
+    headline = " &middot; ".join(
+        f"{html.escape(key)}: {html.escape(str(value))}" for key, value in summary.items()
+        if value not in (None, [], 0)
+    )
+    return (
+        "<div class='devtools-timing'><p><strong>DevTools timing</strong> "
+        "(<span style='color:#e8a33d'>server action</span>, <span style='color:#5b8def'>document</span>)<br>"
+        f"{headline}</p>"
+        "<table style='width:100%;font-size:11px'><tr><th>method</th><th>path</th><th>status</th>"
+        "<th>ttfb ms</th><th>ms</th><th>waterfall</th></tr>"
+        + "".join(rows) + "</table></div>"
+    )
+
+
+@pytest.fixture(autouse=True)
+def _devtools_timing(request):
+    """Measure every test that drives the browser"""
+    if not ENABLED or "driver" not in request.fixturenames:
+        yield
+        return
+    driver = request.getfixturevalue("driver")
+    try:
+        metrics_before = start(driver)
+    except WebDriverException:
+        yield
+        return
+    yield
+    try:
+        timing = collect(driver, metrics_before, request.node.nodeid)
+    except WebDriverException:
+        return
+    request.node.stash[timing_key] = timing
+    TIMINGS_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(TIMINGS_PATH, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"test": timing["test"], **timing["summary"]}) + "\n")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    Attach the waterfall to the teardown report. Timings are collected in
+    fixture teardown, so this is the first report made after they exist;
+    pytest-html merges every phase's extras into the test's row, and xdist
+    sends this report to the controller with its extras.
+    """
+    outcome = yield
+    report = outcome.get_result()
+    if report.when != "teardown":
+        return
+    timing = item.stash.get(timing_key, None)
+    if timing is None or html_extras is None:
+        return
+    report.extras = getattr(report, "extras", []) + [html_extras.html(render_waterfall(timing))]
+
+
+def pytest_sessionstart(session):
+    """Remove the timings file left by the previous run"""
+    if ENABLED and not hasattr(session.config, "workerinput"):
+        TIMINGS_PATH.unlink(missing_ok=True)
@@ -0,0 +1,224 @@
+"""
+Offline chromedriver resolution
+Fingerprints the installed Chrome, maps its major version to a validated
+chromedriver in a local manifest (.drivers/manifest.json) and returns that path
+without touching the network. webdriver-manager (which calls the Chrome for
+Testing API on every install()) is only used when no local driver matches,
+and never with DRIVER_OFFLINE=true.
+
+Show what would be used:
+    python driver_resolver.py
+"""
+import glob
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from helpers import write_json
+
+
+MANIFEST_PATH = Path(__file__).parent / ".drivers" / "manifest.json"
+
+# Fail instead of downloading when no cached driver matches the installed Chrome
+OFFLINE = os.getenv("DRIVER_OFFLINE", "false").lower() == "true"
+
+_CHROME_CANDIDATES = (
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+    r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+)
+
+_DRIVER_NAME = "chromedriver.exe" if sys.platform == "win32" else "chromedriver"
+
+# Drivers already downloaded by webdriver-manager or Selenium Manager
+_DRIVER_CACHES = (
+    Path.home() / ".wdm" / "drivers" / "chromedriver",
+    Path.home() / ".cache" / "selenium" / "chromedriver",
+)
+
+# Chrome flags that skip first-run work and background network traffic on startup
+FAST_START_ARGS = (
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-sync",
+)
+
+_VERSION_RE = re.compile(r"(\d+)\.\d+\.\d+(?:\.\d+)?")
+
+
+class DriverResolutionError(RuntimeError):
+    """No usable chromedriver for the installed Chrome"""
+
+
+def _load_manifest(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    manifest.setdefault("chrome", {})
+    manifest.setdefault("drivers", {})
+    return manifest
+
+
+def _fingerprint(path):
+    """Cheap identity of a binary: resolved path, size and mtime"""
+    real = os.path.realpath(path)
+    stat = os.stat(real)
+    return f"{real}|{stat.st_size}|{int(stat.st_mtime)}"
+
+
+def _version_of(binary):
+    """Full version string printed by `binary --version`, or None"""
+    try:
+        output = subprocess.run(
+            [binary, "--version"], capture_output=True, text=True, timeout=15,
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = _VERSION_RE.search(output)
+    return match.group(0) if match else None
+
+
+def find_chrome():
+    """Chrome binary from CHROME_BIN, PATH or the usual install locations"""
+    chrome_bin = os.getenv("CHROME_BIN")
+    if chrome_bin and os.path.isfile(chrome_bin):
+        return chrome_bin
+    for candidate in _CHROME_CANDIDATES:
+        path = candidate if os.path.isabs(candidate) else shutil.which(candidate)
+        if path and os.path.isfile(path):
+            return path
+    return None
+
+
+def chrome_version(binary, manifest):
+    """Version of `binary`, read from the manifest while the binary is unchanged"""
+    fingerprint = _fingerprint(binary)
+    cached = manifest["chrome"].get(fingerprint)
+    if cached:
+        return cached
+    version = _version_of(binary)
+    if version:
+        manifest["chrome"] = {fingerprint: version}
+    return version
+
+
+def _executable_in(path):
+    """
+    The chromedriver executable for a path returned by webdriver-manager, which
+    sometimes points at THIRD_PARTY_NOTICES.chromedriver or LICENSE instead
+    """
+    if os.path.basename(path) == _DRIVER_NAME and os.path.isfile(path):
+        return path
+    directory = path if os.path.isdir(path) else os.path.dirname(path)
+    executable = os.path.join(directory, _DRIVER_NAME)
+    return executable if os.path.isfile(executable) else None
+
+
+def validate_driver(path, major):
+    """Driver version if `path` runs and matches Chrome's major version, else None"""
+    if not path or not os.path.isfile(path):
+        return None
+    if not os.access(path, os.X_OK):
+        try:
+            os.chmod(path, 0o755)
+        except PermissionError:
+            return None
+    version = _version_of(path)
+    if version is None or (major and version.split(".")[0] != major):
+        return None
+    return version
+
+
+def _local_candidates():
+    """Drivers available without a download, newest cache entries first"""
+    on_path = shutil.which(_DRIVER_NAME)
+    if on_path:
+        yield on_path
+    for cache in _DRIVER_CACHES:
+        found = glob.glob(str(cache / "**" / _DRIVER_NAME), recursive=True)
+        yield from sorted(found, key=os.path.getmtime, reverse=True)
+
+
+def _download():
+    from webdriver_manager.chrome import ChromeDriverManager
+    return _executable_in(ChromeDriverManager().install())
+
+
+def resolve(offline=OFFLINE, manifest_path=MANIFEST_PATH):
+    """
+    Path to a chromedriver matching the installed Chrome.
+    CHROMEDRIVER_PATH wins when set (CI). Otherwise the manifest answers with two
+    stat() calls; only a cache miss runs `--version` on candidates, and only a
+    miss with no local candidate downloads.
+    """
+    driver_path = os.getenv("CHROMEDRIVER_PATH")
+    if driver_path and os.path.isfile(driver_path):
+        return driver_path
+
+    manifest = _load_manifest(manifest_path)
+    known_chrome = dict(manifest["chrome"])
+    chrome = find_chrome()
+    version = chrome_version(chrome, manifest) if chrome else None
+    major = version.split(".")[0] if version else None
+    key = major or "unknown"
+
+    entry = manifest["drivers"].get(key)
+    if entry:
+        try:
+            if _fingerprint(entry["path"]) == entry["fingerprint"]:
+                # A Chrome update within the same major keeps the driver but not
+                # the version cache; save it so the next run skips `--version`
+                if manifest["chrome"] != known_chrome:
+                    write_json(manifest_path, manifest, indent=2)
+                return entry["path"]
+        except OSError:
+            pass
+
+    sources = [("local", candidate) for candidate in _local_candidates()]
+    if not offline:
+        sources.append(("webdriver-manager", None))
+    for source, candidate in sources:
+        if candidate is None:
+            print(f"⚠️ No cached chromedriver for Chrome {version or '(not found)'} - downloading")
+            candidate = _download()
+        driver_version = validate_driver(candidate, major)
+        if driver_version:
+            manifest["drivers"][key] = {
+                "path": os.path.realpath(candidate),
+                "fingerprint": _fingerprint(candidate),
+                "driver_version": driver_version,
+                "chrome_version": version,
+                "source": source,
+                "validated_at": time.time(),
+            }
+            write_json(manifest_path, manifest, indent=2)
+            return manifest["drivers"][key]["path"]
+
+    raise DriverResolutionError(
+        f"No chromedriver matches Chrome {version or '(not found)'}"
+        + (" and DRIVER_OFFLINE=true forbids downloading one" if offline else "")
+        + ". Set CHROMEDRIVER_PATH or put a matching chromedriver on PATH."
+    )
+
+
+if __name__ == "__main__":
+    started = time.perf_counter()
+    try:
+        path = resolve()
+    except DriverResolutionError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    print(f"✓ {path} ({(time.perf_counter() - started) * 1000:.1f}ms)")
@@ -0,0 +1,300 @@
+"""
+Targeted reruns and quarantine of flaky tests
+A test that fails in call, or in one of its function-scoped fixtures, is rerun
+on the spot, up to RERUNS times. Function-scoped fixtures are rebuilt, so the
+rerun gets a freshly reset browser context (and a re-injected login) instead of
+the whole CI job being retried. A session, module or class fixture that fails is
+reported once and not rerun: pytest caches its error, so every rerun would fail
+the same way (and app checks like verify_app_running would wait out their probe
+again for each attempt).
+Failed attempts are reported as "rerun" and kept in the results store
+(results.py) next to the final outcome.
+
+A flaky run is one where a test failed and then passed on a rerun. Tests whose
+flaky runs reach FLAKY_THRESHOLD of their last FLAKY_WINDOW runs (and at least
+FLAKY_MIN_RUNS of them) are quarantined. So is anything marked
+@pytest.mark.quarantine. The blocking lane deselects quarantined tests
+(QUARANTINE=skip, the default). The non-blocking CI lane runs only them
+(QUARANTINE=only), so they keep building the history that releases them.
+
+    python flaky.py report        # flake rates, quarantine, rerun cost, full-job retry waste
+    python flaky.py list          # quarantined test ids, one per line
+"""
+import argparse
+import os
+import re
+import sqlite3
+from contextlib import closing
+
+import pytest
+from _pytest.runner import runtestprotocol
+
+from results import DB_PATH, connect
+
+
+RERUNS = int(os.getenv("RERUNS", "2"))
+QUARANTINE = os.getenv("QUARANTINE", "skip")
+FLAKY_THRESHOLD = float(os.getenv("FLAKY_THRESHOLD", "0.1"))
+FLAKY_WINDOW = int(os.getenv("FLAKY_WINDOW", "20"))
+FLAKY_MIN_RUNS = int(os.getenv("FLAKY_MIN_RUNS", "2"))
+
+# CI run ids are "<workflow run>-<attempt>" (QA_RUN_ID in qa-tests.yml)
+_CI_RUN_ID = re.compile(r"(\d+)-(\d+)")
+
+# Attempt number per test in this process; the protocol loop sets it before each attempt
+_attempts = {}
+
+# Controller-side tallies for the terminal summary
+_reruns = {}
+_rerun_seconds = 0.0
+_attempt = {}
+_recovered = set()
+_quarantined = []
+
+# Session/module/class fixtures whose last setup raised; pytest re-raises the cached error
+_broken_fixtures = set()
+
+
+# ---------------------------------------------------------------------------
+# History
+# ---------------------------------------------------------------------------
+
+def flake_rates(window=FLAKY_WINDOW, db_path=DB_PATH):
+    """{test: (flaky runs, runs)} over each test's latest `window` runs"""
+    with closing(connect(db_path)) as db:
+        rows = db.execute(
+            "WITH ranked AS ("
+            " SELECT r.test, r.outcome,"
+            "  EXISTS (SELECT 1 FROM reruns x WHERE x.run_id = r.run_id AND x.test = r.test) AS retried,"
+            "  ROW_NUMBER() OVER (PARTITION BY r.test ORDER BY runs.started_at DESC) AS n"
+            " FROM results r JOIN runs USING (run_id)) "
+            "SELECT test, SUM(retried AND outcome = 'passed'), COUNT(*) FROM ranked WHERE n <= ? GROUP BY test",
+            (window,),
+        ).fetchall()
+    return {test: (flaky, runs) for test, flaky, runs in rows}
+
+
+def quarantined(rates, threshold=FLAKY_THRESHOLD, min_runs=FLAKY_MIN_RUNS):
+    """Tests whose flaky runs reach `threshold` of their runs, with at least `min_runs` flaky runs"""
+    return {test for test, (flaky, runs) in rates.items() if flaky >= min_runs and flaky / runs >= threshold}
+
+
+def rerun_cost(runs=50, db_path=DB_PATH):
+    """(failed attempts, seconds) spent on targeted reruns over the latest `runs` runs"""
+    with closing(connect(db_path)) as db:
+        count, seconds = db.execute(
+            "SELECT COUNT(*), SUM(seconds) FROM reruns WHERE run_id IN "
+            "(SELECT run_id FROM runs ORDER BY started_at DESC LIMIT ?)",
+            (runs,),
+        ).fetchone()
+    return count, seconds or 0.0
+
+
+def retry_waste(runs=50, db_path=DB_PATH):
+    """
+    (retried CI runs, seconds) of test time redone by full-job retries over the
+    latest `runs` runs. A test's time in an attempt counts as wasted when a later
+    attempt of the same workflow run ran that test again.
+    """
+    with closing(connect(db_path)) as db:
+        run_ids = [row[0] for row in db.execute(
+            "SELECT run_id FROM runs ORDER BY started_at DESC LIMIT ?", (runs,)
+        )]
+        attempts = {}
+        for run_id in run_ids:
+            match = _CI_RUN_ID.fullmatch(run_id)
+            if match:
+                attempts.setdefault(match[1], []).append((int(match[2]), run_id))
+
+        retried, wasted = 0, 0.0
+        for workflow_run in attempts.values():
+            if len(workflow_run) < 2:
+                continue
+            retried += 1
+            workflow_run.sort()
+            for index, (_, run_id) in enumerate(workflow_run[:-1]):
+                later = [later_id for _, later_id in workflow_run[index + 1:]]
+                placeholders = ",".join("?" * len(later))
+                wasted += db.execute(
+                    f"SELECT COALESCE(SUM(seconds), 0) FROM results WHERE run_id = ? AND test IN "
+                    f"(SELECT test FROM results WHERE run_id IN ({placeholders}))",
+                    (run_id, *later),
+                ).fetchone()[0]
+    return retried, wasted
+
+
+# ---------------------------------------------------------------------------
+# pytest plugin
+# ---------------------------------------------------------------------------
+
+def attempt(item):
+    """1 for the first run of a test, 2 for its first rerun..."""
+    return _attempts.get(item.nodeid, 1)
+
+
+def broad_fixture_failed(item):
+    """A session, module or class fixture of `item` is holding a setup error"""
+    fixturedefs = getattr(item, "_fixtureinfo", None)
+    if fixturedefs is None:
+        return False
+    return any(fixturedef in _broken_fixtures
+               for defs in fixturedefs.name2fixturedefs.values() for fixturedef in defs)
+
+
+def rerun_pending(item, reports):
+    """The attempt that produced `reports` failed in call or a function-scoped fixture and will be rerun"""
+    if attempt(item) > item.config.getoption("reruns"):
+        return False
+    if any(hasattr(report, "wasxfail") for report in reports):
+        return False
+    for report in reports:
+        if report.failed and report.when == "call":
+            return True
+        if report.failed and report.when == "setup":
+            return not broad_fixture_failed(item)
+    return False
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--reruns", type=int, default=RERUNS,
+        help="Rerun a test failing in call or a function-scoped fixture up to this many times (flaky.py)",
+    )
+    parser.addoption(
+        "--quarantine", choices=("skip", "only", "off"), default=QUARANTINE,
+        help="skip: deselect quarantined flaky tests, only: run just them, off: ignore the quarantine",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Split quarantined tests from the rest before sharding (sharding.py) divides what is left"""
+    mode = config.getoption("quarantine")
+    if mode == "off":
+        return
+    try:
+        flagged = quarantined(flake_rates())
+    except sqlite3.Error as e:  # a broken store must not block the suite
+        print(f"\n⚠️ Could not read flake history from {DB_PATH}: {e}")
+        flagged = set()
+    in_quarantine = {item.nodeid for item in items
+                     if item.nodeid in flagged or item.get_closest_marker("quarantine")}
+    keep = [item for item in items if (item.nodeid in in_quarantine) == (mode == "only")]
+    deselected = [item for item in items if (item.nodeid in in_quarantine) != (mode == "only")]
+    if deselected:
+        items[:] = keep
+        config.hook.pytest_deselected(items=deselected)
+    _quarantined[:] = sorted(in_quarantine)
+    if mode == "only":
+        print(f"\n🧪 Quarantine lane: {len(items)} flaky test(s)")
+    elif in_quarantine:
+        print(f"\n🧪 Quarantine: {len(in_quarantine)} flaky test(s) left to the quarantine lane "
+              f"(run them with --quarantine only)")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    """Track which broader-scoped fixtures failed, so their errors are not rerun"""
+    outcome = yield
+    if fixturedef.scope == "function":
+        return
+    if outcome.excinfo is None:
+        _broken_fixtures.discard(fixturedef)
+    else:
+        _broken_fixtures.add(fixturedef)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Run the test; while an attempt fails in call or a function fixture, report it as "rerun" and run it again"""
+    if item.config.getoption("reruns") <= 0:
+        return None
+    item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+    number = 1
+    while True:
+        _attempts[item.nodeid] = number
+        reports = runtestprotocol(item, nextitem=nextitem, log=False)
+        rerun = rerun_pending(item, reports)
+        for report in reports:
+            if rerun and report.failed:
+                report.outcome = "rerun"
+            item.ihook.pytest_runtest_logreport(report=report)
+        if not rerun:
+            break
+        number += 1
+        # Per-attempt state (phase reports, captures, DevTools timing) starts over
+        item.stash = pytest.Stash()
+    _attempts.pop(item.nodeid, None)
+    item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+    return True
+
+
+def pytest_report_teststatus(report):
+    if report.outcome == "rerun":
+        return "rerun", "R", ("RERUN", {"yellow": True})
+
+
+def pytest_runtest_logreport(report):
+    """Count reruns and the tests that recovered; on the controller these arrive from every worker"""
+    global _rerun_seconds
+    seconds, rerun = _attempt.get(report.nodeid, (0.0, False))
+    seconds += report.duration
+    rerun = rerun or report.outcome == "rerun"
+    if report.outcome == "rerun" and report.when != "teardown":
+        _reruns[report.nodeid] = _reruns.get(report.nodeid, 0) + 1
+    if report.when == "call" and report.passed and report.nodeid in _reruns:
+        _recovered.add(report.nodeid)
+    if report.when == "teardown":
+        _attempt.pop(report.nodeid, None)
+        if rerun:
+            _rerun_seconds += seconds
+    else:
+        _attempt[report.nodeid] = (seconds, rerun)
+
+
+def pytest_terminal_summary(terminalreporter):
+    if _reruns:
+        terminalreporter.write_line(
+            f"🔁 Reran {len(_reruns)} test(s) ({sum(_reruns.values())} failed attempts, {_rerun_seconds:.1f}s); "
+            f"{len(_recovered)} passed on a rerun (flaky):"
+        )
+        for test in sorted(_reruns):
+            terminalreporter.write_line(f"   {'flaky ' if test in _recovered else 'failed'} "
+                                        f"{_reruns[test]}x  {test}")
+    if _quarantined and terminalreporter.config.getoption("quarantine") == "skip":
+        terminalreporter.write_line(f"🧪 {len(_quarantined)} quarantined test(s) not run in this lane: "
+                                    + ", ".join(_quarantined))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Flaky-test history, quarantine and rerun cost")
+    parser.add_argument("--window", type=int, default=FLAKY_WINDOW, help="Runs per test for the flake rate")
+    parser.add_argument("--runs", type=int, default=50, help="Recent runs for rerun and retry cost")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("report", help="Flake rates, quarantine, rerun cost and full-job retry waste")
+    commands.add_parser("list", help="Quarantined test ids")
+    args = parser.parse_args()
+
+    rates = flake_rates(args.window)
+    flagged = quarantined(rates)
+    if args.command == "list":
+        for test in sorted(flagged):
+            print(test)
+        return
+
+    flaky = sorted(((flaky / runs, flaky, runs, test) for test, (flaky, runs) in rates.items() if flaky),
+                   reverse=True)
+    print(f"Flaky tests over their last {args.window} runs (quarantine at {FLAKY_THRESHOLD:.0%}, "
+          f"min {FLAKY_MIN_RUNS} flaky runs):")
+    for rate, count, runs, test in flaky:
+        print(f"  {rate:6.1%}  {count:>3}/{runs:<3} {'🧪 ' if test in flagged else '   '}{test}")
+    if not flaky:
+        print("  none")
+    attempts, seconds = rerun_cost(args.runs)
+    retried, wasted = retry_waste(args.runs)
+    print(f"Targeted reruns: {attempts} failed attempts, {seconds:.1f}s of test time over the last {args.runs} runs")
+    print(f"Full-job retries: {retried} CI runs retried, {wasted:.1f}s of test time redone "
+          f"(plus build and app start per retried job)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Small helpers shared by the QA plugins and scripts
+"""
+import json
+import os
+import subprocess
+from contextlib import contextmanager
+from pathlib import Path
+
+
+def git_commit():
+    """Short SHA of the checked-out commit, or None outside a git checkout"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+@contextmanager
+def atomic_write(path, mode="w"):
+    """
+    Open a temporary file next to `path` and move it into place once the block
+    finishes, so readers in other processes never see a half-written file.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, mode, encoding=None if "b" in mode else "utf-8") as f:
+            yield f
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def write_json(path, data, **options):
+    """Write `data` as JSON to `path` atomically; `options` go to json.dump"""
+    with atomic_write(path) as f:
+        json.dump(data, f, **options)
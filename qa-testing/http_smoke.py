@@ -0,0 +1,195 @@
+"""
+Browserless page checks
+Fetches server-rendered Next.js pages over plain HTTP and parses the HTML as it
+streams in, for tests that only check what a page renders or where it
+redirects. Each test gets its own cookie jar on top of one shared connection
+pool, so these tests need no Chrome, finish in milliseconds and run in
+parallel. Anything that clicks, types or depends on client-side JavaScript
+stays in the Selenium suites.
+
+    page = http_client.get("/login")
+    assert page.contains("Welcome back")
+    assert page.first("input", name="email")
+    assert page.first("button", text="Sign In")
+"""
+import codecs
+import os
+import time
+from html.parser import HTMLParser
+from urllib.parse import urljoin, urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "8"))
+TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "10"))
+MAX_REDIRECTS = 5
+CHUNK_SIZE = 16 * 1024
+
+# Elements kept for assertions, with their attributes and text
+TRACKED_TAGS = {
+    "a", "button", "form", "input", "select", "textarea", "label", "option",
+    "h1", "h2", "h3", "title", "meta",
+}
+VOID_TAGS = {"input", "meta", "link", "img", "br", "hr", "source", "area", "base", "col", "embed", "wbr"}
+# Text inside these is code or data, not page content
+SKIPPED_TAGS = {"script", "style", "noscript", "template"}
+
+
+class PageParser(HTMLParser):
+    """
+    Incremental parser: feed() it chunks as they arrive. Collects the page text
+    and the tracked elements, the Next.js streaming redirect
+    (<meta id="__next-page-redirect">) and whether Next rendered its error page.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.text = []
+        self.elements = []
+        self.meta_redirect = None
+        self.next_error = False
+        self._open = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        attrs = {name: value if value is not None else "" for name, value in attrs}
+        if tag == "html" and attrs.get("id") == "__next_error__":
+            self.next_error = True
+        if tag in SKIPPED_TAGS:
+            self._skip_depth += 1
+            return
+        if tag == "meta" and attrs.get("id") == "__next-page-redirect":
+            # content="1;url=/login"
+            _, _, target = attrs.get("content", "").partition("url=")
+            self.meta_redirect = target or None
+        if tag in TRACKED_TAGS:
+            element = {"tag": tag, "attrs": attrs, "text": ""}
+            self.elements.append(element)
+            if tag not in VOID_TAGS:
+                self._open.append(element)
+
+    def handle_endtag(self, tag):
+        if tag in SKIPPED_TAGS:
+            self._skip_depth = max(self._skip_depth - 1, 0)
+            return
+        for index in range(len(self._open) - 1, -1, -1):
+            if self._open[index]["tag"] == tag:
+                del self._open[index:]
+                break
+
+    def handle_data(self, data):
+        if self._skip_depth:
+            return
+        self.text.append(data)
+        for element in self._open:
+            element["text"] += data
+
+
+class HtmlPage:
+    """Final response of a fetch, after redirects: status, URL, redirect chain, text and elements"""
+
+    def __init__(self, url, status, headers, history, parser, elapsed):
+        self.url = url
+        self.path = urlparse(url).path or "/"
+        self.status = status
+        self.headers = headers
+        self.history = history
+        self.elapsed = elapsed
+        self.next_error = parser.next_error
+        self.elements = parser.elements
+        self.text = " ".join(" ".join(parser.text).split())
+
+    def contains(self, text):
+        """`text` appears in the rendered page text (whitespace-normalized)"""
+        return " ".join(text.split()) in self.text
+
+    def find(self, tag, text=None, **attrs):
+        """
+        Elements with this tag whose attributes equal `attrs` and whose text
+        contains `text`. Underscores in attribute names become dashes (data_testid).
+        """
+        wanted = {name.replace("_", "-"): value for name, value in attrs.items()}
+        return [
+            element for element in self.elements
+            if element["tag"] == tag
+            and all(element["attrs"].get(name) == value for name, value in wanted.items())
+            and (text is None or " ".join(text.split()) in " ".join(element["text"].split()))
+        ]
+
+    def first(self, tag, text=None, **attrs):
+        matches = self.find(tag, text, **attrs)
+        return matches[0] if matches else None
+
+    def __repr__(self):
+        return f"<HtmlPage {self.status} {self.url}>"
+
+
+def shared_adapter(pool_size=POOL_SIZE):
+    """One keep-alive connection pool for every client in this process"""
+    return HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+
+
+class HttpClient:
+    """
+    requests.Session with its own cookie jar on a shared adapter. Redirects
+    (HTTP 3xx and the Next.js meta redirect) are followed by hand so each hop is
+    recorded in `page.history` and Set-Cookie on any hop lands in the jar.
+    """
+
+    def __init__(self, base_url, adapter=None, timeout=TIMEOUT):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = adapter or shared_adapter()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["Accept"] = "text/html,application/xhtml+xml"
+        # Every URL fetched, for the test-impact map (impact_map.py)
+        self.visited = []
+
+    @property
+    def cookies(self):
+        return self.session.cookies
+
+    def get(self, path, follow_redirects=True):
+        """Fetch `path` (relative to base_url, or absolute) and parse it while it streams"""
+        # Imported here so pytest can register (and assert-rewrite) it via pytest_plugins first
+        from phase_timing import PHASES
+        with PHASES.span("http"):
+            return self._get(path, follow_redirects)
+
+    def _get(self, path, follow_redirects):
+        url = urljoin(self.base_url + "/", path.lstrip("/")) if not path.startswith("http") else path
+        history = []
+        start = time.perf_counter()
+        for _ in range(MAX_REDIRECTS + 1):
+            self.visited.append(url)
+            response = self.session.get(url, allow_redirects=False, stream=True, timeout=self.timeout)
+            try:
+                if response.is_redirect and follow_redirects:
+                    history.append((response.status_code, url))
+                    url = urljoin(url, response.headers["location"])
+                    response.content  # drain the body so the connection goes back to the pool
+                    continue
+                parser = self._parse(response)
+            finally:
+                response.close()
+            if parser.meta_redirect and follow_redirects:
+                history.append((response.status_code, url))
+                url = urljoin(url, parser.meta_redirect)
+                continue
+            return HtmlPage(url, response.status_code, response.headers, history, parser,
+                            time.perf_counter() - start)
+        raise requests.TooManyRedirects(f"More than {MAX_REDIRECTS} redirects from {path}: {history}")
+
+    @staticmethod
+    def _parse(response):
+        parser = PageParser()
+        decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+        for chunk in response.iter_content(CHUNK_SIZE):
+            parser.feed(decoder.decode(chunk))
+        parser.feed(decoder.decode(b"", final=True))
+        parser.close()
+        return parser
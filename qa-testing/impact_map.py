@@ -0,0 +1,429 @@
+"""
+Test-impact map and diff-based test selection
+Records the app routes every browser test visits (documents plus client-side
+RSC fetches) in .impact/impact-map.json. Routes are mapped to source files
+through the Next.js app directory (page, layouts, loading/error files) and the
+static import graph, so given a git base the plugin only runs the tests a
+changed file can affect.
+
+Run only the affected tests:
+    pytest --impact-base origin/main
+    python impact_map.py --base origin/main     # dry run: print the selection
+    python impact_map.py --merge shard-*/impact-map.json
+
+Anything the map cannot account for falls back to a full run: no map yet,
+a full-run branch (main), changes outside src/ (package.json, next.config.ts,
+supabase/, qa-testing helpers) or a source file no route imports.
+"""
+import argparse
+import functools
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from helpers import write_json
+
+
+QA_DIR = Path(__file__).resolve().parent
+REPO_ROOT = QA_DIR.parent
+SRC_DIR = REPO_ROOT / "src"
+APP_DIR = SRC_DIR / "app"
+
+MAP_PATH = Path(os.getenv("IMPACT_MAP", QA_DIR / ".impact" / "impact-map.json"))
+# Routes per test, appended by every worker and folded into the map at session end
+ROUTES_LOG = QA_DIR / "reports" / "impact-routes.jsonl"
+
+RECORD = os.getenv("IMPACT_RECORD", "true").lower() == "true"
+FULL_RUN_BRANCHES = [b.strip() for b in os.getenv("IMPACT_FULL_RUN_BRANCHES", "main,master").split(",") if b.strip()]
+# Test id prefixes run when a diff affects no recorded test, so the run still checks the app comes up
+SMOKE_TESTS = [t.strip() for t in os.getenv("IMPACT_SMOKE_TESTS", "test_http_smoke.py").split(",") if t.strip()]
+
+# Changes to these never affect a test run
+_IGNORED_SUFFIXES = (".md", ".pdf", ".txt")
+
+_SOURCE_EXTENSIONS = (".ts", ".tsx", ".js", ".jsx", ".mjs")
+# Files Next.js wraps around a page, looked up in the page's directory and every parent
+_SEGMENT_FILES = ("layout", "template", "loading", "error", "not-found")
+# App-wide files outside the app directory
+_GLOBAL_FILES = ("middleware", "instrumentation")
+
+# from '...', import '...', import('...') and export ... from '...'
+_IMPORT_RE = re.compile(r"""(?:\bfrom\s*|\bimport\s*\(?\s*)['"]([^'"]+)['"]""")
+
+# Same-origin paths this document loaded: itself plus RSC payloads of client-side navigations
+_ROUTES_JS = """
+if (!location.protocol.startsWith('http')) return [];
+const urls = [location.href];
+for (const entry of performance.getEntriesByType('resource')) {
+  if (entry.name.includes('_rsc=')) urls.push(entry.name);
+}
+return urls;
+"""
+
+_routes_key = pytest.StashKey()
+
+
+# ---------------------------------------------------------------------------
+# Routes -> source files
+# ---------------------------------------------------------------------------
+
+def _relative(path):
+    return path.resolve().relative_to(REPO_ROOT).as_posix()
+
+
+def _with_extensions(base):
+    """`base` itself, then `base` + each source extension, then base/index.*"""
+    yield base
+    for ext in _SOURCE_EXTENSIONS:
+        yield Path(f"{base}{ext}")
+    for ext in _SOURCE_EXTENSIONS:
+        yield base / f"index{ext}"
+
+
+def _resolve_import(spec, importer):
+    """File an import specifier points at, or None for packages"""
+    if spec.startswith("@/"):
+        base = SRC_DIR / spec[2:]
+    elif spec.startswith("."):
+        base = importer.parent / spec
+    else:
+        return None
+    for candidate in _with_extensions(base):
+        if candidate.is_file():
+            return candidate.resolve()
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _imports(path):
+    if path.suffix not in _SOURCE_EXTENSIONS:
+        return ()
+    try:
+        text = path.read_text(encoding="utf-8")
+    except OSError:
+        return ()
+    resolved = (_resolve_import(spec, path) for spec in _IMPORT_RE.findall(text))
+    return tuple(p for p in resolved if p is not None)
+
+
+def source_closure(entries):
+    """Repo-relative paths of `entries` and everything they import, transitively"""
+    seen = set()
+    stack = [Path(e).resolve() for e in entries]
+    while stack:
+        path = stack.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        stack.extend(_imports(path))
+    return {_relative(p) for p in seen}
+
+
+def _special_file(directory, stem):
+    for ext in _SOURCE_EXTENSIONS:
+        path = directory / f"{stem}{ext}"
+        if path.is_file():
+            return path
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def app_routes():
+    """(segments, directory) for every app directory holding a page or route handler"""
+    routes = []
+    for directory, _, _ in os.walk(APP_DIR):
+        directory = Path(directory)
+        if not (_special_file(directory, "page") or _special_file(directory, "route")):
+            continue
+        segments = tuple(
+            part for part in directory.relative_to(APP_DIR).parts
+            # Route groups and parallel-route slots do not appear in the URL
+            if not (part.startswith("(") and part.endswith(")")) and not part.startswith("@")
+        )
+        if any(part.startswith("_") for part in segments):
+            continue  # private folders
+        routes.append((segments, directory))
+    return routes
+
+
+def _matches(segments, parts):
+    for i, segment in enumerate(segments):
+        if segment.startswith("[[..."):
+            return True
+        if segment.startswith("[..."):
+            return len(parts) > i
+        if i >= len(parts):
+            return False
+        if not segment.startswith("[") and segment != parts[i]:
+            return False
+    return len(parts) == len(segments)
+
+
+def _route_directory(path):
+    """App directory serving URL `path`, static segments winning over dynamic ones"""
+    parts = tuple(p for p in path.split("/") if p)
+    matches = [(segments, directory) for segments, directory in app_routes() if _matches(segments, parts)]
+    if not matches:
+        return None
+    return min(matches, key=lambda m: sum(s.startswith("[") for s in m[0]))[1]
+
+
+def _entry_files(directory):
+    """The page/route of `directory` plus the segment files of it and every parent"""
+    entries = [_special_file(directory, "page"), _special_file(directory, "route")]
+    current = directory
+    while True:
+        entries.extend(_special_file(current, stem) for stem in _SEGMENT_FILES)
+        if current == APP_DIR:
+            break
+        current = current.parent
+    entries.extend(_special_file(SRC_DIR, stem) for stem in _GLOBAL_FILES)
+    return [e for e in entries if e is not None]
+
+
+@functools.lru_cache(maxsize=None)
+def route_sources(path):
+    """Repo-relative source files rendered for URL `path` (empty for unknown routes)"""
+    directory = _route_directory(path)
+    return frozenset(source_closure(_entry_files(directory))) if directory else frozenset()
+
+
+@functools.lru_cache(maxsize=None)
+def all_route_sources():
+    """Every source file some route of the app imports"""
+    files = set()
+    for _, directory in app_routes():
+        files |= source_closure(_entry_files(directory))
+    return frozenset(files)
+
+
+# ---------------------------------------------------------------------------
+# Map and selection
+# ---------------------------------------------------------------------------
+
+def load_map(path=MAP_PATH):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f).get("tests", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_map(tests, path=MAP_PATH):
+    write_json(path, {"updated_at": time.time(), "tests": tests}, indent=2, sort_keys=True)
+
+
+def merge_maps(paths, output=MAP_PATH):
+    """Combine impact maps (e.g. one per CI shard), keeping each test's newest entry"""
+    tests = {}
+    for path in paths:
+        for nodeid, entry in load_map(path).items():
+            if nodeid not in tests or entry.get("recorded_at", 0) > tests[nodeid].get("recorded_at", 0):
+                tests[nodeid] = entry
+    _save_map(tests, Path(output))
+    return tests
+
+
+def _git(*args):
+    return subprocess.run(
+        ["git", *args], cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    ).stdout
+
+
+def current_branch():
+    """Branch under test: the PR's head branch on GitHub Actions, else the checkout's"""
+    branch = os.getenv("GITHUB_HEAD_REF") or os.getenv("GITHUB_REF_NAME")
+    if branch:
+        return branch
+    try:
+        return _git("rev-parse", "--abbrev-ref", "HEAD").strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def changed_files(base):
+    """Files changed since the merge base with `base` (committed, staged, unstaged and untracked)"""
+    merge_base = _git("merge-base", base, "HEAD").strip()
+    changed = set(_git("diff", "--name-only", merge_base).split())
+    changed |= set(_git("ls-files", "--others", "--exclude-standard").split())
+    return changed
+
+
+def plan(nodeids, changed, tests, smoke=SMOKE_TESTS):
+    """
+    Decide which of `nodeids` to run for the `changed` files.
+    Returns (selected node ids or None for a full run, reason). When the diff
+    affects none of them, the `smoke` tests are selected instead; the selection
+    is empty only when there are none of those either.
+    """
+    if not tests:
+        return None, f"no impact map at {MAP_PATH}"
+
+    qa_prefix = f"{QA_DIR.name}/"
+    changed_tests, changed_sources = set(), set()
+    for path in sorted(changed):
+        if path.endswith(_IGNORED_SUFFIXES):
+            continue
+        if path.startswith(qa_prefix):
+            relative = path[len(qa_prefix):]
+            if Path(relative).name.startswith("test_") and relative.endswith(".py"):
+                changed_tests.add(relative)
+                continue
+            return None, f"test infrastructure changed ({path})"
+        if path.startswith("src/"):
+            if path not in all_route_sources():
+                return None, f"{path} is not imported by any route"
+            changed_sources.add(path)
+            continue
+        return None, f"{path} can affect every route"
+
+    selected = set()
+    for nodeid in nodeids:
+        entry = tests.get(nodeid)
+        # Tests missing from the map (new, or never drove a browser) always run
+        if entry is None or nodeid.split("::")[0] in changed_tests:
+            selected.add(nodeid)
+        elif any(route_sources(route) & changed_sources for route in entry["routes"]):
+            selected.add(nodeid)
+    if not selected:
+        selected = {nodeid for nodeid in nodeids if nodeid.startswith(tuple(smoke))}
+        return selected, (f"nothing impacted by {len(changed_sources)} app file(s) - "
+                          f"running {len(selected)} smoke test(s)")
+    return selected, f"{len(changed_sources)} app file(s) and {len(changed_tests)} test file(s) changed"
+
+
+def select(nodeids, base):
+    """plan() for the current checkout against git ref `base`"""
+    branch = current_branch()
+    if branch in FULL_RUN_BRANCHES:
+        return None, f"full run on {branch}"
+    try:
+        changed = changed_files(base)
+    except (OSError, subprocess.CalledProcessError) as e:
+        return None, f"git diff against {base} failed ({getattr(e, 'stderr', '') or e})".strip()
+    return plan(nodeids, changed, load_map())
+
+
+# ---------------------------------------------------------------------------
+# pytest plugin
+# ---------------------------------------------------------------------------
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--impact-base", default=os.getenv("IMPACT_BASE"),
+        help="Only run tests affected by changes since this git ref (impact_map.py)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    base = config.getoption("impact_base")
+    if not base:
+        return
+    selected, reason = select([item.nodeid for item in items], base)
+    if selected is None:
+        print(f"\n🎯 Impact selection: running all {len(items)} tests - {reason}")
+        return
+    deselected = [item for item in items if item.nodeid not in selected]
+    items[:] = [item for item in items if item.nodeid in selected]
+    config.hook.pytest_deselected(items=deselected)
+    print(f"\n🎯 Impact selection against {base}: running {len(items)} of "
+          f"{len(items) + len(deselected)} tests ({reason})")
+
+
+@pytest.fixture(autouse=True)
+def _impact_routes(request):
+    """Read the routes a browser test ended up on before the driver is released"""
+    if RECORD and "http_client" in request.fixturenames and "driver" not in request.fixturenames:
+        # Browserless tests (http_smoke.py): every URL the client fetched, redirects included
+        client = request.getfixturevalue("http_client")
+        yield
+        request.node.stash[_routes_key] = (urlparse(client.base_url).netloc, client.visited)
+        return
+    if not RECORD or "driver" not in request.fixturenames:
+        yield
+        return
+    driver = request.getfixturevalue("driver")
+    origin = urlparse(request.getfixturevalue("base_url")).netloc
+    yield
+    try:
+        urls = driver.execute_script(_ROUTES_JS) or []
+    except WebDriverException:
+        urls = []
+    request.node.stash[_routes_key] = (origin, urls)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Log the test's routes once teardown has run (DevTools timings are complete by then)"""
+    outcome = yield
+    if outcome.get_result().when != "teardown" or _routes_key not in item.stash:
+        return
+    origin, urls = item.stash[_routes_key]
+    # Full-document navigations earlier in the test only show up in the DevTools log
+    from devtools_timing import timing_key
+    timing = item.stash.get(timing_key, None)
+    if timing:
+        urls = urls + [r["url"] for r in timing["requests"] if r["type"] == "Document" or "_rsc=" in r["url"]]
+    routes = sorted({urlparse(u).path or "/" for u in urls if urlparse(u).netloc == origin})
+    ROUTES_LOG.parent.mkdir(parents=True, exist_ok=True)
+    with open(ROUTES_LOG, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"test": item.nodeid, "routes": routes}) + "\n")
+
+
+def pytest_sessionstart(session):
+    """Remove the routes log left by the previous run"""
+    if RECORD and not hasattr(session.config, "workerinput"):
+        ROUTES_LOG.unlink(missing_ok=True)
+
+
+def pytest_sessionfinish(session):
+    """Fold this run's routes into the impact map; tests that did not run keep their entry"""
+    if not RECORD or hasattr(session.config, "workerinput") or not ROUTES_LOG.exists():
+        return
+    tests = load_map()
+    with open(ROUTES_LOG, encoding="utf-8") as f:
+        for line in f:
+            record = json.loads(line)
+            tests[record["test"]] = {"routes": record["routes"], "recorded_at": time.time()}
+    _save_map(tests)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show which recorded tests a diff selects")
+    parser.add_argument("--base", default=os.getenv("IMPACT_BASE", "origin/main"))
+    parser.add_argument("--merge", nargs="+", metavar="MAP", help=f"Merge impact maps into {MAP_PATH} and exit")
+    args = parser.parse_args()
+
+    if args.merge:
+        tests = merge_maps(args.merge)
+        print(f"✓ {len(tests)} tests in {MAP_PATH}")
+        return
+
+    tests = load_map()
+    try:
+        changed = changed_files(args.base)
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"❌ git diff against {args.base} failed: {getattr(e, 'stderr', '') or e}")
+        sys.exit(1)
+    print(f"Changed since {args.base}: {len(changed)} file(s)")
+    for path in sorted(changed):
+        print(f"  {path}")
+    selected, reason = plan(list(tests), changed, tests)
+    if selected is None:
+        print(f"🎯 Full run - {reason}")
+        return
+    print(f"🎯 {len(selected)} of {len(tests)} recorded tests ({reason}); tests not in the map always run")
+    for nodeid in sorted(selected):
+        print(f"  {nodeid}")
+
+
+if __name__ == "__main__":
+    main()
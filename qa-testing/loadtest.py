@@ -0,0 +1,388 @@
+"""
+Load-generation harness for the dashboard (listEventsAction) path
+Replays a weighted mix of dashboard loads, searches, sport filters and date filters
+from many signed-in users over a pooled async HTTP client, then reports
+throughput, p50/p95/p99 latency and error rates as JSON and HTML.
+
+Usage:
+    # Offline: app built against the local Supabase stand-in (see local_supabase.py)
+    python loadtest.py --local --users 20 --concurrency 40 --duration 60
+
+    # Against a hosted project with existing accounts (TEST_ACCOUNTS / TEST_EMAIL)
+    python loadtest.py --concurrency 10 --requests 2000
+"""
+import argparse
+import asyncio
+import html
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import urlencode
+
+import httpx
+import requests
+from dotenv import load_dotenv
+
+import auth_state
+from dataset import NAME_WORDS, VENUE_KINDS, VENUE_PLACES, seeder_events
+from local_supabase import DEFAULT_PORT as LOCAL_SUPABASE_DEFAULT_PORT, accounts_from_env, anon_key, ensure_running
+from seeding import SupabaseSeeder, SeedingError, supabase_config
+
+
+SPORTS = ["Basketball", "Football", "Soccer", "Baseball", "Tennis", "Volleyball", "Hockey", "Pickleball", "Other"]
+DATE_FILTERS = ["today", "week", "month", "upcoming", "past"]
+SORT_OPTIONS = ["date-asc", "date-desc", "name-asc", "name-desc"]
+
+# Words dataset.py builds event names, locations and venues from, so searches hit real rows
+VOCABULARY = NAME_WORDS + [place.lower() for place in VENUE_PLACES]
+
+DEFAULT_MIX = "dashboard=40,search=30,sport=20,date=10"
+LOAD_PASSWORD = "loadtest-password-123"
+
+# Markers of a request that "succeeded" at the HTTP level but rendered a failure
+ERROR_MARKERS = ("__next_error__", "NEXT_REDIRECT", "text-destructive font-medium")
+
+
+# ---------------------------------------------------------------------------
+# Request mix
+# ---------------------------------------------------------------------------
+
+def _dashboard(rng):
+    return "/dashboard"
+
+
+def _search(rng):
+    # Mostly vocabulary hits, sometimes venue names and misses
+    roll = rng.random()
+    if roll < 0.7:
+        term = rng.choice(VOCABULARY)
+    elif roll < 0.9:
+        term = rng.choice(VENUE_KINDS)
+    else:
+        term = f"zz{rng.randrange(10_000)}"
+    return "/dashboard?" + urlencode({"search": term})
+
+
+def _sport(rng):
+    return "/dashboard?" + urlencode({"sport": rng.choice(SPORTS), "sort": rng.choice(SORT_OPTIONS)})
+
+
+def _date(rng):
+    return "/dashboard?" + urlencode({"date": rng.choice(DATE_FILTERS)})
+
+
+SCENARIOS = {
+    "dashboard": _dashboard,
+    "search": _search,
+    "sport": _sport,
+    "date": _date,
+}
+
+
+def parse_mix(text):
+    """'dashboard=40,search=30' -> [("dashboard", 40.0), ("search", 30.0)]"""
+    mix = []
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise ValueError(f"Unknown scenario '{name}' (choose from {', '.join(SCENARIOS)})")
+        mix.append((name, float(weight or 1)))
+    return mix
+
+
+# ---------------------------------------------------------------------------
+# Users and data
+# ---------------------------------------------------------------------------
+
+def prepare_users(supabase_url, key, accounts, events_per_user, seed, namespace):
+    """
+    Sign every account in and seed its events with dataset.py's skewed generator,
+    seeded per run and user so ids never collide with kept data.
+    Returns [{"email", "cookies", "seeder"}]; cookies are the @supabase/ssr auth cookies.
+    """
+    users = []
+    for index, (email, password) in enumerate(accounts):
+        response = requests.post(
+            f"{supabase_url}/auth/v1/token",
+            params={"grant_type": "password"},
+            headers={"apikey": key, "Content-Type": "application/json"},
+            json={"email": email, "password": password},
+            timeout=15,
+        )
+        if response.status_code != 200:
+            raise SeedingError(f"Sign-in for {email} failed ({response.status_code}): {response.text[:200]}")
+        session = response.json()
+        # A session of its own: refreshing it must not rotate the refresh token in the cookies
+        seeder = SupabaseSeeder.sign_in(email, password, supabase_url, key, namespace=namespace)
+        if events_per_user:
+            seeder.bulk_insert_events(seeder_events(events_per_user, seed=f"{seed}:{namespace}:{index}"))
+        users.append({
+            "email": email,
+            "cookies": auth_state.session_cookies(supabase_url, session),
+            "seeder": seeder,
+        })
+    return users
+
+
+# ---------------------------------------------------------------------------
+# Load generation
+# ---------------------------------------------------------------------------
+
+async def _virtual_user(client, index, users, mix, rng, stop_at, budget, samples, think_time, started):
+    """One closed-loop client: pick a user and scenario, request, record, repeat"""
+    names = [name for name, _ in mix]
+    weights = [weight for _, weight in mix]
+    user = users[index % len(users)]
+    cookie_header = "; ".join(f"{k}={v}" for k, v in user["cookies"].items())
+    while time.monotonic() < stop_at:
+        if budget is not None:
+            if budget["left"] <= 0:
+                return
+            budget["left"] -= 1
+        scenario = rng.choices(names, weights)[0]
+        path = SCENARIOS[scenario](rng)
+        start = time.monotonic()
+        status, error = 0, None
+        try:
+            response = await client.get(path, headers={"Cookie": cookie_header})
+            status = response.status_code
+            body = response.text
+            if status >= 300:
+                error = f"HTTP {status}"
+            else:
+                marker = next((m for m in ERROR_MARKERS if m in body), None)
+                if marker:
+                    error = f"page error ({marker})"
+        except httpx.HTTPError as e:
+            error = type(e).__name__
+        samples.append({
+            "scenario": scenario,
+            "path": path,
+            "offset": round(start - started, 4),
+            "latency": time.monotonic() - start,
+            "status": status,
+            "error": error,
+        })
+        if think_time:
+            await asyncio.sleep(rng.uniform(0, 2 * think_time))
+
+
+async def run_load(base_url, users, mix, concurrency=10, duration=30.0, total_requests=None,
+                   seed=None, timeout=30.0, think_time=0.0):
+    """
+    Drive `concurrency` virtual users for `duration` seconds (or until
+    `total_requests` have been sent). All of them share one connection pool.
+    Returns (samples, wall_seconds).
+    """
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    samples = []
+    budget = {"left": total_requests} if total_requests else None
+    started = time.monotonic()
+    stop_at = started + (duration if duration else float("inf"))
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=timeout,
+                                 follow_redirects=False) as client:
+        await asyncio.gather(*(
+            _virtual_user(client, i, users, mix, random.Random(f"{seed}-{i}"), stop_at, budget,
+                          samples, think_time, started)
+            for i in range(concurrency)
+        ))
+    return samples, time.monotonic() - started
+
+
+# ---------------------------------------------------------------------------
+# Reporting
+# ---------------------------------------------------------------------------
+
+def percentile(sorted_values, p):
+    """Linear-interpolated percentile of an already sorted list (p in 0..100)"""
+    if not sorted_values:
+        return None
+    rank = (len(sorted_values) - 1) * p / 100
+    low = int(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+def _stats(samples, wall_seconds):
+    latencies = sorted(s["latency"] for s in samples)
+    errors = sum(1 for s in samples if s["error"])
+    ms = lambda v: round(v * 1000, 2) if v is not None else None
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "error_rate": round(errors / len(samples), 4) if samples else 0.0,
+        "throughput_rps": round(len(samples) / wall_seconds, 2) if wall_seconds else 0.0,
+        "mean_ms": ms(sum(latencies) / len(latencies)) if latencies else None,
+        "p50_ms": ms(percentile(latencies, 50)),
+        "p95_ms": ms(percentile(latencies, 95)),
+        "p99_ms": ms(percentile(latencies, 99)),
+        "max_ms": ms(latencies[-1]) if latencies else None,
+    }
+
+
+def summarize(samples, wall_seconds, config):
+    """Aggregate samples into the report structure written to JSON/HTML"""
+    by_scenario = defaultdict(list)
+    for s in samples:
+        by_scenario[s["scenario"]].append(s)
+
+    timeline = defaultdict(lambda: {"requests": 0, "errors": 0})
+    for s in samples:
+        bucket = timeline[int(s["offset"])]
+        bucket["requests"] += 1
+        bucket["errors"] += 1 if s["error"] else 0
+
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "config": config,
+        "wall_seconds": round(wall_seconds, 3),
+        "overall": _stats(samples, wall_seconds),
+        "scenarios": {name: _stats(group, wall_seconds) for name, group in sorted(by_scenario.items())},
+        "status_codes": dict(Counter(str(s["status"]) for s in samples)),
+        "errors": dict(Counter(s["error"] for s in samples if s["error"]).most_common(20)),
+        "timeline": [{"second": sec, **timeline[sec]} for sec in sorted(timeline)],
+    }
+
+
+def write_json(report, path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+
+def write_html(report, path):
+    """Self-contained HTML: summary tables plus a requests-per-second bar chart"""
+    columns = ["requests", "errors", "error_rate", "throughput_rps", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"]
+    header = "".join(f"<th>{c}</th>" for c in ["scenario"] + columns)
+    rows = [("overall", report["overall"])] + list(report["scenarios"].items())
+    body = "".join(
+        "<tr>" + f"<td>{html.escape(name)}</td>" + "".join(f"<td>{stats[c]}</td>" for c in columns) + "</tr>"
+        for name, stats in rows
+    )
+
+    timeline = report["timeline"]
+    peak = max((t["requests"] for t in timeline), default=1) or 1
+    bar_width = 8
+    bars = "".join(
+        f'<rect x="{i * bar_width}" y="{100 - 100 * t["requests"] / peak:.1f}" width="{bar_width - 1}" '
+        f'height="{100 * t["requests"] / peak:.1f}" fill="{"#d9534f" if t["errors"] else "#5b8def"}">'
+        f'<title>{t["second"]}s: {t["requests"]} req, {t["errors"]} errors</title></rect>'
+        for i, t in enumerate(timeline)
+    )
+    errors = "".join(
+        f"<tr><td>{html.escape(str(name))}</td><td>{count}</td></tr>" for name, count in report["errors"].items()
+    ) or "<tr><td colspan='2'>none</td></tr>"
+
+    document = f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Dashboard load test</title>
+<style>
+body {{ font-family: system-ui, sans-serif; margin: 2rem; color: #222; }}
+table {{ border-collapse: collapse; margin-bottom: 1.5rem; }}
+th, td {{ border: 1px solid #ccc; padding: 4px 10px; text-align: right; }}
+th:first-child, td:first-child {{ text-align: left; }}
+pre {{ background: #f6f6f6; padding: 1rem; }}
+</style></head><body>
+<h1>Dashboard load test</h1>
+<p>{html.escape(report["generated_at"])} &middot; {report["wall_seconds"]}s wall time</p>
+<h2>Latency and throughput</h2>
+<table><tr>{header}</tr>{body}</table>
+<h2>Requests per second</h2>
+<svg width="{max(len(timeline) * bar_width, 100)}" height="100">{bars}</svg>
+<h2>Errors</h2>
+<table><tr><th>error</th><th>count</th></tr>{errors}</table>
+<h2>Configuration</h2>
+<pre>{html.escape(json.dumps(report["config"], indent=2))}</pre>
+</body></html>
+"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(document, encoding="utf-8")
+
+
+def print_summary(report):
+    print(f"\n📊 {report['overall']['requests']} requests in {report['wall_seconds']}s")
+    print(f"{'scenario':<12}{'req':>7}{'err%':>8}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}")
+    for name, stats in [("overall", report["overall"])] + list(report["scenarios"].items()):
+        print(f"{name:<12}{stats['requests']:>7}{stats['error_rate'] * 100:>7.1f}%{stats['throughput_rps']:>9}"
+              f"{stats['p50_ms'] or 0:>9}{stats['p95_ms'] or 0:>9}{stats['p99_ms'] or 0:>9}")
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main(argv=None):
+    load_dotenv(Path(__file__).parent / ".env")
+    parser = argparse.ArgumentParser(description="Load test the /dashboard listEventsAction path")
+    parser.add_argument("--base-url", default=os.getenv("BASE_URL", "http://localhost:3000"))
+    parser.add_argument("--local", action="store_true",
+                        help="Use (or boot) the local Supabase stand-in and create --users accounts on it")
+    parser.add_argument("--users", type=int, default=10, help="Accounts to create with --local")
+    parser.add_argument("--events-per-user", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to run (ignored with --requests)")
+    parser.add_argument("--requests", type=int, default=None, help="Stop after this many requests")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"Scenario weights (default: {DEFAULT_MIX})")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Mean pause between a user's requests")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", default="reports/load-report", help="Report path without extension")
+    parser.add_argument("--keep-data", action="store_true", help="Do not delete seeded events afterwards")
+    args = parser.parse_args(argv)
+
+    mix = parse_mix(args.mix)
+    namespace = f"load-{int(time.time())}"
+
+    server = None
+    if args.local:
+        port = int(os.getenv("LOCAL_SUPABASE_PORT", LOCAL_SUPABASE_DEFAULT_PORT))
+        accounts = [(f"load-{i}@example.com", LOAD_PASSWORD) for i in range(args.users)]
+        server = ensure_running(port, accounts)
+        supabase_url, key = f"http://127.0.0.1:{port}", anon_key()
+    else:
+        supabase_url, key = supabase_config()
+        if not supabase_url:
+            parser.error("SUPABASE_URL / SUPABASE_ANON_KEY must be set (or use --local)")
+        accounts = accounts_from_env()
+
+    print(f"🔐 Signing in {len(accounts)} users and seeding {args.events_per_user} events each...")
+    users = prepare_users(supabase_url, key, accounts, args.events_per_user, args.seed, namespace)
+
+    print(f"🚀 {args.concurrency} virtual users against {args.base_url} "
+          f"({f'{args.requests} requests' if args.requests else f'{args.duration:g}s'})")
+    try:
+        samples, wall_seconds = asyncio.run(run_load(
+            args.base_url, users, mix,
+            concurrency=args.concurrency,
+            duration=None if args.requests else args.duration,
+            total_requests=args.requests,
+            seed=args.seed,
+            timeout=args.timeout,
+            think_time=args.think_time,
+        ))
+    finally:
+        if not args.keep_data:
+            for user in users:
+                user["seeder"].teardown()
+        if server is not None:
+            server.stop()
+
+    config = {k: v for k, v in vars(args).items() if k != "output"}
+    config.update({"supabase_url": supabase_url, "accounts": len(accounts), "mix": dict(mix)})
+    report = summarize(samples, wall_seconds, config)
+    write_json(report, f"{args.output}.json")
+    write_html(report, f"{args.output}.html")
+    print_summary(report)
+    print(f"\nReports: {args.output}.json, {args.output}.html")
+    return 1 if report["overall"]["error_rate"] > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
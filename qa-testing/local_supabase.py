@@ -0,0 +1,1377 @@
+"""
+Local Supabase stand-in for hermetic test runs
+An asyncio HTTP server that emulates the subset of GoTrue (auth) and PostgREST
+(rest) used by src/lib/actions/*.ts, backed by in-memory indexed tables that
+mirror supabase/schema.sql with its row level security policies.
+
+Run it standalone:
+    python local_supabase.py --port 54321
+
+then build/start the app with NEXT_PUBLIC_SUPABASE_URL=http://127.0.0.1:54321.
+conftest.py boots it automatically when LOCAL_SUPABASE=true.
+"""
+import argparse
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import os
+import re
+import secrets
+import socket
+import threading
+import time
+import traceback
+import urllib.request
+import uuid
+from collections import defaultdict
+from datetime import datetime, timezone
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 54321
+DEFAULT_JWT_SECRET = "local-supabase-jwt-secret-for-qa-testing-only"
+ACCESS_TOKEN_TTL = 3600
+
+# listEventsAction sends every matching id in one `in.(...)` filter, so request
+# lines grow with the dataset; accept far more than a real gateway would
+MAX_REQUEST_LINE = 64 * 1024 * 1024
+
+
+# ---------------------------------------------------------------------------
+# JWT (HS256) - enough for supabase-js, which only round-trips the token
+# ---------------------------------------------------------------------------
+
+def _b64url(data):
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _b64url_decode(text):
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+def encode_jwt(payload, secret):
+    header = _b64url(json.dumps({"alg": "HS256", "typ": "JWT"}, separators=(",", ":")).encode())
+    body = _b64url(json.dumps(payload, separators=(",", ":")).encode())
+    signature = hmac.new(secret.encode(), f"{header}.{body}".encode(), hashlib.sha256).digest()
+    return f"{header}.{body}.{_b64url(signature)}"
+
+
+def decode_jwt(token, secret):
+    """Return the payload of a valid, unexpired token or None"""
+    try:
+        header, body, signature = token.split(".")
+        expected = hmac.new(secret.encode(), f"{header}.{body}".encode(), hashlib.sha256).digest()
+        if not hmac.compare_digest(expected, _b64url_decode(signature)):
+            return None
+        payload = json.loads(_b64url_decode(body))
+    except (ValueError, TypeError):
+        return None
+    if payload.get("exp") and payload["exp"] < time.time():
+        return None
+    return payload
+
+
+def anon_key(secret=DEFAULT_JWT_SECRET):
+    """Deterministic anon key for NEXT_PUBLIC_SUPABASE_ANON_KEY"""
+    return encode_jwt({"iss": "supabase-local", "role": "anon", "iat": 0}, secret)
+
+
+def service_role_key(secret=DEFAULT_JWT_SECRET):
+    """Deterministic service role key (bypasses RLS) for SUPABASE_SERVICE_ROLE_KEY"""
+    return encode_jwt({"iss": "supabase-local", "role": "service_role", "iat": 0}, secret)
+
+
+# ---------------------------------------------------------------------------
+# Errors
+# ---------------------------------------------------------------------------
+
+class PgError(Exception):
+    """PostgREST-shaped error: {code, message, details, hint} with an HTTP status"""
+
+    def __init__(self, status, code, message, details=None, hint=None):
+        super().__init__(message)
+        self.status = status
+        self.body = {"code": code, "message": message, "details": details, "hint": hint}
+
+
+class AuthError(Exception):
+    """GoTrue-shaped error: {code, error_code, msg}"""
+
+    def __init__(self, status, error_code, msg):
+        super().__init__(msg)
+        self.status = status
+        self.body = {"code": status, "error_code": error_code, "msg": msg}
+
+
+# ---------------------------------------------------------------------------
+# Schema (supabase/schema.sql + migrations)
+# ---------------------------------------------------------------------------
+
+def _now():
+    return datetime.now(timezone.utc)
+
+
+SCHEMA = {
+    "venues": {
+        "pk": ("id",),
+        "columns": {
+            "id": ("uuid", False, lambda: str(uuid.uuid4())),
+            "name": ("text", False, None),
+            "created_at": ("timestamptz", True, _now),
+        },
+        "unique": {"venues_name_key": ("name",)},
+        "foreign_keys": {},
+        "indexes": ("name",),
+    },
+    "events": {
+        "pk": ("id",),
+        "columns": {
+            "id": ("uuid", False, lambda: str(uuid.uuid4())),
+            "user_id": ("uuid", False, None),
+            "name": ("text", False, None),
+            "sport": ("text", False, None),
+            "starts_at": ("timestamptz", False, None),
+            "description": ("text", True, None),
+            "location": ("text", True, None),
+            "is_recurring": ("bool", True, lambda: False),
+            "recurrence_pattern": ("text", True, None),
+            "parent_event_id": ("uuid", True, None),
+            "created_at": ("timestamptz", True, _now),
+        },
+        "unique": {},
+        "foreign_keys": {
+            "events_user_id_fkey": ("user_id", "auth.users", "id"),
+            "events_parent_event_id_fkey": ("parent_event_id", "events", "id"),
+        },
+        "indexes": ("user_id", "sport", "parent_event_id"),
+    },
+    "event_venues": {
+        "pk": ("event_id", "venue_id"),
+        "columns": {
+            "event_id": ("uuid", False, None),
+            "venue_id": ("uuid", False, None),
+        },
+        "unique": {},
+        "foreign_keys": {
+            "event_venues_event_id_fkey": ("event_id", "events", "id"),
+            "event_venues_venue_id_fkey": ("venue_id", "venues", "id"),
+        },
+        "indexes": ("event_id", "venue_id"),
+    },
+}
+
+# (parent, embedded) -> (cardinality, parent column, embedded column)
+RELATIONSHIPS = {
+    ("events", "event_venues"): ("many", "id", "event_id"),
+    ("venues", "event_venues"): ("many", "id", "venue_id"),
+    ("event_venues", "events"): ("one", "event_id", "id"),
+    ("event_venues", "venues"): ("one", "venue_id", "id"),
+    ("events", "events"): ("one", "parent_event_id", "id"),
+}
+
+# ON DELETE CASCADE edges: table -> [(child table, child column, parent column)]
+CASCADES = {
+    "events": [("event_venues", "event_id", "id"), ("events", "parent_event_id", "id")],
+    "venues": [("event_venues", "venue_id", "id")],
+}
+
+_UUID_RE = re.compile(r"^[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}$")
+
+
+def _parse_timestamp(value):
+    if isinstance(value, datetime):
+        dt = value
+    else:
+        text = str(value).strip().replace(" ", "T", 1)
+        if text.endswith("Z"):
+            text = text[:-1] + "+00:00"
+        dt = datetime.fromisoformat(text)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def cast(table, column, col_type, value):
+    """Coerce a JSON or query-string value to the column's type, raising Postgres errors"""
+    if value is None:
+        return None
+    try:
+        if col_type == "uuid":
+            text = str(value)
+            if not _UUID_RE.match(text):
+                raise ValueError
+            return str(uuid.UUID(text))
+        if col_type == "timestamptz":
+            return _parse_timestamp(value)
+        if col_type == "bool":
+            if isinstance(value, bool):
+                return value
+            lowered = str(value).lower()
+            if lowered in ("true", "t", "1"):
+                return True
+            if lowered in ("false", "f", "0"):
+                return False
+            raise ValueError
+        return str(value)
+    except ValueError:
+        names = {"uuid": "uuid", "timestamptz": "timestamp with time zone", "bool": "boolean"}
+        raise PgError(400, "22P02", f'invalid input syntax for type {names.get(col_type, col_type)}: "{value}"')
+
+
+def _to_json(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+# ---------------------------------------------------------------------------
+# Storage
+# ---------------------------------------------------------------------------
+
+class Table:
+    """Rows keyed by primary key plus hash indexes on the schema's indexed columns"""
+
+    def __init__(self, name):
+        self.name = name
+        self.schema = SCHEMA[name]
+        self.rows = {}
+        self.indexes = {col: defaultdict(set) for col in self.schema["indexes"]}
+        self.unique = {constraint: {} for constraint in self.schema["unique"]}
+
+    def key(self, row):
+        return tuple(row[c] for c in self.schema["pk"])
+
+    def insert(self, row):
+        key = self.key(row)
+        self.rows[key] = row
+        for col, index in self.indexes.items():
+            index[row[col]].add(key)
+        for constraint, cols in self.schema["unique"].items():
+            self.unique[constraint][tuple(row[c] for c in cols)] = key
+
+    def remove(self, key):
+        row = self.rows.pop(key)
+        for col, index in self.indexes.items():
+            bucket = index.get(row[col])
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del index[row[col]]
+        for constraint, cols in self.schema["unique"].items():
+            self.unique[constraint].pop(tuple(row[c] for c in cols), None)
+        return row
+
+    def candidates(self, filters):
+        """
+        Narrow the scan using the primary key or a hash index when a filter
+        is an eq/in on an indexed column; otherwise scan everything.
+        """
+        best = None
+        for f in filters:
+            if f.negate or f.op not in ("eq", "in"):
+                continue
+            values = f.value if f.op == "in" else [f.value]
+            if self.schema["pk"] == (f.column,):
+                keys = {(v,) for v in values if (v,) in self.rows}
+            elif f.column in self.indexes:
+                index = self.indexes[f.column]
+                keys = set()
+                for v in values:
+                    keys |= index.get(v, set())
+            else:
+                continue
+            best = keys if best is None else best & keys
+        if best is None:
+            return list(self.rows.values())
+        return [self.rows[k] for k in best if k in self.rows]
+
+
+class Auth:
+    """Users and sessions (GoTrue subset)"""
+
+    def __init__(self, jwt_secret):
+        self.jwt_secret = jwt_secret
+        self.users = {}            # id -> user dict (with password hash)
+        self.users_by_email = {}   # email -> id
+        self.sessions = {}         # session id -> user id
+        self.refresh_tokens = {}   # refresh token -> session id
+
+    @staticmethod
+    def _hash(password, salt):
+        return hashlib.pbkdf2_hmac("sha256", password.encode(), salt.encode(), 1000).hex()
+
+    def create_user(self, email, password):
+        email = email.lower()
+        if email in self.users_by_email:
+            raise AuthError(422, "user_already_exists", "User already registered")
+        user_id = str(uuid.uuid4())
+        salt = secrets.token_hex(8)
+        now = _now().isoformat()
+        self.users[user_id] = {
+            "id": user_id,
+            "aud": "authenticated",
+            "role": "authenticated",
+            "email": email,
+            "email_confirmed_at": now,
+            "confirmed_at": now,
+            "phone": "",
+            "app_metadata": {"provider": "email", "providers": ["email"]},
+            "user_metadata": {},
+            "identities": [],
+            "created_at": now,
+            "updated_at": now,
+            "_salt": salt,
+            "_password": self._hash(password, salt),
+        }
+        self.users_by_email[email] = user_id
+        return self.public_user(user_id)
+
+    def public_user(self, user_id):
+        return {k: v for k, v in self.users[user_id].items() if not k.startswith("_")}
+
+    def _issue(self, user_id, session_id=None):
+        session_id = session_id or str(uuid.uuid4())
+        self.sessions[session_id] = user_id
+        now = int(time.time())
+        user = self.users[user_id]
+        access_token = encode_jwt({
+            "sub": user_id,
+            "aud": "authenticated",
+            "role": "authenticated",
+            "email": user["email"],
+            "session_id": session_id,
+            "iat": now,
+            "exp": now + ACCESS_TOKEN_TTL,
+        }, self.jwt_secret)
+        refresh_token = secrets.token_urlsafe(16)
+        self.refresh_tokens[refresh_token] = session_id
+        return {
+            "access_token": access_token,
+            "token_type": "bearer",
+            "expires_in": ACCESS_TOKEN_TTL,
+            "expires_at": now + ACCESS_TOKEN_TTL,
+            "refresh_token": refresh_token,
+            "user": self.public_user(user_id),
+        }
+
+    def password_grant(self, email, password):
+        user_id = self.users_by_email.get((email or "").lower())
+        if user_id is None:
+            raise AuthError(400, "invalid_credentials", "Invalid login credentials")
+        user = self.users[user_id]
+        if not hmac.compare_digest(self._hash(password or "", user["_salt"]), user["_password"]):
+            raise AuthError(400, "invalid_credentials", "Invalid login credentials")
+        return self._issue(user_id)
+
+    def refresh_grant(self, refresh_token):
+        session_id = self.refresh_tokens.pop(refresh_token or "", None)
+        if session_id is None or session_id not in self.sessions:
+            raise AuthError(400, "refresh_token_not_found", "Invalid Refresh Token: Refresh Token Not Found")
+        return self._issue(self.sessions[session_id], session_id)
+
+    def claims(self, token):
+        """Verified claims for a bearer token; user tokens must belong to a live session"""
+        payload = decode_jwt(token or "", self.jwt_secret)
+        if payload is None:
+            return None
+        if payload.get("role") == "authenticated":
+            if self.sessions.get(payload.get("session_id")) != payload.get("sub"):
+                return None
+        return payload
+
+    def sign_out(self, claims, scope="global"):
+        session_id = claims.get("session_id")
+        if scope == "global":
+            doomed = {sid for sid, uid in self.sessions.items() if uid == claims["sub"]}
+        elif scope == "others":
+            doomed = {sid for sid, uid in self.sessions.items() if uid == claims["sub"] and sid != session_id}
+        else:
+            doomed = {session_id}
+        for sid in doomed:
+            self.sessions.pop(sid, None)
+        for token, sid in list(self.refresh_tokens.items()):
+            if sid in doomed:
+                del self.refresh_tokens[token]
+
+
+# ---------------------------------------------------------------------------
+# PostgREST query language
+# ---------------------------------------------------------------------------
+
+class Filter:
+    __slots__ = ("column", "op", "value", "negate", "config")
+
+    def __init__(self, column, op, value, negate=False, config=None):
+        self.column = column
+        self.op = op
+        self.value = value
+        self.negate = negate
+        self.config = config
+
+
+class BoolGroup:
+    __slots__ = ("kind", "items", "negate")
+
+    def __init__(self, kind, items, negate=False):
+        self.kind = kind
+        self.items = items
+        self.negate = negate
+
+
+def _split_top_level(text, sep=","):
+    """Split on `sep` outside parentheses and double quotes"""
+    parts, depth, quoted, current = [], 0, False, []
+    i = 0
+    while i < len(text):
+        ch = text[i]
+        if ch == "\\" and quoted and i + 1 < len(text):
+            current.append(text[i + 1])
+            i += 2
+            continue
+        if ch == '"':
+            quoted = not quoted
+        elif not quoted and ch == "(":
+            depth += 1
+        elif not quoted and ch == ")":
+            depth -= 1
+        if ch == sep and depth == 0 and not quoted:
+            parts.append("".join(current))
+            current = []
+        else:
+            current.append(ch)
+        i += 1
+    parts.append("".join(current))
+    return parts
+
+
+def _unquote_value(text):
+    text = text.strip()
+    if len(text) >= 2 and text[0] == '"' and text[-1] == '"':
+        return text[1:-1]
+    return text
+
+
+def parse_select(text):
+    """
+    Parse a select clause into [("col", name, alias)] / [("embed", table, alias, items, inner)].
+    Supports `*`, `alias:col`, `rel(...)`, `alias:rel(...)`, `rel!inner(...)`, `rel!fk(...)`.
+    """
+    items = []
+    for part in _split_top_level(text.replace(" ", "").replace("\n", "")):
+        if not part:
+            continue
+        alias = None
+        if "(" in part:
+            head, _, rest = part.partition("(")
+            if not rest.endswith(")"):
+                raise PgError(400, "PGRST100", f'failed to parse select parameter ({text})')
+            if ":" in head:
+                alias, head = head.split(":", 1)
+            table, _, hint = head.partition("!")
+            items.append(("embed", table, alias or table, parse_select(rest[:-1]), hint == "inner"))
+        else:
+            if ":" in part and "::" not in part:
+                alias, part = part.split(":", 1)
+            part = part.split("::")[0]
+            items.append(("col", part, alias or part))
+    return items
+
+
+_OPS = {"eq", "neq", "gt", "gte", "lt", "lte", "like", "ilike", "in", "is", "fts", "plfts", "phfts", "wfts"}
+
+
+def parse_condition(column, expression):
+    """Parse `op.value` (optionally `not.op.value`) for `column`"""
+    negate = False
+    if expression.startswith("not."):
+        negate = True
+        expression = expression[4:]
+    op, _, value = expression.partition(".")
+    config = None
+    if "(" in op and op.endswith(")"):
+        op, _, config = op[:-1].partition("(")
+    if op not in _OPS:
+        raise PgError(400, "PGRST100", f'failed to parse filter ({expression})')
+    if op == "in":
+        if not (value.startswith("(") and value.endswith(")")):
+            raise PgError(400, "PGRST100", f'failed to parse filter ({expression})')
+        value = [_unquote_value(v) for v in _split_top_level(value[1:-1])] if value[1:-1] else []
+    elif op == "is":
+        lowered = value.lower()
+        value = {"null": None, "true": True, "false": False}.get(lowered, lowered)
+    else:
+        value = _unquote_value(value)
+    return Filter(column, op, value, negate, config)
+
+
+def parse_logic(kind, text, negate=False):
+    """Parse the body of or=(...) / and=(...) into a BoolGroup"""
+    if not (text.startswith("(") and text.endswith(")")):
+        raise PgError(400, "PGRST100", f"failed to parse logic tree ({text})")
+    items = []
+    for part in _split_top_level(text[1:-1]):
+        nested_negate = part.startswith("not.")
+        body = part[4:] if nested_negate else part
+        if body.startswith("or(") or body.startswith("and("):
+            nested_kind, _, rest = body.partition("(")
+            items.append(parse_logic(nested_kind, "(" + rest, nested_negate))
+        else:
+            column, _, expression = part.partition(".")
+            items.append(parse_condition(column, expression))
+    return BoolGroup(kind, items, negate)
+
+
+def _like_regex(pattern, flags=0):
+    """SQL LIKE -> regex, honouring backslash escapes; PostgREST also maps * to %"""
+    out, i = [], 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\" and i + 1 < len(pattern):
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+            continue
+        if ch in "%*":
+            out.append(".*")
+        elif ch == "_":
+            out.append(".")
+        else:
+            out.append(re.escape(ch))
+        i += 1
+    return re.compile("^" + "".join(out) + "$", flags | re.DOTALL)
+
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def _tsquery_matcher(op, query):
+    """
+    Approximate to_tsquery / plainto_tsquery / websearch_to_tsquery over a
+    lowercase word set: & and |, !negation and :* prefix terms.
+    No stemming or stop words - good enough to compare query plans.
+    """
+    if op in ("plfts", "phfts", "wfts"):
+        terms = [[(w, False, False)] for w in _WORD_RE.findall(query.lower())]
+    else:
+        terms = []
+        for conj in query.split("&"):
+            alternatives = []
+            for alt in conj.split("|"):
+                alt = alt.strip().strip("()").strip("'")
+                negated = alt.startswith("!")
+                alt = alt.lstrip("!")
+                prefix = alt.endswith(":*")
+                word = alt[:-2] if prefix else alt
+                words = _WORD_RE.findall(word.lower())
+                if words:
+                    alternatives.append((words[0], prefix, negated))
+            if alternatives:
+                terms.append(alternatives)
+
+    def match(text):
+        words = set(_WORD_RE.findall((text or "").lower()))
+        for alternatives in terms:
+            hit = False
+            for word, prefix, negated in alternatives:
+                found = any(w.startswith(word) for w in words) if prefix else word in words
+                if found != negated:
+                    hit = True
+                    break
+            if not hit:
+                return False
+        return bool(terms)
+    return match
+
+
+# ---------------------------------------------------------------------------
+# Database: PostgREST semantics + RLS from supabase/schema.sql
+# ---------------------------------------------------------------------------
+
+class Database:
+    def __init__(self, auth):
+        self.auth = auth
+        self.tables = {name: Table(name) for name in SCHEMA}
+        self.lock = threading.RLock()
+
+    # -- RLS -------------------------------------------------------------
+
+    def _visible(self, table, row, claims, command):
+        role = claims.get("role")
+        if role == "service_role":
+            return True
+        uid = claims.get("sub") if role == "authenticated" else None
+        if table == "events":
+            return uid is not None and row["user_id"] == uid
+        if table == "venues":
+            # SELECT and INSERT for authenticated users; no UPDATE or DELETE policy
+            return uid is not None and command in ("select", "insert")
+        if table == "event_venues":
+            if uid is None or command == "update":
+                return False
+            event = self.tables["events"].rows.get((row["event_id"],))
+            return event is not None and event["user_id"] == uid
+        return False
+
+    def _rls_violation(self, table, claims):
+        status = 401 if claims.get("role") == "anon" else 403
+        return PgError(status, "42501", f'new row violates row-level security policy for table "{table}"')
+
+    # -- helpers ---------------------------------------------------------
+
+    def _table(self, name):
+        if name not in self.tables:
+            raise PgError(404, "PGRST205", f"Could not find the table 'public.{name}' in the schema cache")
+        return self.tables[name]
+
+    def _column_type(self, table, column):
+        columns = SCHEMA[table]["columns"]
+        if column not in columns:
+            raise PgError(400, "42703", f"column {table}.{column} does not exist")
+        return columns[column][0]
+
+    def _bind(self, table, node):
+        """Cast filter literals to column types once, before scanning"""
+        if isinstance(node, BoolGroup):
+            for item in node.items:
+                self._bind(table, item)
+            return node
+        col_type = self._column_type(table, node.column)
+        if node.op == "in":
+            node.value = [cast(table, node.column, col_type, v) for v in node.value]
+        elif node.op in ("like", "ilike"):
+            node.value = _like_regex(node.value, re.IGNORECASE if node.op == "ilike" else 0)
+        elif node.op in ("fts", "plfts", "phfts", "wfts"):
+            node.value = _tsquery_matcher(node.op, node.value)
+        elif node.op != "is":
+            node.value = cast(table, node.column, col_type, node.value)
+        return node
+
+    def _matches(self, row, node):
+        if isinstance(node, BoolGroup):
+            results = (self._matches(row, item) for item in node.items)
+            result = any(results) if node.kind == "or" else all(results)
+            return result != node.negate
+        value = row.get(node.column)
+        op = node.op
+        if op == "is":
+            result = value is node.value if node.value in (None, True, False) else False
+        elif value is None:
+            # SQL three-valued logic: comparisons with NULL are never true, even negated
+            return False
+        elif op == "eq":
+            result = value == node.value
+        elif op == "neq":
+            result = value != node.value
+        elif op == "gt":
+            result = value > node.value
+        elif op == "gte":
+            result = value >= node.value
+        elif op == "lt":
+            result = value < node.value
+        elif op == "lte":
+            result = value <= node.value
+        elif op in ("like", "ilike"):
+            result = node.value.match(value) is not None
+        elif op == "in":
+            result = value in node.value
+        else:
+            result = node.value(value)
+        return result != node.negate
+
+    def _select_rows(self, table, filters, claims, command):
+        t = self._table(table)
+        simple = [f for f in filters if isinstance(f, Filter)]
+        return [
+            row for row in t.candidates(simple)
+            if self._visible(table, row, claims, command) and all(self._matches(row, f) for f in filters)
+        ]
+
+    def _shape(self, table, row, items, claims):
+        """Project a row through the select items, resolving embedded resources"""
+        out = {}
+        for item in items:
+            if item[0] == "col":
+                _, name, alias = item
+                if name == "*":
+                    for col in SCHEMA[table]["columns"]:
+                        out[col] = _to_json(row[col])
+                else:
+                    self._column_type(table, name)
+                    out[alias] = _to_json(row[name])
+                continue
+            _, target, alias, sub_items, inner = item
+            relation = RELATIONSHIPS.get((table, target))
+            if relation is None:
+                raise PgError(
+                    400, "PGRST200",
+                    f"Could not find a relationship between '{table}' and '{target}' in the schema cache",
+                )
+            cardinality, local_col, remote_col = relation
+            target_table = self.tables[target]
+            key_filter = Filter(remote_col, "eq", row[local_col])
+            related = [
+                r for r in target_table.candidates([key_filter])
+                if r[remote_col] == row[local_col] and self._visible(target, r, claims, "select")
+            ]
+            shaped = [self._shape(target, r, sub_items, claims) for r in related]
+            if cardinality == "one":
+                out[alias] = shaped[0] if shaped else None
+                if inner and not shaped:
+                    return None
+            else:
+                out[alias] = shaped
+                if inner and not shaped:
+                    return None
+        return out
+
+    def _order(self, table, rows, order):
+        if not order:
+            return rows
+        for term in reversed(order.split(",")):
+            parts = term.split(".")
+            column = parts[0]
+            self._column_type(table, column)
+            descending = "desc" in parts[1:]
+            nulls_first = "nullsfirst" in parts[1:]
+            nulls_last = "nullslast" in parts[1:]
+            non_null = [r for r in rows if r.get(column) is not None]
+            nulls = [r for r in rows if r.get(column) is None]
+            non_null.sort(key=lambda r: r[column], reverse=descending)
+            first_nulls = nulls_first or (descending and not nulls_last)
+            rows = nulls + non_null if first_nulls else non_null + nulls
+        return rows
+
+    # -- commands --------------------------------------------------------
+
+    def select(self, table, filters, claims, select="*", order=None, limit=None, offset=0):
+        with self.lock:
+            items = parse_select(select or "*")
+            rows = self._select_rows(table, filters, claims, "select")
+            rows = self._order(table, rows, order)
+            total = len(rows)
+            if offset:
+                rows = rows[offset:]
+            if limit is not None:
+                rows = rows[:limit]
+            shaped = [self._shape(table, r, items, claims) for r in rows]
+            return [r for r in shaped if r is not None], total
+
+    def _check_row(self, table, row, claims, command):
+        t = self.tables[table]
+        for column, (col_type, nullable, _) in SCHEMA[table]["columns"].items():
+            if row.get(column) is None and not nullable:
+                raise PgError(
+                    400, "23502",
+                    f'null value in column "{column}" of relation "{table}" violates not-null constraint',
+                )
+        for constraint, (column, ref_table, ref_column) in SCHEMA[table]["foreign_keys"].items():
+            value = row.get(column)
+            if value is None:
+                continue
+            exists = value in self.auth.users if ref_table == "auth.users" else (value,) in self.tables[ref_table].rows
+            if not exists:
+                raise PgError(
+                    409, "23503",
+                    f'insert or update on table "{table}" violates foreign key constraint "{constraint}"',
+                    details=f'Key ({column})=({value}) is not present in table "{ref_table.split(".")[-1]}".',
+                )
+        if not self._visible(table, row, claims, command):
+            raise self._rls_violation(table, claims)
+        return t
+
+    def _conflict(self, table, row, on_conflict):
+        """Existing row key that `row` collides with (pk, unique or on_conflict columns)"""
+        t = self.tables[table]
+        if on_conflict:
+            cols = tuple(on_conflict.split(","))
+            if cols == SCHEMA[table]["pk"]:
+                key = t.key(row)
+                return (key, f"{table}_pkey") if key in t.rows else (None, None)
+            for constraint, ucols in SCHEMA[table]["unique"].items():
+                if ucols == cols:
+                    key = t.unique[constraint].get(tuple(row[c] for c in cols))
+                    return (key, constraint) if key else (None, None)
+        key = t.key(row)
+        if key in t.rows:
+            return key, f"{table}_pkey"
+        for constraint, ucols in SCHEMA[table]["unique"].items():
+            existing = t.unique[constraint].get(tuple(row[c] for c in ucols))
+            if existing:
+                return existing, constraint
+        return None, None
+
+    def insert(self, table, payload, claims, resolution=None, on_conflict=None):
+        with self.lock:
+            t = self._table(table)
+            columns = SCHEMA[table]["columns"]
+            objects = payload if isinstance(payload, list) else [payload]
+            keys = set(objects[0]) if objects else set()
+            for obj in objects:
+                for column in obj:
+                    if column not in columns:
+                        raise PgError(400, "PGRST204", f"Could not find the '{column}' column of '{table}' in the schema cache")
+
+            prepared = []
+            for obj in objects:
+                row = {}
+                for column, (col_type, _, default) in columns.items():
+                    if column in keys:
+                        row[column] = cast(table, column, col_type, obj.get(column))
+                    else:
+                        row[column] = default() if default else None
+                prepared.append(row)
+
+            # Validate everything before writing so a failing statement changes nothing
+            staged = {}
+            written, updates = [], []
+            for row in prepared:
+                key, constraint = self._conflict(table, row, on_conflict)
+                if key is None and t.key(row) in staged:
+                    key, constraint = t.key(row), f"{table}_pkey"
+                if key is not None:
+                    if resolution == "ignore-duplicates":
+                        continue
+                    if resolution == "merge-duplicates":
+                        existing = staged.get(key) or t.rows[key]
+                        if not self._visible(table, existing, claims, "update"):
+                            raise self._rls_violation(table, claims)
+                        merged = {**existing, **{c: row[c] for c in keys}}
+                        self._check_row(table, merged, claims, "update")
+                        updates.append((key, merged))
+                        continue
+                    raise PgError(
+                        409, "23505", f'duplicate key value violates unique constraint "{constraint}"',
+                        details=f"Key ({', '.join(SCHEMA[table]['pk'])})=({', '.join(map(str, key))}) already exists.",
+                    )
+                staged[t.key(row)] = row
+                written.append(row)
+
+            # Self references (events.parent_event_id) may point at rows in the same statement
+            for row in written:
+                t.insert(row)
+            try:
+                for row in written:
+                    self._check_row(table, row, claims, "insert")
+            except PgError:
+                for row in written:
+                    t.remove(t.key(row))
+                raise
+            for key, merged in updates:
+                t.remove(key)
+                t.insert(merged)
+                written.append(merged)
+            return written
+
+    def update(self, table, filters, patch, claims):
+        with self.lock:
+            t = self._table(table)
+            columns = SCHEMA[table]["columns"]
+            values = {}
+            for column, value in patch.items():
+                if column not in columns:
+                    raise PgError(400, "PGRST204", f"Could not find the '{column}' column of '{table}' in the schema cache")
+                values[column] = cast(table, column, columns[column][0], value)
+            targets = self._select_rows(table, filters, claims, "update")
+            updated = []
+            for row in targets:
+                new_row = {**row, **values}
+                self._check_row(table, new_row, claims, "update")
+                updated.append((t.key(row), new_row))
+            for key, new_row in updated:
+                t.remove(key)
+                t.insert(new_row)
+            return [r for _, r in updated]
+
+    def delete(self, table, filters, claims):
+        with self.lock:
+            t = self._table(table)
+            targets = self._select_rows(table, filters, claims, "delete")
+            deleted = []
+            for row in targets:
+                key = t.key(row)
+                if key in t.rows:
+                    deleted.append(t.remove(key))
+                    self._cascade(table, row)
+            return deleted
+
+    def _cascade(self, table, row):
+        for child_table, child_col, parent_col in CASCADES.get(table, ()):
+            child = self.tables[child_table]
+            for child_row in child.candidates([Filter(child_col, "eq", row[parent_col])]):
+                if child_row[child_col] == row[parent_col] and child.key(child_row) in child.rows:
+                    child.remove(child.key(child_row))
+                    self._cascade(child_table, child_row)
+
+    def reset(self):
+        with self.lock:
+            self.tables = {name: Table(name) for name in SCHEMA}
+
+
+# ---------------------------------------------------------------------------
+# HTTP layer
+# ---------------------------------------------------------------------------
+
+_RESERVED_PARAMS = {"select", "order", "limit", "offset", "on_conflict", "columns"}
+
+_CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Headers": "authorization, x-client-info, apikey, content-type, prefer, accept-profile, content-profile, range, x-supabase-api-version",
+    "Access-Control-Allow-Methods": "GET, POST, PATCH, PUT, DELETE, OPTIONS, HEAD",
+    "Access-Control-Expose-Headers": "Content-Range",
+}
+
+_REASONS = {200: "OK", 201: "Created", 204: "No Content", 400: "Bad Request", 401: "Unauthorized",
+            403: "Forbidden", 404: "Not Found", 406: "Not Acceptable", 409: "Conflict",
+            413: "Payload Too Large", 422: "Unprocessable Entity", 500: "Internal Server Error"}
+
+
+class Request:
+    __slots__ = ("method", "path", "query", "headers", "body")
+
+    def __init__(self, method, path, query, headers, body):
+        self.method = method
+        self.path = path
+        self.query = query
+        self.headers = headers
+        self.body = body
+
+    def json(self):
+        if not self.body:
+            return None
+        try:
+            return json.loads(self.body)
+        except ValueError:
+            raise PgError(400, "PGRST102", "Empty or invalid json")
+
+    def auth_json(self):
+        """JSON object body of a GoTrue request ({} when empty)"""
+        try:
+            body = self.json()
+        except PgError:
+            body = []
+        if not isinstance(body, (dict, type(None))):
+            raise AuthError(400, "bad_json", "Could not parse request body as JSON")
+        return body or {}
+
+    def param(self, name, default=None):
+        for key, value in self.query:
+            if key == name:
+                return value
+        return default
+
+    def int_param(self, name, default=None):
+        """Non-negative integer query parameter such as limit/offset"""
+        value = self.param(name)
+        if value is None or value == "":
+            return default
+        if not value.isdigit():
+            raise PgError(400, "PGRST100", f'"failed to parse {name} parameter ({value})"',
+                          details=f"unexpected {value[:1]!r} expecting digit")
+        return int(value)
+
+    def prefer(self):
+        prefs = {}
+        for part in self.headers.get("prefer", "").split(","):
+            key, _, value = part.strip().partition("=")
+            if key:
+                prefs[key] = value
+        return prefs
+
+
+class LocalSupabase:
+    """
+    In-process Supabase stand-in.
+
+    Usage:
+        server = LocalSupabase(port=54321, users=[("qa@example.com", "secret")])
+        server.start_in_thread()
+        ...
+        server.stop()
+    """
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, jwt_secret=DEFAULT_JWT_SECRET, users=()):
+        self.host = host
+        self.port = port
+        self.jwt_secret = jwt_secret
+        self.auth = Auth(jwt_secret)
+        self.db = Database(self.auth)
+        self.stats = defaultdict(int)
+        self._server = None
+        self._loop = None
+        self._thread = None
+        self._connections = set()
+        for email, password in users:
+            self.auth.create_user(email, password)
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def anon_key(self):
+        return anon_key(self.jwt_secret)
+
+    @property
+    def service_role_key(self):
+        return service_role_key(self.jwt_secret)
+
+    # -- lifecycle -------------------------------------------------------
+
+    async def start(self):
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port, limit=MAX_REQUEST_LINE,
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    def start_in_thread(self):
+        """Run the server on a daemon thread; returns once it is accepting connections"""
+        ready = threading.Event()
+        failure = []
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            try:
+                self._loop.run_until_complete(self.start())
+            except OSError as e:
+                failure.append(e)
+                ready.set()
+                return
+            ready.set()
+            self._loop.run_forever()
+            self._loop.run_until_complete(self._shutdown())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name="local-supabase", daemon=True)
+        self._thread.start()
+        ready.wait()
+        if failure:
+            raise failure[0]
+        return self
+
+    async def _shutdown(self):
+        self._server.close()
+        for task in list(self._connections):
+            task.cancel()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        await self._server.wait_closed()
+
+    def stop(self):
+        if self._loop and self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    # -- connection handling ---------------------------------------------
+
+    async def _read_request(self, reader):
+        request_line = await reader.readline()
+        if not request_line:
+            return None
+        method, target, _ = request_line.decode("latin-1").split(" ", 2)
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await reader.readline()
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            body = b"".join(chunks)
+        else:
+            length = int(headers.get("content-length") or 0)
+            body = await reader.readexactly(length) if length else b""
+
+        parts = urlsplit(target)
+        query = parse_qsl(parts.query, keep_blank_values=True)
+        return Request(method.upper(), unquote(parts.path), query, headers, body)
+
+    async def _handle_connection(self, reader, writer):
+        task = asyncio.current_task()
+        self._connections.add(task)
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                status, headers, body = self.dispatch(request)
+                payload = b"" if body is None else (body if isinstance(body, bytes) else json.dumps(body).encode())
+                head = [f"HTTP/1.1 {status} {_REASONS.get(status, 'OK')}"]
+                merged = {**_CORS_HEADERS, **headers}
+                if payload:
+                    merged.setdefault("Content-Type", "application/json; charset=utf-8")
+                merged["Content-Length"] = str(len(payload))
+                head.extend(f"{k}: {v}" for k, v in merged.items())
+                writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1"))
+                if request.method != "HEAD":
+                    writer.write(payload)
+                await writer.drain()
+                if request.headers.get("connection", "").lower() == "close":
+                    break
+        except (asyncio.IncompleteReadError, ConnectionResetError, ValueError, asyncio.CancelledError):
+            pass
+        finally:
+            self._connections.discard(task)
+            writer.close()
+
+    # -- routing ---------------------------------------------------------
+
+    def dispatch(self, request):
+        """Route one request; returns (status, headers, body)"""
+        if request.method == "OPTIONS":
+            return 204, {}, None
+        try:
+            if request.path.startswith("/auth/v1/"):
+                self.stats["auth"] += 1
+                return self._auth(request, request.path[len("/auth/v1/"):])
+            if request.path.startswith("/rest/v1/"):
+                table = request.path[len("/rest/v1/"):].strip("/")
+                self.stats["rest"] += 1
+                self.stats[f"{request.method} {table}"] += 1
+                return self._rest(request, table)
+            if request.path.startswith("/__admin/"):
+                return self._admin(request, request.path[len("/__admin/"):])
+            return 404, {}, {"message": "Not found"}
+        except PgError as e:
+            return e.status, {}, e.body
+        except AuthError as e:
+            return e.status, {}, e.body
+        except Exception as e:  # a stand-in bug must still answer, not drop the connection
+            traceback.print_exc()
+            return 500, {}, {"code": "XX000", "message": f"{type(e).__name__}: {e}", "details": None, "hint": None}
+
+    def _claims(self, request):
+        """Role/claims from the bearer token; unknown or anon keys act as the anon role"""
+        header = request.headers.get("authorization", "")
+        token = header[7:] if header.lower().startswith("bearer ") else request.headers.get("apikey", "")
+        claims = self.auth.claims(token)
+        if claims is None:
+            if token and token != request.headers.get("apikey"):
+                raise PgError(401, "PGRST301", "JWT expired or invalid")
+            return {"role": "anon"}
+        return claims
+
+    @staticmethod
+    def _auth_field(body, name):
+        value = body.get(name)
+        if value is not None and not isinstance(value, str):
+            raise AuthError(400, "validation_failed", f"{name} must be a string")
+        return value
+
+    def _auth(self, request, endpoint):
+        body = request.auth_json()
+        email, password = self._auth_field(body, "email"), self._auth_field(body, "password")
+        if endpoint == "token":
+            grant = request.param("grant_type")
+            if grant == "password":
+                return 200, {}, self.auth.password_grant(email, password)
+            if grant == "refresh_token":
+                return 200, {}, self.auth.refresh_grant(self._auth_field(body, "refresh_token"))
+            raise AuthError(400, "unsupported_grant_type", f"Unsupported grant type: {grant}")
+        if endpoint == "signup":
+            if not email or not password:
+                raise AuthError(400, "validation_failed", "Signup requires a valid email and password")
+            self.auth.create_user(email, password)
+            return 200, {}, self.auth.password_grant(email, password)
+        if endpoint == "recover":
+            return 200, {}, {}
+        if endpoint == "settings":
+            return 200, {}, {"external": {"email": True, "google": False}, "disable_signup": False, "autoconfirm": True}
+
+        header = request.headers.get("authorization", "")
+        claims = self.auth.claims(header[7:]) if header.lower().startswith("bearer ") else None
+        if endpoint == "user":
+            if not claims or claims.get("role") != "authenticated":
+                raise AuthError(403, "session_not_found", "Session from session_id claim in JWT does not exist")
+            return 200, {}, self.auth.public_user(claims["sub"])
+        if endpoint == "logout":
+            if claims and claims.get("role") == "authenticated":
+                self.auth.sign_out(claims, request.param("scope", "global"))
+            return 204, {}, None
+        raise AuthError(404, "not_found", f"Unsupported auth endpoint: {endpoint}")
+
+    def _filters(self, request):
+        filters = []
+        for key, value in request.query:
+            if key in _RESERVED_PARAMS:
+                continue
+            if key in ("or", "and", "not.or", "not.and"):
+                negate = key.startswith("not.")
+                filters.append(parse_logic(key.split(".")[-1], value, negate))
+            else:
+                filters.append(parse_condition(key, value))
+        return filters
+
+    def _rest(self, request, table):
+        claims = self._claims(request)
+        filters = [self.db._bind(table, f) for f in self._filters(request)] if table in SCHEMA else []
+        prefer = request.prefer()
+        wants_object = "application/vnd.pgrst.object+json" in request.headers.get("accept", "")
+        headers = {}
+
+        if request.method in ("GET", "HEAD"):
+            rows, total = self.db.select(
+                table, filters, claims,
+                select=request.param("select", "*"),
+                order=request.param("order"),
+                limit=request.int_param("limit"),
+                offset=request.int_param("offset", 0),
+            )
+            if prefer.get("count"):
+                headers["Content-Range"] = f"0-{len(rows) - 1}/{total}" if rows else f"*/{total}"
+            return self._respond(200, headers, rows, wants_object)
+
+        representation = prefer.get("return") == "representation"
+        select = request.param("select", "*")
+
+        if request.method == "POST":
+            payload = request.json()
+            objects = payload if isinstance(payload, list) else [payload]
+            if not all(isinstance(obj, dict) for obj in objects):
+                raise PgError(400, "PGRST102", "All object keys must match",
+                              details="Expected a JSON object or an array of JSON objects")
+            written = self.db.insert(
+                table, payload, claims,
+                resolution=prefer.get("resolution"),
+                on_conflict=request.param("on_conflict"),
+            )
+            return self._respond(201, headers, self._project(table, written, select, claims) if representation else None, wants_object)
+
+        if request.method == "PATCH":
+            patch = request.json()
+            if patch is not None and not isinstance(patch, dict):
+                raise PgError(400, "PGRST102", "Empty or invalid json",
+                              details="PATCH expects a single JSON object")
+            updated = self.db.update(table, filters, patch or {}, claims)
+            if not representation:
+                return 204, headers, None
+            return self._respond(200, headers, self._project(table, updated, select, claims), wants_object)
+
+        if request.method == "DELETE":
+            deleted = self.db.delete(table, filters, claims)
+            if not representation:
+                return 204, headers, None
+            return self._respond(200, headers, self._project(table, deleted, select, claims), wants_object)
+
+        return 405, {}, {"message": f"Method {request.method} not allowed"}
+
+    def _project(self, table, rows, select, claims):
+        items = parse_select(select)
+        with self.db.lock:
+            return [self.db._shape(table, r, items, claims) for r in rows]
+
+    @staticmethod
+    def _respond(status, headers, rows, wants_object):
+        if rows is None:
+            return status, headers, None
+        if wants_object:
+            if len(rows) != 1:
+                raise PgError(
+                    406, "PGRST116", "JSON object requested, multiple (or no) rows returned",
+                    details=f"The result contains {len(rows)} rows",
+                )
+            return status, {**headers, "Content-Type": "application/vnd.pgrst.object+json; charset=utf-8"}, rows[0]
+        return status, headers, rows
+
+    def _admin(self, request, endpoint):
+        """Test-only controls: stats, reset, user creation"""
+        if endpoint == "stats":
+            return 200, {}, dict(self.stats)
+        if endpoint == "stats/reset":
+            self.stats.clear()
+            return 204, {}, None
+        if endpoint == "reset":
+            self.db.reset()
+            self.stats.clear()
+            return 204, {}, None
+        if endpoint == "users" and request.method == "POST":
+            body = request.json() or {}
+            try:
+                return 201, {}, self.auth.create_user(body["email"], body["password"])
+            except AuthError:
+                user_id = self.auth.users_by_email[body["email"].lower()]
+                return 200, {}, self.auth.public_user(user_id)
+        return 404, {}, {"message": "Not found"}
+
+
+def accounts_from_env():
+    """(email, password) pairs from TEST_ACCOUNTS and TEST_EMAIL/TEST_PASSWORD"""
+    accounts = []
+    for entry in os.getenv("TEST_ACCOUNTS", "").split(","):
+        email, _, password = entry.strip().partition(":")
+        if email and password:
+            accounts.append((email, password))
+    accounts.append((os.getenv("TEST_EMAIL", "test@example.com"), os.getenv("TEST_PASSWORD", "testpassword123")))
+    seen, unique = set(), []
+    for email, password in accounts:
+        if email.lower() not in seen:
+            seen.add(email.lower())
+            unique.append((email, password))
+    return unique
+
+
+def port_open(port, host=DEFAULT_HOST):
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.settimeout(0.5)
+        return sock.connect_ex((host, port)) == 0
+
+
+def ensure_running(port=DEFAULT_PORT, accounts=(), host=DEFAULT_HOST):
+    """
+    Start a stand-in on a daemon thread unless one is already listening on
+    `port`, then make sure every (email, password) in `accounts` exists on it.
+    Returns the server it started, or None when an existing one was reused.
+    """
+    server = None
+    if not port_open(port, host):
+        server = LocalSupabase(host, port).start_in_thread()
+    for email, password in accounts:
+        request = urllib.request.Request(
+            f"http://{host}:{port}/__admin/users",
+            data=json.dumps({"email": email, "password": password}).encode(),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        urllib.request.urlopen(request, timeout=5).close()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Supabase stand-in (GoTrue + PostgREST subset)")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=int(os.getenv("LOCAL_SUPABASE_PORT", DEFAULT_PORT)))
+    parser.add_argument("--jwt-secret", default=os.getenv("LOCAL_SUPABASE_JWT_SECRET", DEFAULT_JWT_SECRET))
+    parser.add_argument("--user", action="append", default=[], metavar="EMAIL:PASSWORD",
+                        help="Extra account to create (TEST_ACCOUNTS / TEST_EMAIL are always created)")
+    args = parser.parse_args()
+
+    users = accounts_from_env() + [tuple(u.split(":", 1)) for u in args.user]
+    server = LocalSupabase(args.host, args.port, args.jwt_secret, users=users)
+
+    async def serve():
+        await server.start()
+        print(f"Local Supabase listening on {server.url}")
+        print(f"  NEXT_PUBLIC_SUPABASE_URL={server.url}")
+        print(f"  NEXT_PUBLIC_SUPABASE_ANON_KEY={server.anon_key}")
+        print(f"  users: {', '.join(email for email, _ in users)}")
+        await server._server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
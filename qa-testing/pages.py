@@ -0,0 +1,422 @@
+"""
+Page objects for the Fastbreak UI
+Every element has one stable locator (its data-testid) plus structural fallbacks
+for builds that predate the test ids. All candidates of all requested elements
+are resolved in a single execute_script round-trip, so a miss never costs the
+driver's implicit wait and no test walks a chain of XPath try/excepts.
+"""
+from urllib.parse import urlencode
+
+from waits import (
+    wait_for,
+    get_and_settle,
+    navigation_settled,
+    react_hydrated,
+    radix_select_open,
+    radix_select_closed,
+    dialog_open,
+    dialog_closed,
+    input_value_equals,
+    text_present,
+    url_contains,
+    track_server_actions,
+    server_action_completed,
+)
+
+
+class Locator:
+    """
+    A named element lookup: ("css" | "xpath", selector) candidates tried in
+    order. Candidates are kept in the JSON shape _LOCATE_JS expects, so a
+    lookup sends them as-is.
+    """
+
+    def __init__(self, name, *candidates):
+        self.name = name
+        self.candidates = [[kind, selector] for kind, selector in candidates]
+
+    def __repr__(self):
+        return f"Locator({self.name!r})"
+
+
+def by_testid(testid, *fallbacks, name=None):
+    """Locator for [data-testid=testid], then `fallbacks`"""
+    return Locator(name or testid, ("css", f"[data-testid='{testid}']"), *fallbacks)
+
+
+def xpath_literal(text):
+    """Quote `text` for an XPath expression, including text with both quote kinds"""
+    if "'" not in text:
+        return f"'{text}'"
+    if '"' not in text:
+        return f'"{text}"'
+    parts = text.split("'")
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in parts) + ")"
+
+
+# Shared by the scripts below: query(kind, selector) within `scope`
+_QUERY_JS = """
+const query = (scope, kind, selector) => {
+  if (kind === 'css') return Array.from(scope.querySelectorAll(selector));
+  const snapshot = document.evaluate(selector, scope, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+  const nodes = [];
+  for (let i = 0; i < snapshot.snapshotLength; i++) nodes.push(snapshot.snapshotItem(i));
+  return nodes;
+};
+const isVisible = el => el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden';
+"""
+
+# Resolves a list of locators in one round-trip. Returns, per locator, the index
+# of the candidate that matched (-1 for none) and the element (or all elements).
+_LOCATE_JS = _QUERY_JS + """
+const [locators, root, all, visibleOnly] = arguments;
+const scope = root || document;
+return locators.map(candidates => {
+  for (let i = 0; i < candidates.length; i++) {
+    const found = query(scope, candidates[i][0], candidates[i][1]).filter(el => !visibleOnly || isVisible(el));
+    if (found.length) return [i, all ? found : found[0]];
+  }
+  return [-1, all ? [] : null];
+});
+"""
+
+# Describes a list of locators in one round-trip: for the first matching
+# candidate, the match count and the first element's visibility, text and
+# requested attributes.
+_SNAPSHOT_JS = _QUERY_JS + """
+const [fields, root] = arguments;
+const scope = root || document;
+return fields.map(([candidates, attributes]) => {
+  for (let i = 0; i < candidates.length; i++) {
+    const found = query(scope, candidates[i][0], candidates[i][1]);
+    if (!found.length) continue;
+    const el = found[0];
+    const attrs = {};
+    for (const name of attributes) attrs[name] = el.getAttribute(name);
+    return [i, {present: true, count: found.length, visible: isVisible(el),
+                text: (el.innerText || el.textContent || '').trim(), attributes: attrs, element: el}];
+  }
+  return [-1, {present: false, count: 0, visible: false, text: '', attributes: {}, element: null}];
+});
+"""
+
+# Locators that only matched a fallback - reported once so missing test ids get noticed
+_fallback_reported = set()
+
+
+def locate(driver, *locators, root=None, all=False, visible=False):
+    """
+    Resolve `locators` in one execute_script call. Returns a list with one
+    element per locator (None when absent), or lists of elements with all=True.
+    `root` limits the search to a subtree; `visible` skips elements without layout.
+    """
+    results = driver.execute_script(_LOCATE_JS, [loc.candidates for loc in locators], root, all, visible)
+    elements = []
+    for locator, (index, found) in zip(locators, results):
+        _report_fallback(locator, index)
+        elements.append(found)
+    return elements
+
+
+def _report_fallback(locator, index):
+    if index > 0 and locator.name not in _fallback_reported:
+        _fallback_reported.add(locator.name)
+        print(f"⚠️ {locator.name}: data-testid not found, matched fallback {locator.candidates[index][1]}")
+
+
+def snapshot(driver, fields, root=None):
+    """
+    State of several elements from one execute_script call, for assertion groups
+    that would otherwise cost a round-trip per find / is_displayed / text.
+
+    `fields` maps a key to a Locator, or to (Locator, [attribute names]). Each
+    key maps to {"present", "count", "visible", "text", "attributes", "element"}
+    describing the first match; "element" can be clicked without another lookup.
+    """
+    specs = [field if isinstance(field, tuple) else (field, ()) for field in fields.values()]
+    results = driver.execute_script(
+        _SNAPSHOT_JS, [[locator.candidates, list(attributes)] for locator, attributes in specs], root,
+    )
+    states = {}
+    for key, (locator, _), (index, state) in zip(fields, specs, results):
+        _report_fallback(locator, index)
+        states[key] = state
+    return states
+
+
+def located(*locators, root=None, visible=True):
+    """Wait condition: every locator resolves; returns the elements (or the element for one locator)"""
+    def _predicate(driver):
+        elements = locate(driver, *locators, root=root, visible=visible)
+        if not all(elements):
+            return None
+        return elements[0] if len(elements) == 1 else elements
+    _predicate.wait_name = "located: " + ", ".join(loc.name for loc in locators)
+    return _predicate
+
+
+def set_react_input(driver, element, value):
+    """Set a React-controlled input through the native setter so onChange fires"""
+    driver.execute_script("""
+        const input = arguments[0];
+        const value = arguments[1];
+        const nativeInputValueSetter = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, 'value').set;
+        nativeInputValueSetter.call(input, value);
+        input.dispatchEvent(new Event('input', { bubbles: true }));
+        input.dispatchEvent(new Event('change', { bubbles: true }));
+    """, element, value)
+
+
+def click(driver, element):
+    """Scroll an element to the middle of the viewport and click it"""
+    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+    element.click()
+
+
+class Page:
+    """Base page: a route plus helpers that resolve this page's locators"""
+
+    path = "/"
+
+    def __init__(self, driver, base_url):
+        self.driver = driver
+        self.base_url = base_url
+
+    @property
+    def url(self):
+        return f"{self.base_url}{self.path}"
+
+    def open(self, **params):
+        query = {k: v for k, v in params.items() if v is not None}
+        get_and_settle(self.driver, self.url + (f"?{urlencode(query)}" if query else ""))
+        return self
+
+    def find(self, *locators, **kwargs):
+        """Elements for `locators` (None where absent), one round-trip, no waiting"""
+        return locate(self.driver, *locators, **kwargs)
+
+    def snapshot(self, root=None, **fields):
+        """snapshot() of `fields` (key=Locator or key=(Locator, [attributes])), one round-trip"""
+        return snapshot(self.driver, fields, root=root)
+
+    def wait(self, *locators, timeout=10, root=None):
+        """Wait until every locator resolves to a visible element and return the element(s)"""
+        return wait_for(self.driver, located(*locators, root=root), timeout=timeout)
+
+
+class LoginPage(Page):
+    path = "/login"
+
+    EMAIL = by_testid("login-email", ("css", "input[name='email']"))
+    PASSWORD = by_testid("login-password", ("css", "input[name='password']"))
+    SUBMIT = by_testid("login-submit", ("xpath", "//button[contains(., 'Sign In')]"))
+    GOOGLE = by_testid("login-google", ("xpath", "//button[contains(., 'Google')]"))
+    SIGNUP_LINK = by_testid("signup-link", ("css", "a[href='/signup']"))
+
+    def open(self, **params):
+        super().open(**params)
+        wait_for(self.driver, react_hydrated("form"), timeout=15)
+        return self
+
+    def login(self, email, password):
+        """Fill the form and submit; the caller waits for the outcome"""
+        email_input, password_input, submit = self.wait(self.EMAIL, self.PASSWORD, self.SUBMIT, timeout=15)
+        email_input.clear()
+        email_input.send_keys(email)
+        password_input.clear()
+        password_input.send_keys(password)
+        submit.click()
+
+
+class DashboardPage(Page):
+    path = "/dashboard"
+
+    HEADING = by_testid("dashboard-heading", ("xpath", "//h1[contains(., 'Events Dashboard')]"))
+    NEW_EVENT = by_testid("new-event-link", ("css", "a[href='/events/new']"))
+    SEARCH_INPUT = by_testid("search-input", ("css", "input[placeholder*='Search' i]"))
+    SEARCH_BUTTON = by_testid("search-button", ("xpath", "//button[normalize-space(.)='Search']"))
+    SPORT_FILTER = by_testid("sport-filter", ("css", "button[role='combobox']"))
+    DATE_FILTER = by_testid("date-filter", ("xpath", "(//button[@role='combobox'])[2]"))
+    EVENT_CARD = by_testid("event-card", ("css", "div.group.flex-col"))
+    CARD_NAME = by_testid("event-card-name", ("css", "h3, [class*='font-bold']"))
+    EDIT_LINK = by_testid("event-edit-link", ("css", "a[href$='/edit']"))
+    DELETE_BUTTON = by_testid("event-delete-button", ("xpath", ".//button[contains(., 'Delete')]"))
+    ERROR = by_testid("events-error", ("css", "p.text-destructive"))
+    SIGN_OUT = by_testid("sign-out-button", ("xpath", "//button[contains(., 'Sign Out') or contains(., 'Log out')]"))
+
+    def open(self, search=None, sport=None, date=None):
+        super().open(search=search, sport=sport, date=date)
+        wait_for(self.driver, navigation_settled("/dashboard"))
+        return self
+
+    def sport_option(self, sport):
+        return by_testid(
+            f"sport-filter-option-{sport}",
+            ("xpath", f"//*[@role='option'][normalize-space(.)={xpath_literal(sport)}]"),
+            name=f"sport filter option {sport}",
+        )
+
+    def search(self, term):
+        """Type `term`, press Search and wait for the URL to carry it"""
+        search_input, search_button = self.wait(self.SEARCH_INPUT, self.SEARCH_BUTTON)
+        search_input.clear()
+        search_input.send_keys(term)
+        search_button.click()
+        wait_for(self.driver, url_contains("search="))
+
+    def filter_sport(self, sport):
+        """Pick `sport` in the sport filter and wait for the URL to carry it"""
+        self.wait(self.SPORT_FILTER).click()
+        wait_for(self.driver, radix_select_open())
+        self.wait(self.sport_option(sport)).click()
+        wait_for(self.driver, url_contains("sport="))
+
+    def event_cards(self):
+        return self.find(self.EVENT_CARD, all=True)[0]
+
+    def card(self, name, timeout=10):
+        """The event card titled `name`"""
+        title = xpath_literal(name)
+        locator = Locator(
+            f"event card {name}",
+            ("xpath", f"//*[@data-testid='event-card'][.//*[@data-testid='event-card-name'][normalize-space(.)={title}]]"),
+            # Without test ids: the innermost flex column holding both the title and an Edit link
+            ("xpath", f"(//div[contains(@class, 'flex-col')][.//a[contains(@href, '/edit')]]"
+                      f"[.//*[normalize-space(.)={title}]])[last()]"),
+        )
+        return self.wait(locator, timeout=timeout)
+
+    def edit_event(self, name):
+        """Open the edit form of the event titled `name`"""
+        click(self.driver, self.wait(self.EDIT_LINK, root=self.card(name)))
+        wait_for(self.driver, navigation_settled("/edit"))
+        return EventFormPage(self.driver, self.base_url).ready()
+
+    def delete_event(self, name):
+        """Open the delete confirmation of the event titled `name`"""
+        click(self.driver, self.wait(self.DELETE_BUTTON, root=self.card(name)))
+        wait_for(self.driver, dialog_open())
+        return DeleteEventDialog(self.driver)
+
+
+class EventFormPage(Page):
+    """The create (/events/new) and edit (/events/[id]/edit) form"""
+
+    path = "/events/new"
+
+    FORM = by_testid("event-form", ("css", "form"))
+    NAME = by_testid("event-name-input", ("css", "input[name='name']"))
+    SPORT_SELECT = by_testid("event-sport-select", ("css", "form button[role='combobox']"))
+    DATETIME = by_testid("event-datetime-input", ("css", "input[type='datetime-local']"))
+    DESCRIPTION = by_testid("event-description-input", ("css", "input[name='description']"))
+    LOCATION = by_testid("event-location-input", ("css", "input[name='location']"))
+    VENUE_INPUT = by_testid("venue-input", ("css", "input[placeholder*='venue' i]"))
+    VENUE_ADD = by_testid("venue-add-button", ("xpath", "//button[normalize-space(.)='Add']"))
+    SUBMIT = by_testid("event-form-submit", ("css", "form button[type='submit']"))
+    ERROR = by_testid("event-form-error", ("css", "form p.text-destructive"))
+
+    @classmethod
+    def edit(cls, driver, base_url, event_id):
+        page = cls(driver, base_url)
+        page.path = f"/events/{event_id}/edit"
+        return page
+
+    def open(self, **params):
+        super().open(**params)
+        return self.ready()
+
+    def ready(self):
+        """Wait until the form is hydrated, so client-side handlers fire"""
+        wait_for(self.driver, react_hydrated("form"))
+        return self
+
+    def sport_option(self, sport):
+        return by_testid(
+            f"event-sport-option-{sport}",
+            ("xpath", f"//*[@role='option'][normalize-space(.)={xpath_literal(sport)}]"),
+            name=f"sport option {sport}",
+        )
+
+    def _set(self, locator, value):
+        element = self.wait(locator)
+        set_react_input(self.driver, element, value)
+        wait_for(self.driver, input_value_equals(element, value))
+        return element
+
+    def set_name(self, name):
+        return self._set(self.NAME, name)
+
+    def set_datetime(self, value):
+        """`value` in datetime-local format, e.g. 2025-01-31T14:00"""
+        return self._set(self.DATETIME, value)
+
+    def set_description(self, text):
+        return self._set(self.DESCRIPTION, text)
+
+    def set_location(self, text):
+        return self._set(self.LOCATION, text)
+
+    def select_sport(self, sport):
+        self.wait(self.SPORT_SELECT).click()
+        wait_for(self.driver, radix_select_open())
+        self.wait(self.sport_option(sport)).click()
+        wait_for(self.driver, radix_select_closed())
+
+    def add_venue(self, venue):
+        venue_input, add_button = self.wait(self.VENUE_INPUT, self.VENUE_ADD)
+        set_react_input(self.driver, venue_input, venue)
+        wait_for(self.driver, input_value_equals(venue_input, venue))
+        click(self.driver, add_button)
+        wait_for(self.driver, text_present(venue))
+
+    def fill(self, name=None, sport=None, starts_at=None, description=None, location=None, venues=()):
+        """Fill the given fields; None leaves a field untouched"""
+        if name is not None:
+            self.set_name(name)
+        if sport is not None:
+            self.select_sport(sport)
+        if starts_at is not None:
+            self.set_datetime(starts_at)
+        if description is not None:
+            self.set_description(description)
+        if location is not None:
+            self.set_location(location)
+        for venue in venues:
+            self.add_venue(venue)
+        return self
+
+    def submit(self):
+        """Click submit with server-action tracking on; the caller picks what to wait for"""
+        submit = self.wait(self.SUBMIT)
+        track_server_actions(self.driver)
+        click(self.driver, submit)
+
+    def submit_and_wait(self, timeout=15):
+        """Submit, wait for the server action and the redirect to /dashboard"""
+        self.submit()
+        wait_for(self.driver, server_action_completed(), timeout=timeout)
+        wait_for(self.driver, navigation_settled("/dashboard"), timeout=timeout)
+        return DashboardPage(self.driver, self.base_url)
+
+
+class DeleteEventDialog:
+    """The confirmation dialog opened by an event card's Delete button"""
+
+    DIALOG = by_testid("delete-event-dialog", ("css", "[role='dialog']"))
+    CONFIRM = by_testid("delete-event-confirm", ("xpath", "//*[@role='dialog']//button[normalize-space(.)='Delete']"))
+    CANCEL = by_testid("delete-event-cancel", ("xpath", "//*[@role='dialog']//button[normalize-space(.)='Cancel']"))
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def confirm(self, timeout=15):
+        """Confirm, wait for the delete action and for the dialog to close"""
+        confirm_button = wait_for(self.driver, located(self.CONFIRM))
+        track_server_actions(self.driver)
+        confirm_button.click()
+        wait_for(self.driver, server_action_completed(), timeout=timeout)
+        wait_for(self.driver, dialog_closed(), timeout=timeout)
+
+    def cancel(self):
+        wait_for(self.driver, located(self.CANCEL)).click()
+        wait_for(self.driver, dialog_closed())
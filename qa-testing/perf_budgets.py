@@ -0,0 +1,152 @@
+"""
+Web-vitals budgets for key routes
+Loads budgets.yaml, measures TTFB / FCP / LCP / JS bytes / server-action latency
+in Chrome over warm and cold iterations (using devtools_timing.py), compares the
+medians with the budget and appends every result to a trend file.
+
+Show the trend for recent commits:
+    python perf_budgets.py trend [route]
+"""
+import json
+import os
+import statistics
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import yaml
+from selenium.common.exceptions import TimeoutException
+
+import devtools_timing
+from helpers import git_commit
+from waits import wait_for, navigation_settled
+
+
+BUDGETS_PATH = Path(__file__).parent / "budgets.yaml"
+# Point PERF_TREND_PATH at a persistent location (e.g. a CI cache) to keep history across runs
+TREND_PATH = Path(os.getenv("PERF_TREND_PATH", Path(__file__).parent / "reports" / "perf-trend.jsonl"))
+
+METRICS = ("ttfb_ms", "fcp_ms", "lcp_ms", "js_bytes", "server_action_ms")
+MODES = ("cold", "warm")
+
+
+def load_budgets(path=BUDGETS_PATH):
+    """Parse the budget file; raises ValueError on unknown modes or metrics"""
+    with open(path, encoding="utf-8") as f:
+        data = yaml.safe_load(f) or {}
+    defaults = data.get("defaults", {})
+    routes = data.get("routes", {})
+    for route, modes in routes.items():
+        for mode, metrics in (modes or {}).items():
+            if mode not in MODES:
+                raise ValueError(f"{path}: {route}: unknown mode '{mode}' (expected {', '.join(MODES)})")
+            unknown = set(metrics or {}) - set(METRICS)
+            if unknown:
+                raise ValueError(f"{path}: {route} {mode}: unknown metrics {', '.join(sorted(unknown))}")
+    iterations = int(os.getenv("PERF_ITERATIONS", defaults.get("iterations", 3)))
+    return {"iterations": iterations, "routes": routes}
+
+
+def _settle_paint(driver, timeout=5):
+    """LCP is only reported after a paint; give the observers a moment to fire"""
+    try:
+        wait_for(driver, lambda d: d.execute_script(
+            "try { return (JSON.parse(sessionStorage.getItem('__qaVitals') || '[]').pop() || {}).lcp != null; }"
+            " catch (e) { return true; }"
+        ), timeout=timeout, name="LCP recorded")
+    except TimeoutException:
+        pass
+
+
+def measure_load(driver, url, cold):
+    """
+    Load `url` once and return its metrics. Cold loads clear the HTTP cache first;
+    cookies (and so the session) are kept.
+    """
+    if cold:
+        driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+    metrics_before = devtools_timing.start(driver)
+    driver.get(url)
+    wait_for(driver, navigation_settled())
+    _settle_paint(driver)
+    timing = devtools_timing.collect(driver, metrics_before)
+
+    page = timing["pages"][-1] if timing["pages"] else {}
+    return {
+        "ttfb_ms": page.get("ttfb"),
+        "fcp_ms": page.get("fcp"),
+        "lcp_ms": page.get("lcp"),
+        "js_bytes": sum(r["bytes"] for r in timing["requests"] if r["type"] == "Script"),
+    }
+
+
+def measure_action(driver, perform):
+    """Run `perform(driver)` (which must finish its server action) and return the action duration"""
+    metrics_before = devtools_timing.start(driver)
+    perform(driver)
+    timing = devtools_timing.collect(driver, metrics_before)
+    durations = [r["duration_ms"] for r in timing["requests"] if r["server_action"] and r["duration_ms"] is not None]
+    return {"server_action_ms": max(durations) if durations else None}
+
+
+def median_metrics(samples):
+    """Median per metric over iteration samples, ignoring missing values"""
+    result = {}
+    for metric in METRICS:
+        values = [s[metric] for s in samples if s.get(metric) is not None]
+        result[metric] = round(statistics.median(values), 1) if values else None
+    return result
+
+
+def over_budget(medians, budget):
+    """['lcp_ms 2710 > 2500', ...] for every budgeted metric whose median is too high"""
+    failures = []
+    for metric, limit in (budget or {}).items():
+        value = medians.get(metric)
+        if value is not None and value > limit:
+            failures.append(f"{metric} {value} > {limit}")
+    return failures
+
+
+def record_trend(route, mode, medians, budget, samples, path=TREND_PATH):
+    """Append one result line (with commit) to the trend file"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps({
+            "commit": git_commit(),
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+            "route": route,
+            "mode": mode,
+            "medians": medians,
+            "budget": budget,
+            "iterations": len(samples),
+        }) + "\n")
+
+
+def trend(route=None, limit=10, path=TREND_PATH):
+    """Print the last `limit` results per route/mode, oldest first"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            entries = [json.loads(line) for line in f if line.strip()]
+    except OSError:
+        print(f"No trend data at {path}")
+        return
+    series = {}
+    for entry in entries:
+        if route and entry["route"] != route:
+            continue
+        series.setdefault((entry["route"], entry["mode"]), []).append(entry)
+    for (series_route, mode), items in sorted(series.items()):
+        print(f"\n{series_route} ({mode})")
+        print(f"{'commit':<10}" + "".join(f"{m:>18}" for m in METRICS))
+        for entry in items[-limit:]:
+            values = "".join(f"{str(entry['medians'].get(m)):>18}" for m in METRICS)
+            print(f"{entry['commit'] or '-':<10}{values}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 2 and sys.argv[1] == "trend":
+        trend(sys.argv[2] if len(sys.argv) > 2 else None)
+    else:
+        print("Usage: python perf_budgets.py trend [route]")
+        sys.exit(1)
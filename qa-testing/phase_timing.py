@@ -0,0 +1,234 @@
+"""
+Where each test spends its time
+Wraps Selenium's command executor and time.sleep, times every fixture setup
+and every condition wait, and splits each test's setup, call and teardown into
+exclusive categories: navigation, element lookups, scripts, other WebDriver
+commands, waits, sleeps, browserless page fetches, fixture code and the rest
+("other"). Nested time is counted once - a wait's polling commands and sleeps
+count as the wait.
+
+The breakdown goes into the results store (results.py) and the terminal summary
+ends with the slowest phase categories across the run. Set PHASE_TIMING=false to
+turn it off.
+"""
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+import pytest
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+from waits import WAIT_LOG
+
+
+ENABLED = os.getenv("PHASE_TIMING", "true").lower() == "true"
+TOP_N = int(os.getenv("PHASE_TOP_N", "15"))
+
+_COMMAND_CATEGORIES = {
+    Command.GET: "navigation",
+    Command.REFRESH: "navigation",
+    Command.GO_BACK: "navigation",
+    Command.GO_FORWARD: "navigation",
+    Command.FIND_ELEMENT: "find",
+    Command.FIND_ELEMENTS: "find",
+    Command.FIND_CHILD_ELEMENT: "find",
+    Command.FIND_CHILD_ELEMENTS: "find",
+    Command.W3C_EXECUTE_SCRIPT: "script",
+    Command.W3C_EXECUTE_SCRIPT_ASYNC: "script",
+    "executeCdpCommand": "cdp",
+}
+
+_original_execute = RemoteConnection.execute
+_original_sleep = time.sleep
+
+
+class PhaseClock:
+    """
+    Exclusive time per test, phase and category. Spans nest; a span's own time
+    excludes the spans inside it, and nothing is recorded inside an opaque span.
+    Only the main thread is timed (background threads would double count).
+    """
+
+    def __init__(self):
+        self.test = None
+        self.phase = None
+        self.spans = {}
+        self.fixtures = {}
+        self._stack = []
+        self._main = threading.main_thread()
+
+    @contextmanager
+    def span(self, category, opaque=False):
+        if (self.test is None or threading.current_thread() is not self._main
+                or (self._stack and self._stack[-1][2])):
+            yield
+            return
+        frame = [time.perf_counter(), 0.0, opaque]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            elapsed = time.perf_counter() - frame[0]
+            if self._stack:
+                self._stack[-1][1] += elapsed
+            phase = self.spans.setdefault(self.test, {}).setdefault(self.phase, {})
+            phase[category] = phase.get(category, 0.0) + elapsed - frame[1]
+
+    def breakdown(self, test, reports):
+        """{phase: {category: seconds}} for the phase reports of `test`; "other" is what no span covered"""
+        spans = self.spans.get(test, {})
+        result = {}
+        for report in reports:
+            categories = spans.get(report.when, {})
+            result[report.when] = {name: round(seconds, 3) for name, seconds in categories.items()}
+            result[report.when]["other"] = round(max(report.duration - sum(categories.values()), 0.0), 3)
+        return result
+
+    def forget(self, test):
+        self.spans.pop(test, None)
+        self.fixtures.pop(test, None)
+
+
+PHASES = PhaseClock()
+
+_reports_key = pytest.StashKey()
+# (test, phase, category, seconds) and (test, fixture, inclusive seconds) from every worker's teardown reports
+_entries = []
+_fixture_entries = []
+
+
+def breakdown(item, reports):
+    """Phase breakdown of a finished test, for the results store"""
+    return PHASES.breakdown(item.nodeid, reports)
+
+
+def _execute(self, command, params):
+    with PHASES.span(_COMMAND_CATEGORIES.get(command, "webdriver")):
+        return _original_execute(self, command, params)
+
+
+def _sleep(seconds):
+    with PHASES.span("sleep"):
+        _original_sleep(seconds)
+
+
+# ---------------------------------------------------------------------------
+# pytest plugin
+# ---------------------------------------------------------------------------
+
+def pytest_configure(config):
+    if ENABLED:
+        RemoteConnection.execute = _execute
+        time.sleep = _sleep
+        WAIT_LOG.span = lambda name: PHASES.span(f"wait {name}", opaque=True)
+
+
+def pytest_unconfigure(config):
+    RemoteConnection.execute = _original_execute
+    time.sleep = _original_sleep
+    WAIT_LOG.span = lambda name: nullcontext()
+
+
+def _enter(item, phase):
+    PHASES.test = item.nodeid
+    PHASES.phase = phase
+
+
+@pytest.hookimpl(hookwrapper=True, tryfirst=True)
+def pytest_runtest_setup(item):
+    # A rerun (flaky.py) starts its breakdown over
+    PHASES.forget(item.nodeid)
+    _enter(item, "setup")
+    yield
+
+
+@pytest.hookimpl(hookwrapper=True, tryfirst=True)
+def pytest_runtest_call(item):
+    _enter(item, "call")
+    yield
+
+
+@pytest.hookimpl(hookwrapper=True, tryfirst=True)
+def pytest_runtest_teardown(item):
+    _enter(item, "teardown")
+    yield
+    PHASES.test = None
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    """Fixture code counts as "fixture <name>"; its inclusive time is kept as well"""
+    test = PHASES.test
+    start = time.perf_counter()
+    with PHASES.span(f"fixture {fixturedef.argname}"):
+        yield
+    if test is not None:
+        fixtures = PHASES.fixtures.setdefault(test, {})
+        fixtures[fixturedef.argname] = round(time.perf_counter() - start, 3)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Attach the breakdown to the teardown report, which xdist ships to the controller"""
+    outcome = yield
+    report = outcome.get_result()
+    if not ENABLED:
+        return
+    reports = item.stash.setdefault(_reports_key, [])
+    reports.append(report)
+    if report.when == "teardown":
+        report.user_properties.append(("phase_breakdown", PHASES.breakdown(item.nodeid, reports)))
+        report.user_properties.append(("fixture_setup", PHASES.fixtures.get(item.nodeid, {})))
+
+
+def pytest_runtest_logfinish(nodeid):
+    PHASES.forget(nodeid)
+
+
+def pytest_runtest_logreport(report):
+    for name, value in report.user_properties:
+        if name == "phase_breakdown":
+            for phase, categories in value.items():
+                for category, seconds in categories.items():
+                    _entries.append((report.nodeid, phase, category, seconds))
+        elif name == "fixture_setup":
+            _fixture_entries.extend((report.nodeid, fixture, seconds) for fixture, seconds in value.items())
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Slowest phase categories over the run, with the test where each was worst"""
+    if not _entries:
+        return
+    totals = {}
+    for test, phase, category, seconds in _entries:
+        entry = totals.setdefault((phase, category), {"total": 0.0, "tests": 0, "max": 0.0, "worst": None})
+        entry["total"] += seconds
+        entry["tests"] += 1
+        if entry["worst"] is None or seconds > entry["max"]:
+            entry["max"], entry["worst"] = seconds, test
+    overall = sum(entry["total"] for entry in totals.values()) or 1
+
+    terminalreporter.write_sep("-", f"slowest phases (top {TOP_N})")
+    terminalreporter.write_line(f"{'total':>8} {'share':>6} {'tests':>5} {'max':>7}  {'phase':<9} {'category':<32} worst test")
+    for (phase, category), entry in sorted(totals.items(), key=lambda kv: kv[1]["total"], reverse=True)[:TOP_N]:
+        terminalreporter.write_line(
+            f"{entry['total']:7.2f}s {100 * entry['total'] / overall:5.1f}% {entry['tests']:>5} "
+            f"{entry['max']:6.2f}s  {phase:<9} {category[:32]:<32} {entry['worst']}"
+        )
+
+    # Inclusive: a fixture's own navigation, commands and waits count towards it here
+    fixtures = {}
+    for test, fixture, seconds in _fixture_entries:
+        entry = fixtures.setdefault(fixture, {"total": 0.0, "setups": 0, "max": 0.0})
+        entry["total"] += seconds
+        entry["setups"] += 1
+        entry["max"] = max(entry["max"], seconds)
+    slowest = [(name, entry) for name, entry in sorted(fixtures.items(), key=lambda kv: kv[1]["total"], reverse=True)
+               if entry["total"] >= 0.01][:5]
+    if slowest:
+        terminalreporter.write_line("Slowest fixture setups (inclusive): " + ", ".join(
+            f"{name} {entry['total']:.2f}s/{entry['setups']}x" for name, entry in slowest
+        ))
@@ -0,0 +1,439 @@
+"""
+Structured test results and a lightweight HTML report
+Every test appends one JSON line to reports/results.jsonl when it finishes:
+outcome, setup/call/teardown seconds, condition-wait time, WebDriver command
+count, phase breakdown (phase_timing.py), DevTools summary and the path of its
+failure artifacts. Failed attempts that flaky.py reruns are written with
+outcome "rerun". At the end of the run the lines are folded into a SQLite
+store (.results/results.db) for trend queries and rendered into
+reports/report.html, which links to artifacts instead of embedding them.
+
+    python results.py report shard-*/results.jsonl -o reports/report.html
+    python results.py ingest shard-*/results.jsonl
+    python results.py trend test_auth.py::TestAuthentication::test_login_page_loads
+    python results.py slowest --runs 10
+    python results.py phases --runs 10
+"""
+import argparse
+import html
+import json
+import os
+import sqlite3
+import sys
+import time
+import uuid
+from contextlib import closing
+from pathlib import Path
+
+import pytest
+
+from helpers import atomic_write, git_commit
+from waits import WAIT_LOG
+
+
+QA_DIR = Path(__file__).resolve().parent
+RESULTS_LOG = QA_DIR / "reports" / "results.jsonl"
+REPORT_PATH = QA_DIR / "reports" / "report.html"
+DB_PATH = Path(os.getenv("RESULTS_DB", QA_DIR / ".results" / "results.db"))
+WRITE_REPORT = os.getenv("RESULTS_REPORT", "true").lower() == "true"
+
+# Characters of the failure text kept per test
+MESSAGE_CHARS = 4000
+
+_phases_key = pytest.StashKey()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY, started_at REAL, commit_sha TEXT, branch TEXT,
+    tests INTEGER, failed INTEGER, seconds REAL
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id TEXT, test TEXT, outcome TEXT, seconds REAL, setup REAL, call REAL, teardown REAL,
+    waits REAL, commands INTEGER, worker TEXT, artifacts TEXT, message TEXT,
+    PRIMARY KEY (run_id, test)
+);
+CREATE TABLE IF NOT EXISTS phase_times (
+    run_id TEXT, test TEXT, phase TEXT, category TEXT, seconds REAL,
+    PRIMARY KEY (run_id, test, phase, category)
+);
+CREATE TABLE IF NOT EXISTS reruns (
+    run_id TEXT, test TEXT, attempt INTEGER, seconds REAL, message TEXT,
+    PRIMARY KEY (run_id, test, attempt)
+);
+CREATE INDEX IF NOT EXISTS results_by_test ON results (test, run_id);
+CREATE INDEX IF NOT EXISTS phase_times_by_category ON phase_times (phase, category);
+CREATE INDEX IF NOT EXISTS runs_by_start ON runs (started_at);
+"""
+
+
+def read_records(paths):
+    """Yield the records of results.jsonl files, line by line"""
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+# ---------------------------------------------------------------------------
+# SQLite store
+# ---------------------------------------------------------------------------
+
+def connect(path=DB_PATH):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    db = sqlite3.connect(path, timeout=30)
+    db.executescript(_SCHEMA)
+    return db
+
+
+def ingest(paths, db_path=DB_PATH):
+    """
+    Fold results.jsonl files into the store. Re-ingesting a file is harmless
+    (rows are keyed by run and test), so shards can be ingested again after a merge.
+    Failed attempts that were rerun (flaky.py) go to `reruns`, the final attempt
+    to `results`. Runs without a single test record are left out, so they do not
+    take a slot in the recent-runs windows. Returns the number of test records.
+    """
+    runs, rows, phase_rows, rerun_rows = {}, [], [], []
+    for record in read_records(paths):
+        if record.get("type") == "run":
+            runs[record["run_id"]] = record
+            continue
+        if record["outcome"] == "rerun":
+            rerun_rows.append((record["run_id"], record["test"], record.get("attempt", 1), record["seconds"],
+                               record.get("message")))
+            continue
+        rows.append((
+            record["run_id"], record["test"], record["outcome"], record["seconds"],
+            record["phases"].get("setup"), record["phases"].get("call"), record["phases"].get("teardown"),
+            record.get("waits_s"), record.get("commands"), record.get("worker"),
+            record.get("artifacts"), record.get("message"),
+        ))
+        phase_rows.extend(
+            (record["run_id"], record["test"], phase, category, seconds)
+            for phase, categories in (record.get("breakdown") or {}).items()
+            for category, seconds in categories.items()
+        )
+        runs.setdefault(record["run_id"], {"run_id": record["run_id"]})
+
+    with closing(connect(db_path)) as db, db:
+        db.executemany("INSERT OR REPLACE INTO results VALUES (?,?,?,?,?,?,?,?,?,?,?,?)", rows)
+        db.executemany("INSERT OR REPLACE INTO phase_times VALUES (?,?,?,?,?)", phase_rows)
+        db.executemany("INSERT OR REPLACE INTO reruns VALUES (?,?,?,?,?)", rerun_rows)
+        for run_id, meta in runs.items():
+            tests, failed, seconds = db.execute(
+                "SELECT COUNT(*), SUM(outcome IN ('failed','error')), SUM(seconds) FROM results WHERE run_id = ?",
+                (run_id,),
+            ).fetchone()
+            if not tests:
+                continue
+            previous = db.execute(
+                "SELECT started_at, commit_sha, branch FROM runs WHERE run_id = ?", (run_id,)
+            ).fetchone() or (None, None, None)
+            db.execute("INSERT OR REPLACE INTO runs VALUES (?,?,?,?,?,?,?)", (
+                run_id,
+                meta.get("started_at") or previous[0],
+                meta.get("commit") or previous[1],
+                meta.get("branch") or previous[2],
+                tests, failed or 0, round(seconds or 0, 3),
+            ))
+    return len(rows)
+
+
+def trend(test, runs=20, db_path=DB_PATH):
+    """Outcome and seconds of `test` in the latest `runs` runs, newest first"""
+    with closing(connect(db_path)) as db:
+        return db.execute(
+            "SELECT runs.run_id, runs.started_at, runs.commit_sha, results.outcome, results.seconds "
+            "FROM results JOIN runs USING (run_id) WHERE results.test = ? "
+            "ORDER BY runs.started_at DESC LIMIT ?",
+            (test, runs),
+        ).fetchall()
+
+
+def slowest(runs=10, limit=15, db_path=DB_PATH):
+    """(test, average seconds, runs seen) over the latest `runs` runs, slowest first"""
+    with closing(connect(db_path)) as db:
+        return db.execute(
+            "SELECT test, AVG(seconds), COUNT(*) FROM results WHERE run_id IN "
+            "(SELECT run_id FROM runs ORDER BY started_at DESC LIMIT ?) "
+            "GROUP BY test ORDER BY AVG(seconds) DESC LIMIT ?",
+            (runs, limit),
+        ).fetchall()
+
+
+def phase_totals(runs=10, limit=15, db_path=DB_PATH):
+    """(phase, category, seconds per run, worst test) over the latest `runs` runs, largest first"""
+    with closing(connect(db_path)) as db:
+        return db.execute(
+            "WITH recent AS (SELECT run_id FROM runs ORDER BY started_at DESC LIMIT ?) "
+            "SELECT phase, category, SUM(seconds) / (SELECT COUNT(*) FROM recent), "
+            "(SELECT test FROM phase_times w WHERE w.phase = p.phase AND w.category = p.category "
+            " AND w.run_id IN recent ORDER BY seconds DESC LIMIT 1) "
+            "FROM phase_times p WHERE run_id IN recent "
+            "GROUP BY phase, category ORDER BY SUM(seconds) DESC LIMIT ?",
+            (runs, limit),
+        ).fetchall()
+
+
+# ---------------------------------------------------------------------------
+# HTML report
+# ---------------------------------------------------------------------------
+
+_OUTCOME_COLORS = {
+    "passed": "#2e7d32", "failed": "#c62828", "error": "#ef6c00",
+    "skipped": "#757575", "xfailed": "#757575", "xpassed": "#ef6c00", "rerun": "#f9a825",
+}
+
+_REPORT_HEAD = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>QA results</title>
+<style>
+body{font:13px system-ui,sans-serif;margin:20px}table{border-collapse:collapse;width:100%}
+td,th{padding:3px 8px;border-bottom:1px solid #eee;text-align:left;vertical-align:top}
+th{cursor:pointer}td.num{text-align:right;font-variant-numeric:tabular-nums}
+pre{white-space:pre-wrap;margin:4px 0;font-size:12px}button{margin-right:6px}
+</style></head><body>
+"""
+
+# Filtering and sorting happen in the browser; the file holds one row per test
+_REPORT_JS = """<script>
+function show(outcome){document.querySelectorAll('tbody tr').forEach(function(r){
+  r.style.display=(!outcome||r.dataset.outcome===outcome)?'':'none';});}
+document.querySelectorAll('th').forEach(function(th,i){th.onclick=function(){
+  var body=th.closest('table').tBodies[0],rows=[].slice.call(body.rows),num=th.dataset.num;
+  var dir=th.dataset.dir=th.dataset.dir==='asc'?'desc':'asc';
+  rows.sort(function(a,b){var x=a.cells[i].dataset.v||a.cells[i].textContent,y=b.cells[i].dataset.v||b.cells[i].textContent;
+    if(num){x=parseFloat(x)||0;y=parseFloat(y)||0;}return (x<y?-1:x>y?1:0)*(dir==='asc'?1:-1);});
+  rows.forEach(function(r){body.appendChild(r);});};});
+</script></body></html>
+"""
+
+
+def _largest_phase(breakdown):
+    """("call", "wait navigation settled", 2.31) - where the test spent most of its time"""
+    entries = [(seconds, phase, category) for phase, categories in (breakdown or {}).items()
+               for category, seconds in categories.items()]
+    if not entries:
+        return None
+    seconds, phase, category = max(entries)
+    return phase, category, seconds
+
+
+def _row(record, link_root):
+    outcome = record["outcome"]
+    phases = record["phases"]
+    largest = _largest_phase(record.get("breakdown"))
+    devtools = record.get("devtools") or {}
+    links = ""
+    if record.get("artifacts"):
+        base = html.escape(f"{link_root}{record['artifacts']}", quote=True)
+        links = " ".join(
+            f"<a href='{base}/{name}'>{label}</a>"
+            for name, label in (("screenshot.png", "screenshot"), ("dom.html.gz", "DOM"),
+                                ("console.json.gz", "console"), ("network.har.gz", "HAR"))
+        )
+    message = ""
+    if record.get("message"):
+        first = html.escape(record["message"].strip().splitlines()[-1][:160])
+        message = f"<details><summary>{first}</summary><pre>{html.escape(record['message'])}</pre></details>"
+    cells = [
+        f"<td style='color:{_OUTCOME_COLORS.get(outcome, '#000')}'>{outcome}</td>",
+        f"<td>{html.escape(record['test'])}{message}</td>",
+        f"<td class='num'>{record['seconds']:.2f}</td>",
+        f"<td class='num'>{phases.get('setup', 0):.2f}</td>",
+        f"<td class='num'>{phases.get('call', 0):.2f}</td>",
+        f"<td class='num'>{record.get('waits_s') or 0:.2f}</td>",
+        f"<td data-v='{largest[2] if largest else 0}'>"
+        f"{html.escape(f'{largest[0]}: {largest[1]} {largest[2]:.2f}s') if largest else ''}</td>",
+        f"<td class='num'>{record.get('commands') or ''}</td>",
+        f"<td class='num'>{devtools.get('requests', '')}</td>",
+        f"<td>{html.escape(record.get('worker') or '')}</td>",
+        f"<td>{links}</td>",
+    ]
+    return f"<tr data-outcome='{outcome}'>{''.join(cells)}</tr>\n"
+
+
+def render_report(paths, output=REPORT_PATH, link_root=""):
+    """
+    Write the HTML report for results.jsonl `paths`. Artifact links are relative
+    to the report (`link_root` is prefixed for reports written elsewhere).
+    Returns the number of tests.
+    """
+    rows, counts, seconds, runs = [], {}, 0.0, {}
+    for record in read_records(paths):
+        if record.get("type") == "run":
+            runs[record["run_id"]] = record
+            continue
+        rows.append((record["outcome"] not in ("failed", "error"), record["test"], _row(record, link_root)))
+        counts[record["outcome"]] = counts.get(record["outcome"], 0) + 1
+        seconds += record["seconds"]
+    rows.sort(key=lambda row: row[:2])
+
+    meta = next(iter(runs.values()), {})
+    buttons = "".join(
+        f"<button onclick=\"show('{outcome}')\" style='color:{_OUTCOME_COLORS.get(outcome, '#000')}'>"
+        f"{count} {outcome}</button>"
+        for outcome, count in sorted(counts.items())
+    )
+    with atomic_write(output) as f:
+        f.write(_REPORT_HEAD)
+        f.write(
+            f"<h2>QA results</h2><p>{len(rows)} tests, {seconds:.1f}s of test time &middot; "
+            f"commit {html.escape(str(meta.get('commit') or '?'))} &middot; "
+            f"branch {html.escape(str(meta.get('branch') or '?'))} &middot; "
+            f"{time.strftime('%Y-%m-%d %H:%M', time.localtime(meta.get('started_at') or time.time()))}</p>"
+            f"<p><button onclick='show()'>all</button>{buttons}</p>"
+        )
+        f.write(
+            "<table><thead><tr><th>outcome</th><th>test</th><th data-num=1>s</th><th data-num=1>setup</th>"
+            "<th data-num=1>call</th><th data-num=1>waits</th><th data-num=1>largest phase</th><th data-num=1>commands</th>"
+            "<th data-num=1>requests</th><th>worker</th><th>artifacts</th></tr></thead><tbody>\n"
+        )
+        for _, _, row in rows:
+            f.write(row)
+        f.write("</tbody></table>\n")
+        f.write(_REPORT_JS)
+    return len(rows)
+
+
+# ---------------------------------------------------------------------------
+# pytest plugin
+# ---------------------------------------------------------------------------
+
+def _outcome(reports):
+    """One outcome for the setup/call/teardown reports of a test"""
+    for report in reports:
+        if hasattr(report, "wasxfail"):
+            return "xfailed" if report.skipped else "xpassed"
+        if report.failed:
+            return "failed" if report.when == "call" else "error"
+        if report.skipped:
+            return "skipped"
+    return "passed"
+
+
+def pytest_configure(config):
+    """One run id for the controller and every xdist worker (spawned after configure)"""
+    if not hasattr(config, "workerinput"):
+        os.environ.setdefault("QA_RUN_ID", f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Collect the phase reports of a test and append its record once teardown is done"""
+    outcome = yield
+    report = outcome.get_result()
+    reports = item.stash.setdefault(_phases_key, [])
+    reports.append(report)
+    if report.when != "teardown":
+        return
+
+    from artifacts import captured_directory
+    from devtools_timing import timing_key
+    from flaky import attempt, rerun_pending
+    from phase_timing import ENABLED as PHASE_TIMING, PHASES, breakdown
+    directory = captured_directory(item)
+    timing = item.stash.get(timing_key, None)
+    failed = [r for r in reports if r.failed]
+    record = {
+        "run_id": os.environ.get("QA_RUN_ID"),
+        "test": item.nodeid,
+        "outcome": "rerun" if rerun_pending(item, reports) else _outcome(reports),
+        "attempt": attempt(item),
+        "seconds": round(sum(r.duration for r in reports), 3),
+        "phases": {r.when: round(r.duration, 3) for r in reports},
+        "waits_s": round(WAIT_LOG.total(item.nodeid), 3),
+        "commands": WAIT_LOG.commands.get(item.nodeid),
+        "breakdown": breakdown(item, reports) if PHASE_TIMING else None,
+        "fixtures": PHASES.fixtures.get(item.nodeid) if PHASE_TIMING else None,
+        "devtools": timing["summary"] if timing else None,
+        "worker": os.getenv("PYTEST_XDIST_WORKER", "master"),
+        "artifacts": f"{directory.parent.name}/{directory.name}" if directory else None,
+        "message": failed[0].longreprtext[-MESSAGE_CHARS:] if failed else None,
+        "finished_at": time.time(),
+    }
+    RESULTS_LOG.parent.mkdir(parents=True, exist_ok=True)
+    with open(RESULTS_LOG, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+def _controller_run(config):
+    """The process that owns the results log: not an xdist worker, not --collect-only"""
+    return not (hasattr(config, "workerinput") or config.option.collectonly)
+
+
+def pytest_sessionstart(session):
+    """Open the results log with this run's header line"""
+    if not _controller_run(session.config):
+        return
+    from impact_map import current_branch
+    RESULTS_LOG.parent.mkdir(parents=True, exist_ok=True)
+    with open(RESULTS_LOG, "w", encoding="utf-8") as f:
+        f.write(json.dumps({
+            "type": "run", "run_id": os.environ["QA_RUN_ID"], "started_at": time.time(),
+            "commit": git_commit(), "branch": current_branch(),
+        }) + "\n")
+
+
+def pytest_sessionfinish(session):
+    """Fold this run into the store and render the report"""
+    if not _controller_run(session.config) or not RESULTS_LOG.exists():
+        return
+    if not any(record.get("type") != "run" for record in read_records([RESULTS_LOG])):
+        return
+    started = time.perf_counter()
+    try:
+        ingest([RESULTS_LOG])
+    except sqlite3.Error as e:
+        print(f"⚠️ Could not update {DB_PATH}: {e}")
+    htmlpath = getattr(session.config.option, "htmlpath", None)
+    if htmlpath and Path(htmlpath).resolve() == REPORT_PATH:
+        print(f"\n⚠️ --html writes {REPORT_PATH} - skipping the results report (use another --html path)")
+    elif WRITE_REPORT:
+        count = render_report([RESULTS_LOG])
+        print(f"\n📊 Report: {REPORT_PATH} ({count} tests, {time.perf_counter() - started:.2f}s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Structured test results and HTML report")
+    commands = parser.add_subparsers(dest="command", required=True)
+    report = commands.add_parser("report", help="Render results.jsonl files into one HTML report")
+    report.add_argument("logs", nargs="+")
+    report.add_argument("-o", "--output", default=str(REPORT_PATH))
+    report.add_argument("--link-root", default="", help="Prefix for artifact links")
+    fold = commands.add_parser("ingest", help="Fold results.jsonl files into the SQLite store")
+    fold.add_argument("logs", nargs="+")
+    history = commands.add_parser("trend", help="Outcome and duration of one test over recent runs")
+    history.add_argument("test")
+    history.add_argument("--runs", type=int, default=20)
+    slow = commands.add_parser("slowest", help="Slowest tests on average over recent runs")
+    slow.add_argument("--runs", type=int, default=10)
+    where = commands.add_parser("phases", help="Where the suite spends its time over recent runs")
+    where.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    if args.command == "report":
+        count = render_report(args.logs, args.output, args.link_root)
+        print(f"✓ {count} tests in {args.output}")
+    elif args.command == "ingest":
+        count = ingest(args.logs)
+        print(f"✓ {count} results in {DB_PATH}")
+    elif args.command == "trend":
+        rows = trend(args.test, args.runs)
+        if not rows:
+            print(f"❌ No results for {args.test} in {DB_PATH}")
+            sys.exit(1)
+        for run_id, started_at, commit, outcome, seconds in rows:
+            when = time.strftime("%Y-%m-%d %H:%M", time.localtime(started_at)) if started_at else "?"
+            print(f"  {when}  {commit or '?':<9} {outcome:<8} {seconds:7.2f}s  {run_id}")
+    elif args.command == "slowest":
+        for test, seconds, seen in slowest(args.runs):
+            print(f"  {seconds:7.2f}s  ({seen} runs)  {test}")
+    else:
+        for phase, category, seconds, worst in phase_totals(args.runs):
+            print(f"  {seconds:7.2f}s per run  {phase:<9} {category[:36]:<36} worst: {worst}")
+
+
+if __name__ == "__main__":
+    main()
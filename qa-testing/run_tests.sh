@@ -28,9 +28,9 @@ mkdir -p reports
 echo "🧪 Running Selenium tests..."
 echo ""
 
-# Check if app is running
-if ! curl -s http://localhost:3000 > /dev/null; then
-    echo "⚠️  Warning: App doesn't seem to be running on http://localhost:3000"
+# Check if app is running, and warm up its routes (app_ready.py)
+if ! python3 app_ready.py --timeout 5 wait; then
+    echo "⚠️  Warning: App doesn't seem to be running on ${BASE_URL:-http://localhost:3000}"
     echo "   Please start it with: npm run dev"
     echo ""
 fi
@@ -38,27 +38,55 @@ fi
 # Set HEADLESS environment variable (default: false - show browser)
 export HEADLESS=${HEADLESS:-false}
 
+# Pre-warmed headless Chrome shared by repeated runs: CHROME_DAEMON=true ./run_tests.sh dashboard
+# The daemon keeps running after the tests (stop it with: python3 chrome_daemon.py stop)
+if [ "$CHROME_DAEMON" == "true" ]; then
+    python3 chrome_daemon.py ensure --warm-url "${BASE_URL:-http://localhost:3000}/login" || export CHROME_DAEMON=false
+fi
+
+# Parallel workers (pytest-xdist): WORKERS=auto or WORKERS=4
+# Each worker runs its own headless Chrome; set TEST_ACCOUNTS so each also gets its own account
+PARALLEL_ARGS=""
+if [ -n "$WORKERS" ]; then
+    PARALLEL_ARGS="-n $WORKERS"
+fi
+
 # Run tests based on argument using python3 -m pytest for reliability
 if [ "$1" == "auth" ]; then
-    python3 -m pytest test_auth.py -v -s
+    python3 -m pytest test_auth.py -v -s $PARALLEL_ARGS
+elif [ "$1" == "http" ]; then
+    # Browserless page checks - no Chrome needed (see http_smoke.py)
+    python3 -m pytest -m http -v -s $PARALLEL_ARGS
 elif [ "$1" == "dashboard" ]; then
-    python3 -m pytest test_dashboard.py -v -s
+    python3 -m pytest test_dashboard.py -v -s $PARALLEL_ARGS
 elif [ "$1" == "integration" ]; then
-    python3 -m pytest test_integration.py -v -s
+    python3 -m pytest test_integration.py -v -s $PARALLEL_ARGS
 elif [ "$1" == "comprehensive" ]; then
-    python3 -m pytest test_comprehensive.py -v -s
+    python3 -m pytest test_comprehensive.py -v -s $PARALLEL_ARGS
+elif [ "$1" == "perf" ]; then
+    # Deselected by default (pytest.ini); budgets assume a production build
+    python3 -m pytest test_performance_budgets.py -m performance -v -s $PARALLEL_ARGS
+elif [ "$1" == "changed" ]; then
+    # Only the tests affected by changes since IMPACT_BASE (see impact_map.py)
+    python3 -m pytest -v -s $PARALLEL_ARGS --impact-base "${IMPACT_BASE:-origin/main}"
 elif [ "$1" == "all" ] || [ -z "$1" ]; then
-    python3 -m pytest -v -s --html=reports/report.html --self-contained-html
+    python3 -m pytest -v -s $PARALLEL_ARGS
     echo ""
     echo "📊 Test report generated: reports/report.html"
 else
-    echo "Usage: ./run_tests.sh [auth|dashboard|integration|comprehensive|all]"
+    echo "Usage: ./run_tests.sh [auth|http|dashboard|integration|comprehensive|perf|changed|all]"
     echo ""
     echo "To run with visible browser (default):"
     echo "  ./run_tests.sh [test_suite]"
     echo ""
     echo "To run in headless mode:"
     echo "  HEADLESS=true ./run_tests.sh [test_suite]"
+    echo ""
+    echo "To run in parallel (one headless Chrome per worker):"
+    echo "  WORKERS=auto ./run_tests.sh [test_suite]"
+    echo ""
+    echo "To reuse pre-warmed headless Chrome instances across runs:"
+    echo "  CHROME_DAEMON=true ./run_tests.sh [test_suite]"
     exit 1
 fi
 
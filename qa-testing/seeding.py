@@ -0,0 +1,328 @@
+"""
+API-level test data seeding for Fastbreak Events
+Creates, bulk-inserts and tears down events, venues and event_venues rows directly
+through the Supabase REST (PostgREST) endpoints described in supabase/schema.sql,
+so UI tests only exercise the UI path they actually verify.
+
+Works against a hosted Supabase project or any PostgREST-compatible stand-in:
+point SUPABASE_URL at it.
+"""
+import os
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+
+import requests
+
+
+DEFAULT_BATCH_SIZE = 500
+# Refresh the access token this long before it expires (GoTrue's default lifetime is 1h)
+REFRESH_MARGIN = 60
+
+
+class SeedingError(RuntimeError):
+    """A Supabase REST or auth call made by the seeder failed"""
+
+
+def supabase_config():
+    """
+    Supabase URL and anon key for seeding.
+    SUPABASE_URL / SUPABASE_ANON_KEY take precedence over the app's NEXT_PUBLIC_* names.
+    Returns (None, None) when seeding through the API is not configured.
+    """
+    url = os.getenv("SUPABASE_URL") or os.getenv("NEXT_PUBLIC_SUPABASE_URL")
+    key = os.getenv("SUPABASE_ANON_KEY") or os.getenv("NEXT_PUBLIC_SUPABASE_ANON_KEY")
+    if not url or not key:
+        return None, None
+    return url.rstrip("/"), key
+
+
+def _batched(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _token_grant(supabase_url, anon_key, grant_type, payload):
+    """POST /auth/v1/token; returns the response (the caller checks the status)"""
+    return requests.post(
+        f"{supabase_url.rstrip('/')}/auth/v1/token",
+        params={"grant_type": grant_type},
+        headers={"apikey": anon_key, "Content-Type": "application/json"},
+        json=payload,
+        timeout=15,
+    )
+
+
+class _Session:
+    """
+    GoTrue access/refresh token pair, shared by a seeder and its children.
+    `credentials` ((email, password), kept by sign_in()) allow a new password
+    grant once the refresh token is revoked - e.g. by a global sign-out of the
+    same account in the browser (test_sign_out).
+    """
+
+    def __init__(self, access_token, refresh_token=None, expires_at=None, credentials=None):
+        self.access_token = access_token
+        self.refresh_token = refresh_token
+        self.expires_at = expires_at
+        self.credentials = credentials
+        self.lock = threading.Lock()
+
+    def renewable(self):
+        return bool(self.refresh_token or self.credentials)
+
+    def update(self, body):
+        """Take the tokens of a password or refresh_token grant response"""
+        self.access_token = body["access_token"]
+        self.refresh_token = body.get("refresh_token") or self.refresh_token
+        expires_in = body.get("expires_in")
+        self.expires_at = body.get("expires_at") or (time.time() + expires_in if expires_in else None)
+
+
+def _iso(value):
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.isoformat()
+    return value
+
+
+class SupabaseSeeder:
+    """
+    Seeds data as a real (RLS-bound) user, so rows land exactly where the app
+    will look for them. Every event name is prefixed with `namespace`, which is
+    also what teardown() deletes by.
+
+    Usage:
+        seeder = SupabaseSeeder.sign_in(email, password, namespace="qa-gw0-test-edit")
+        event = seeder.create_event("Pickup game", sport="Basketball", venues=["Main Arena"])
+        ...
+        seeder.teardown()
+    """
+
+    def __init__(self, supabase_url, anon_key, access_token, user_id, namespace=None,
+                 batch_size=DEFAULT_BATCH_SIZE, service_role_key=None, refresh_token=None, expires_at=None):
+        self.supabase_url = supabase_url.rstrip("/")
+        self.anon_key = anon_key
+        self.session = _Session(access_token, refresh_token, expires_at)
+        self.user_id = user_id
+        self.namespace = namespace or f"qa-{uuid.uuid4().hex[:8]}"
+        self.batch_size = batch_size
+        self.service_role_key = service_role_key or os.getenv("SUPABASE_SERVICE_ROLE_KEY")
+        self.http = requests.Session()
+        self.http.headers.update({
+            "apikey": anon_key,
+            "Authorization": f"Bearer {access_token}",
+            "Content-Type": "application/json",
+        })
+        self._venue_ids = {}
+
+    @classmethod
+    def sign_in(cls, email, password, supabase_url=None, anon_key=None, **kwargs):
+        """Exchange email/password for an access token via the GoTrue password grant"""
+        if supabase_url is None or anon_key is None:
+            supabase_url, anon_key = supabase_config()
+        if not supabase_url:
+            raise SeedingError("SUPABASE_URL and SUPABASE_ANON_KEY (or the NEXT_PUBLIC_* equivalents) must be set")
+
+        response = _token_grant(supabase_url, anon_key, "password", {"email": email, "password": password})
+        if response.status_code != 200:
+            raise SeedingError(f"Sign-in for {email} failed ({response.status_code}): {response.text[:200]}")
+        body = response.json()
+        seeder = cls(supabase_url, anon_key, body["access_token"], body["user"]["id"], **kwargs)
+        seeder.session.update(body)
+        seeder.session.credentials = (email, password)
+        return seeder
+
+    @property
+    def access_token(self):
+        return self.session.access_token
+
+    def refresh(self, stale_token=None):
+        """
+        Swap the refresh token for a new session, or sign in again with the
+        stored credentials when the refresh token was revoked. `stale_token` is
+        the token a request was rejected with; when another request already
+        replaced it, there is nothing left to do.
+        """
+        with self.session.lock:
+            if stale_token is not None and stale_token != self.session.access_token:
+                return
+            response = None
+            if self.session.refresh_token:
+                response = _token_grant(self.supabase_url, self.anon_key, "refresh_token",
+                                        {"refresh_token": self.session.refresh_token})
+            if (response is None or response.status_code != 200) and self.session.credentials:
+                email, password = self.session.credentials
+                response = _token_grant(self.supabase_url, self.anon_key, "password",
+                                        {"email": email, "password": password})
+            if response is None:
+                raise SeedingError("Access token expired and the seeder has no refresh token - sign in again")
+            if response.status_code != 200:
+                raise SeedingError(f"Token refresh failed ({response.status_code}): {response.text[:200]}")
+            self.session.update(response.json())
+            self.http.headers["Authorization"] = f"Bearer {self.session.access_token}"
+
+    def _expiring(self):
+        expires_at = self.session.expires_at
+        return expires_at is not None and time.time() > expires_at - REFRESH_MARGIN
+
+    # -- low level ---------------------------------------------------------
+
+    def _request(self, method, table, params=None, json=None, prefer=None, key=None):
+        headers = {}
+        if prefer:
+            headers["Prefer"] = prefer
+        if key:
+            headers["apikey"] = key
+            headers["Authorization"] = f"Bearer {key}"
+        elif self._expiring() and self.session.renewable():
+            self.refresh(self.session.access_token)
+
+        def send():
+            return self.http.request(
+                method,
+                f"{self.supabase_url}/rest/v1/{table}",
+                params=params,
+                json=json,
+                headers=headers,
+                timeout=30,
+            )
+
+        token = self.session.access_token
+        response = send()
+        # Expired mid-run (clock skew, a revoked session): refresh once and retry
+        if response.status_code == 401 and not key and self.session.renewable():
+            self.refresh(token)
+            response = send()
+        if response.status_code >= 400:
+            raise SeedingError(f"{method} {table} failed ({response.status_code}): {response.text[:300]}")
+        if response.status_code == 204 or not response.content:
+            return []
+        return response.json()
+
+    def scoped(self, name):
+        """Prefix a name with this seeder's namespace"""
+        return f"{self.namespace} {name}"
+
+    # -- venues ------------------------------------------------------------
+
+    def ensure_venues(self, names):
+        """
+        Return {name: id} for `names`, inserting the missing ones.
+        venues.name is UNIQUE and RLS grants no UPDATE, so inserts use
+        ON CONFLICT DO NOTHING and ids are read back with a single `in` select.
+        """
+        missing = [n for n in dict.fromkeys(names) if n not in self._venue_ids]
+        for batch in _batched(missing, self.batch_size):
+            self._request(
+                "POST", "venues",
+                params={"on_conflict": "name"},
+                json=[{"name": n} for n in batch],
+                prefer="resolution=ignore-duplicates,return=minimal",
+            )
+            quoted = ",".join('"' + n.replace('"', '\\"') + '"' for n in batch)
+            rows = self._request("GET", "venues", params={"select": "id,name", "name": f"in.({quoted})"})
+            self._venue_ids.update({row["name"]: row["id"] for row in rows})
+        return {n: self._venue_ids[n] for n in names}
+
+    # -- events ------------------------------------------------------------
+
+    def _event_row(self, event):
+        row = {
+            "id": event.get("id") or str(uuid.uuid4()),
+            "user_id": self.user_id,
+            "name": event["name"] if event.get("raw_name") else self.scoped(event["name"]),
+            "sport": event.get("sport", "Basketball"),
+            "starts_at": _iso(event.get("starts_at") or datetime.now(timezone.utc) + timedelta(days=1)),
+            "description": event.get("description"),
+            "location": event.get("location"),
+            # PostgREST bulk inserts take their columns from the first object,
+            # so every row carries the same keys
+            "is_recurring": event.get("is_recurring", False),
+            "recurrence_pattern": event.get("recurrence_pattern"),
+            "parent_event_id": event.get("parent_event_id"),
+        }
+        return row
+
+    def bulk_insert_events(self, events):
+        """
+        Insert events in batches of `batch_size`.
+
+        `events` may be any iterable (including a generator) of dicts with the
+        events columns plus an optional "venues" list of venue names. Ids are
+        generated client-side so each batch is one events POST, one venues
+        upsert and one event_venues POST. Returns the inserted rows with
+        a "venues" key added.
+        """
+        inserted = []
+        for batch in _batched(events, self.batch_size):
+            rows = [self._event_row(e) for e in batch]
+            venue_names = [v for e in batch for v in e.get("venues", ())]
+            venue_ids = self.ensure_venues(venue_names) if venue_names else {}
+
+            self._request("POST", "events", json=rows, prefer="return=minimal")
+
+            links = [
+                {"event_id": row["id"], "venue_id": venue_ids[v]}
+                for row, event in zip(rows, batch)
+                for v in dict.fromkeys(event.get("venues", ()))
+            ]
+            if links:
+                self._request("POST", "event_venues", json=links, prefer="return=minimal")
+
+            for row, event in zip(rows, batch):
+                inserted.append({**row, "venues": list(event.get("venues", ()))})
+        return inserted
+
+    def create_event(self, name, sport="Basketball", starts_at=None, venues=(), **fields):
+        """Insert a single event (and its venues) and return the row"""
+        event = {"name": name, "sport": sport, "starts_at": starts_at, "venues": list(venues), **fields}
+        return self.bulk_insert_events([event])[0]
+
+    def list_events(self):
+        """Events in this namespace, as the dashboard would select them"""
+        return self._request("GET", "events", params={
+            "select": "id,name,sport,starts_at,description,location,event_venues(venue:venues(id,name))",
+            "user_id": f"eq.{self.user_id}",
+            "name": f"like.{self.namespace}*",
+            "order": "starts_at.asc",
+        })
+
+    def delete_events(self, ids):
+        """Delete events by id (event_venues rows go with them via ON DELETE CASCADE)"""
+        for batch in _batched(ids, self.batch_size):
+            self._request("DELETE", "events", params={"id": f"in.({','.join(batch)})"})
+
+    # -- teardown ----------------------------------------------------------
+
+    def teardown(self):
+        """
+        Delete every event in this namespace. RLS gives users no DELETE on venues,
+        so venues are only removed when SUPABASE_SERVICE_ROLE_KEY is available.
+        """
+        self._request("DELETE", "events", params={
+            "user_id": f"eq.{self.user_id}",
+            "name": f"like.{self.namespace}*",
+        })
+        if self.service_role_key and self._venue_ids:
+            for batch in _batched([n for n in self._venue_ids if n.startswith(self.namespace)], self.batch_size):
+                quoted = ",".join('"' + n.replace('"', '\\"') + '"' for n in batch)
+                self._request("DELETE", "venues", params={"name": f"in.({quoted})"}, key=self.service_role_key)
+
+    def child(self, namespace):
+        """A seeder sharing this one's session and HTTP pool but with its own namespace"""
+        seeder = SupabaseSeeder(
+            self.supabase_url, self.anon_key, self.access_token, self.user_id,
+            namespace=namespace, batch_size=self.batch_size, service_role_key=self.service_role_key,
+        )
+        seeder.session = self.session
+        seeder.http = self.http
+        seeder._venue_ids = self._venue_ids
+        return seeder
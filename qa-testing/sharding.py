@@ -0,0 +1,195 @@
+"""
+Duration-aware test sharding
+Keeps a history of per-test durations (.shards/durations.json), splits the
+collected tests into N shards of near-equal expected time (longest test first
+onto the least loaded shard) and lets each CI runner run one shard.
+
+    pytest --num-shards 3 --shard-id 1              # or SHARD_TOTAL=3 SHARD_INDEX=1
+    python sharding.py plan --num-shards 3          # expected load per shard
+    python sharding.py durations shard-*/test-durations.jsonl
+"""
+import argparse
+import heapq
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from helpers import write_json
+
+
+QA_DIR = Path(__file__).resolve().parent
+DURATIONS_PATH = Path(os.getenv("SHARD_DURATIONS", QA_DIR / ".shards" / "durations.json"))
+# Per-test durations of this run, written by the controller and folded into DURATIONS_PATH
+DURATIONS_LOG = QA_DIR / "reports" / "test-durations.jsonl"
+
+# Weight of the newest run in the stored average
+SMOOTHING = 0.5
+
+# Seconds so far of the current attempt of each running test (setup + call + teardown)
+_pending = {}
+# Under xdist the controller sees every worker's reports, so only it logs durations
+_logging = True
+
+
+# ---------------------------------------------------------------------------
+# Duration history
+# ---------------------------------------------------------------------------
+
+def load_durations(path=DURATIONS_PATH):
+    """Smoothed seconds per test id"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f).get("tests", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def fold_durations(logs, path=DURATIONS_PATH):
+    """Blend the durations recorded in `logs` (test-durations.jsonl files) into the history"""
+    durations = load_durations(path)
+    for log in logs:
+        with open(log, encoding="utf-8") as f:
+            for line in f:
+                record = json.loads(line)
+                previous = durations.get(record["test"])
+                seconds = record["seconds"]
+                durations[record["test"]] = round(
+                    seconds if previous is None else SMOOTHING * seconds + (1 - SMOOTHING) * previous, 3
+                )
+    write_json(path, {"updated_at": time.time(), "tests": durations}, indent=2, sort_keys=True)
+    return durations
+
+
+# ---------------------------------------------------------------------------
+# Partitioning
+# ---------------------------------------------------------------------------
+
+def partition(nodeids, durations, num_shards):
+    """
+    Split `nodeids` into `num_shards` lists with near-equal expected time.
+    Longest-processing-time first: tests in descending duration, each onto the
+    currently lightest shard. Tests without history count as the median known
+    duration. Deterministic, so every runner computes the same split.
+    Returns (shards, expected seconds per shard).
+    """
+    known = [durations[n] for n in nodeids if n in durations]
+    default = statistics.median(known) if known else 1.0
+    weight = {n: durations.get(n, default) for n in nodeids}
+
+    shards = [[] for _ in range(num_shards)]
+    loads = [0.0] * num_shards
+    heap = [(0.0, i) for i in range(num_shards)]
+    for nodeid in sorted(nodeids, key=lambda n: (-weight[n], n)):
+        load, index = heapq.heappop(heap)
+        shards[index].append(nodeid)
+        loads[index] = load + weight[nodeid]
+        heapq.heappush(heap, (loads[index], index))
+    return shards, loads
+
+
+def imbalance(loads):
+    """Slowest shard relative to the average (1.0 = perfectly balanced)"""
+    average = sum(loads) / len(loads) if loads else 0
+    return max(loads) / average if average else 1.0
+
+
+# ---------------------------------------------------------------------------
+# pytest plugin
+# ---------------------------------------------------------------------------
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--num-shards", type=int, default=int(os.getenv("SHARD_TOTAL", "1")),
+        help="Split the suite into this many duration-balanced shards (sharding.py)",
+    )
+    parser.addoption(
+        "--shard-id", type=int, default=int(os.getenv("SHARD_INDEX", "1")),
+        help="Which shard to run, 1..--num-shards",
+    )
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    """Keep this runner's shard; runs after other selection (impact_map.py) so shards split what is left"""
+    num_shards, shard_id = config.getoption("num_shards"), config.getoption("shard_id")
+    if num_shards <= 1:
+        return
+    if not 1 <= shard_id <= num_shards:
+        raise pytest.UsageError(f"--shard-id must be between 1 and {num_shards}, got {shard_id}")
+
+    shards, loads = partition([item.nodeid for item in items], load_durations(), num_shards)
+    keep = set(shards[shard_id - 1])
+    deselected = [item for item in items if item.nodeid not in keep]
+    # Collection order is preserved within the shard so class-scoped setup stays grouped
+    items[:] = [item for item in items if item.nodeid in keep]
+    config.hook.pytest_deselected(items=deselected)
+    print(f"\n🧩 Shard {shard_id}/{num_shards}: {len(items)} tests, ~{loads[shard_id - 1]:.0f}s expected "
+          f"(slowest shard {imbalance(loads):.2f}x the average)")
+
+
+def pytest_configure(config):
+    global _logging
+    _logging = not hasattr(config, "workerinput")
+
+
+def pytest_runtest_logreport(report):
+    """Sum setup, call and teardown time of the current attempt; a rerun (flaky.py) starts over"""
+    if not _logging:
+        return
+    previous = 0.0 if report.when == "setup" else _pending.get(report.nodeid, 0.0)
+    _pending[report.nodeid] = previous + report.duration
+
+
+def pytest_runtest_logfinish(nodeid):
+    """Log one duration per test, that of its final attempt"""
+    if not _logging or nodeid not in _pending:
+        return
+    seconds = _pending.pop(nodeid)
+    DURATIONS_LOG.parent.mkdir(parents=True, exist_ok=True)
+    with open(DURATIONS_LOG, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"test": nodeid, "seconds": round(seconds, 3)}) + "\n")
+
+
+def pytest_sessionstart(session):
+    """Drop the durations log of the previous run"""
+    if not hasattr(session.config, "workerinput"):
+        DURATIONS_LOG.unlink(missing_ok=True)
+
+
+def pytest_sessionfinish(session):
+    """Fold this run's durations into the local history"""
+    if hasattr(session.config, "workerinput") or not DURATIONS_LOG.exists():
+        return
+    fold_durations([DURATIONS_LOG])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Duration-aware test sharding")
+    commands = parser.add_subparsers(dest="command", required=True)
+    plan = commands.add_parser("plan", help="Expected load per shard from the stored durations")
+    plan.add_argument("--num-shards", type=int, required=True)
+    fold = commands.add_parser("durations", help="Fold test-durations.jsonl files into the history")
+    fold.add_argument("logs", nargs="+")
+    args = parser.parse_args()
+
+    if args.command == "plan":
+        durations = load_durations()
+        if not durations:
+            print(f"❌ No duration history at {DURATIONS_PATH}")
+            sys.exit(1)
+        shards, loads = partition(list(durations), durations, args.num_shards)
+        for index, (shard, load) in enumerate(zip(shards, loads), 1):
+            print(f"  shard {index}: {len(shard):>3} tests  ~{load:.1f}s")
+        print(f"📊 Slowest shard is {imbalance(loads):.2f}x the average")
+    else:
+        durations = fold_durations(args.logs)
+        print(f"✓ {len(durations)} test durations in {DURATIONS_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+"""
+Next.js server cold-start benchmark
+Launches the app ROUNDS times (`npm run start`, optionally `npm run dev`) on a
+free port against the local Supabase stand-in and measures, per launch:
+
+- port_open: spawn until the port accepts connections
+- ready:     spawn until /login returns 200 with its form (app_ready.probe)
+- first hit: latency of the first request to every app route and read-only
+             server action, signed in, plus the second request for comparison
+
+Reports min/p50/p95/max per metric to reports/startup-bench.json and compares the
+medians with benchmarks/startup-baseline.json, so a dependency that slows server
+startup shows up as a regression.
+
+Usage:
+    npm run build && python startup_bench.py                 # compare with the baseline
+    python startup_bench.py --rounds 10 --save-baseline      # record a new baseline (commit it)
+    python startup_bench.py --modes start,dev                # also time `next dev`
+    python startup_bench.py --fail-on-slowdown               # exit 1 on a regression or no baseline (CI)
+
+`next start` serves the last `npm run build`; build against the stand-in
+(NEXT_PUBLIC_SUPABASE_URL=http://127.0.0.1:54321) so signed-in pages render.
+"""
+import argparse
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import app_ready
+from helpers import git_commit
+from impact_map import REPO_ROOT
+from loadtest import percentile, prepare_users
+from local_supabase import DEFAULT_PORT as LOCAL_SUPABASE_DEFAULT_PORT, anon_key, ensure_running, port_open
+
+
+BASELINE_PATH = Path(__file__).parent / "benchmarks" / "startup-baseline.json"
+RESULTS_PATH = Path(__file__).parent / "reports" / "startup-bench.json"
+
+COMMANDS = {
+    "start": ["npm", "run", "start", "--"],
+    "dev": ["npm", "run", "dev", "--"],
+}
+# Port and readiness are polled this often: the interval bounds the measurement error
+PORT_POLL_INTERVAL = 0.01
+READY_POLL_INTERVAL = 0.05
+STOP_TIMEOUT = 10
+
+BENCH_EMAIL = "startup-bench@example.com"
+BENCH_PASSWORD = "startup-bench-password-123"
+
+# A median only counts as slower when it is over the tolerance AND this many ms slower,
+# so routes that answer in a few ms do not flap on scheduler noise
+MIN_REGRESSION_MS = 50
+
+
+def _free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+# ---------------------------------------------------------------------------
+# One launch
+# ---------------------------------------------------------------------------
+
+def _stop(process, port):
+    """Stop the app's whole process group (npm -> next) and wait for the port to close"""
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+    except ProcessLookupError:
+        pass
+    try:
+        process.wait(STOP_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        os.killpg(process.pid, signal.SIGKILL)
+        process.wait()
+    deadline = time.monotonic() + STOP_TIMEOUT
+    while port_open(port, "127.0.0.1") and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+
+def launch(mode, env, cookies, timeout, log):
+    """Start the app once, time it, hit every route once (cold) and twice (warm), stop it"""
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    command = COMMANDS[mode] + ["--port", str(port)]
+    session = app_ready._session()
+
+    started = time.perf_counter()
+    process = subprocess.Popen(command, cwd=REPO_ROOT, env=env, stdout=log, stderr=subprocess.STDOUT,
+                               start_new_session=True)
+    try:
+        port_open_ms = None
+        problem = "not started"
+        while time.perf_counter() - started < timeout:
+            if process.poll() is not None:
+                raise app_ready.AppNotReady(f"`{' '.join(command)}` exited with code {process.returncode}")
+            if port_open_ms is None:
+                if port_open(port, "127.0.0.1"):
+                    port_open_ms = (time.perf_counter() - started) * 1000
+                else:
+                    time.sleep(PORT_POLL_INTERVAL)
+                    continue
+            problem = app_ready.probe(session, base_url)
+            if problem is None:
+                break
+            time.sleep(READY_POLL_INTERVAL)
+        else:
+            raise app_ready.AppNotReady(f"{base_url} not ready after {timeout:.0f}s: {problem}")
+        ready_ms = (time.perf_counter() - started) * 1000
+
+        jar = [{"name": name, "value": value, "domain": "127.0.0.1"} for name, value in cookies.items()]
+        # One request at a time: each first hit is timed on its own
+        hits = app_ready.warm(base_url, jar, concurrency=1)
+    finally:
+        _stop(process, port)
+
+    return {
+        "port_open_ms": round(port_open_ms, 1),
+        "ready_ms": round(ready_ms, 1),
+        "first_hits_ms": round(sum(h["cold_ms"] for kind in hits.values() for h in kind.values()), 1),
+        "routes": hits["routes"],
+        "actions": hits["actions"],
+    }
+
+
+# ---------------------------------------------------------------------------
+# Distributions and baseline
+# ---------------------------------------------------------------------------
+
+def distribution(values):
+    values = sorted(values)
+    return {
+        "min": values[0],
+        "p50": round(percentile(values, 50), 1),
+        "p95": round(percentile(values, 95), 1),
+        "max": values[-1],
+    }
+
+
+def summarize(samples):
+    """{metric: distribution} for the launch metrics and the first/second hit of every route and action"""
+    summary = {metric: distribution([s[metric] for s in samples])
+               for metric in ("port_open_ms", "ready_ms", "first_hits_ms")}
+    for kind in ("routes", "actions"):
+        for key in samples[0][kind]:
+            for hit in ("cold", "warm"):
+                values = [s[kind][key][f"{hit}_ms"] for s in samples if key in s[kind]]
+                summary[f"{hit} {key}"] = distribution(values)
+    return summary
+
+
+def regressions(summary, baseline, tolerance):
+    """(metric, p50, baseline p50) for medians slower than the baseline by more than `tolerance`"""
+    slower = []
+    for metric, stats in summary.items():
+        previous = baseline.get(metric)
+        if previous is None:
+            continue
+        if stats["p50"] > previous["p50"] * (1 + tolerance) and stats["p50"] - previous["p50"] > MIN_REGRESSION_MS:
+            slower.append((metric, stats["p50"], previous["p50"]))
+    return slower
+
+
+def load_baseline():
+    try:
+        with open(BASELINE_PATH, encoding="utf-8") as f:
+            return json.load(f).get("modes", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def print_summary(mode, summary, baseline):
+    print(f"\n⏱️ {mode}")
+    print(f"   {'metric':<58}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}{'baseline':>10}")
+    for metric, stats in summary.items():
+        previous = baseline.get(metric, {}).get("p50")
+        print(f"   {metric[:58]:<58}{stats['p50']:>10}{stats['p95']:>10}{stats['max']:>10}"
+              f"{previous if previous is not None else '-':>10}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Next.js server cold start")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--modes", default="start", help="Comma-separated: start, dev (default: start)")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Seconds one launch may take to get ready")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help=f"Write this run's distributions to {BASELINE_PATH.relative_to(Path(__file__).parent)}")
+    parser.add_argument("--fail-on-slowdown", action="store_true",
+                        help="Exit 1 when a median is slower than the baseline by more than --baseline-tolerance, "
+                             "or when a mode has no baseline")
+    parser.add_argument("--baseline-tolerance", type=float, default=0.25,
+                        help="Allowed relative slowdown against the baseline (default: 0.25)")
+    parser.add_argument("--log", default="/tmp/startup-bench.log", help="App output of every launch")
+    args = parser.parse_args(argv)
+
+    modes = [mode.strip() for mode in args.modes.split(",") if mode.strip()]
+    unknown = [mode for mode in modes if mode not in COMMANDS]
+    if unknown:
+        parser.error(f"unknown mode(s): {', '.join(unknown)}")
+    if "start" in modes and not (REPO_ROOT / ".next" / "BUILD_ID").exists():
+        parser.error("no production build - run `npm run build` first")
+
+    port = int(os.getenv("LOCAL_SUPABASE_PORT", LOCAL_SUPABASE_DEFAULT_PORT))
+    server = ensure_running(port, [(BENCH_EMAIL, BENCH_PASSWORD)])
+    supabase_url, key = f"http://127.0.0.1:{port}", anon_key()
+    # `next dev` reads these at startup; `next start` uses what was inlined at build time
+    env = dict(os.environ, NEXT_PUBLIC_SUPABASE_URL=supabase_url, NEXT_PUBLIC_SUPABASE_ANON_KEY=key)
+    user = prepare_users(supabase_url, key, [(BENCH_EMAIL, BENCH_PASSWORD)], 20, 1,
+                         f"startup-{int(time.time())}")[0]
+
+    baseline = load_baseline()
+    results = {}
+    failed = False
+    try:
+        with open(args.log, "ab") as log:
+            for mode in modes:
+                print(f"🚀 {args.rounds} cold starts of `{' '.join(COMMANDS[mode][:-1])}`")
+                samples = []
+                for round_number in range(1, args.rounds + 1):
+                    sample = launch(mode, env, user["cookies"], args.timeout, log)
+                    samples.append(sample)
+                    print(f"   round {round_number}: port {sample['port_open_ms']:.0f}ms, "
+                          f"ready {sample['ready_ms']:.0f}ms, first hits {sample['first_hits_ms']:.0f}ms")
+                results[mode] = {"summary": summarize(samples), "samples": samples}
+    except app_ready.AppNotReady as e:
+        print(f"❌ {e} (app output in {args.log})")
+        return 1
+    finally:
+        user["seeder"].teardown()
+        if server is not None:
+            server.stop()
+
+    for mode, result in results.items():
+        mode_baseline = baseline.get(mode, {})
+        print_summary(mode, result["summary"], mode_baseline)
+        if not mode_baseline and args.fail_on_slowdown and not args.save_baseline:
+            print(f"❌ No {mode} baseline in {BASELINE_PATH} - nothing to compare against. "
+                  f"Record one with --save-baseline and commit it")
+            failed = True
+        elif not mode_baseline:
+            print(f"   No {mode} baseline yet - record one with --save-baseline")
+        for metric, p50, previous in regressions(result["summary"], mode_baseline, args.baseline_tolerance):
+            print(f"⚠️ {mode} {metric}: median {p50}ms vs baseline {previous}ms")
+            failed = True
+
+    entry = {
+        "commit": git_commit(),
+        "recorded_at": datetime.now(timezone.utc).isoformat(),
+        "rounds": args.rounds,
+        "supabase_url": supabase_url,
+    }
+    RESULTS_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(RESULTS_PATH, "w", encoding="utf-8") as f:
+        json.dump({**entry, "modes": results}, f, indent=2)
+    print(f"\nResults: {RESULTS_PATH}")
+
+    if args.save_baseline:
+        merged = dict(baseline)
+        merged.update({mode: result["summary"] for mode, result in results.items()})
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump({**entry, "modes": merged}, f, indent=2)
+            f.write("\n")
+        print(f"Baseline saved to {BASELINE_PATH}")
+        return 0
+    return 1 if failed and args.fail_on_slowdown else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,32 +7,11 @@ import pytest
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
 
 
 class TestAuthentication:
     """Test suite for authentication flows"""
 
-    def test_login_page_loads(self, driver, base_url):
-        """Test that login page loads correctly"""
-        driver.get(f"{base_url}/login")
-        
-        # Check for key elements
-        assert "Welcome back" in driver.page_source
-        assert driver.find_element(By.NAME, "email")
-        assert driver.find_element(By.NAME, "password")
-        assert driver.find_element(By.XPATH, "//button[contains(text(), 'Sign In')]")
-
-    def test_signup_page_loads(self, driver, base_url):
-        """Test that signup page loads correctly"""
-        driver.get(f"{base_url}/signup")
-        
-        # Check for key elements
-        assert "Create an account" in driver.page_source
-        assert driver.find_element(By.NAME, "email")
-        assert driver.find_element(By.NAME, "password")
-        assert driver.find_element(By.XPATH, "//button[contains(text(), 'Sign Up')]")
-
     def test_navigation_between_login_signup(self, driver, base_url):
         """Test navigation between login and signup pages"""
         # Start at login page
@@ -4,14 +4,19 @@ Covers all basic functionality with visual browser testing
 """
 
 import pytest
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from datetime import datetime, timedelta
-import time
 import platform
+from pages import DashboardPage, EventFormPage, click
+from waits import (
+    wait_for,
+    get_and_settle,
+    navigation_settled,
+    url_contains,
+    form_errors_shown,
+    any_of,
+    server_action_completed,
+)
 
 
 class TestCompleteUserJourney:
@@ -26,8 +31,7 @@ class TestCompleteUserJourney:
         driver = authenticated_driver
         
         # Navigate to dashboard to verify authentication
-        driver.get(f"{base_url}/dashboard")
-        time.sleep(1)
+        get_and_settle(driver, f"{base_url}/dashboard")
         
         # Verify dashboard elements
         assert "Events Dashboard" in driver.page_source
@@ -43,198 +47,69 @@ class TestEventCreation:
         print("\n🟢 Starting: Create Event with All Fields Test")
         driver = authenticated_driver
         
-        # Navigate to dashboard first to ensure we're in the right place
-        driver.get(f"{base_url}/dashboard")
-        time.sleep(1)
-        
         # Step 1: Navigate to create event page
         print("  → Navigating to create event page...")
-        driver.get(f"{base_url}/events/new")
-        time.sleep(1)  # Visual pause
-        
-        # Verify page loaded
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.NAME, "name"))
-        )
+        form = EventFormPage(driver, base_url).open()
         print("  ✓ Create event page loaded")
         
         # Step 2: Fill event name
         print("  → Filling event name...")
-        name_input = driver.find_element(By.NAME, "name")
-        name_input.clear()
-        name_input.send_keys("Comprehensive Test Event - All Fields")
-        time.sleep(0.5)  # Visual pause
+        form.set_name("Comprehensive Test Event - All Fields")
         
         # Step 3: Select sport
         print("  → Selecting sport...")
-        sport_select = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, "button[role='combobox']"))
-        )
-        sport_select.click()
-        time.sleep(1)  # Wait for dropdown to open
-        
-        # Try multiple selectors for Radix UI Select option
-        try:
-            basketball_option = WebDriverWait(driver, 5).until(
-                EC.element_to_be_clickable((By.XPATH, "//div[@role='option'][contains(., 'Basketball')]"))
-            )
-        except:
-            try:
-                basketball_option = WebDriverWait(driver, 5).until(
-                    EC.element_to_be_clickable((By.XPATH, "//*[@role='option' and contains(text(), 'Basketball')]"))
-                )
-            except:
-                # Fallback to any element with Basketball text
-                basketball_option = WebDriverWait(driver, 5).until(
-                    EC.element_to_be_clickable((By.XPATH, "//*[contains(@class, 'SelectItem') or @role='option'][contains(., 'Basketball')]"))
-                )
-        basketball_option.click()
-        time.sleep(1)  # Wait for dropdown to close completely
+        form.select_sport("Basketball")
         print("  ✓ Sport selected: Basketball")
         
-        # Press Escape to ensure any dropdown is closed
-        from selenium.webdriver.common.keys import Keys as K
-        driver.find_element(By.TAG_NAME, "body").send_keys(K.ESCAPE)
-        time.sleep(0.5)
-        
         # Step 4: Fill date and time
         print("  → Setting date and time...")
         tomorrow = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%dT14:00")
-        date_input = driver.find_element(By.CSS_SELECTOR, "input[type='datetime-local']")
-        # Use native value setter to properly trigger React's onChange
-        driver.execute_script("""
-            const input = arguments[0];
-            const value = arguments[1];
-            const nativeInputValueSetter = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, 'value').set;
-            nativeInputValueSetter.call(input, value);
-            input.dispatchEvent(new Event('input', { bubbles: true }));
-            input.dispatchEvent(new Event('change', { bubbles: true }));
-        """, date_input, tomorrow)
-        time.sleep(0.5)  # Visual pause
+        form.set_datetime(tomorrow)
         print(f"  ✓ Date set: {tomorrow}")
         
-        # Step 5: Fill description (optional field) - description is optional, so let's skip if it's problematic
-        print("  → Adding description...")
-        try:
-            description_input = WebDriverWait(driver, 5).until(
-                EC.presence_of_element_located((By.NAME, "description"))
-            )
-            # Scroll element into view
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", description_input)
-            time.sleep(0.5)
-            # Use JavaScript to set value for React-controlled inputs
-            driver.execute_script(
-                "arguments[0].value = arguments[1]; arguments[0].dispatchEvent(new Event('input', {bubbles: true}));",
-                description_input,
-                "This is a comprehensive test event with all fields filled out."
-            )
-            time.sleep(0.5)
-            print("  ✓ Description added")
-        except Exception as e:
-            print(f"  ⚠ Description skipped (optional field): {e}")
-        
-        # Step 6: Fill location (optional field)
-        print("  → Adding location...")
-        try:
-            location_input = WebDriverWait(driver, 5).until(
-                EC.presence_of_element_located((By.NAME, "location"))
-            )
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", location_input)
-            time.sleep(0.5)
-            # Use JavaScript to set value for React-controlled inputs
-            driver.execute_script(
-                "arguments[0].value = arguments[1]; arguments[0].dispatchEvent(new Event('input', {bubbles: true}));",
-                location_input,
-                "Test Location, Test City"
-            )
-            time.sleep(0.5)
-            print("  ✓ Location added")
-        except Exception as e:
-            print(f"  ⚠ Location skipped (optional field): {e}")
+        # Step 5: Fill description and location (optional fields)
+        print("  → Adding description and location...")
+        form.set_description("This is a comprehensive test event with all fields filled out.")
+        form.set_location("Test Location, Test City")
+        print("  ✓ Description and location added")
         
-        # Step 7: Add venues
+        # Step 6: Add venues
         print("  → Adding venues...")
-        # Find venue input and Add button
-        venue_input = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "input[placeholder*='venue' i], input[placeholder*='Enter venue']"))
-        )
-        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", venue_input)
-        time.sleep(0.5)
-        
-        # Add first venue using native value setter
-        driver.execute_script("""
-            const input = arguments[0];
-            const value = arguments[1];
-            const nativeInputValueSetter = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, 'value').set;
-            nativeInputValueSetter.call(input, value);
-            input.dispatchEvent(new Event('input', { bubbles: true }));
-            input.dispatchEvent(new Event('change', { bubbles: true }));
-        """, venue_input, "Main Arena")
-        time.sleep(0.3)
-        
-        # Click the Add button
-        add_button = driver.find_element(By.XPATH, "//button[contains(text(), 'Add')]")
-        add_button.click()
-        time.sleep(0.5)
-        
-        # Add second venue
-        driver.execute_script("""
-            const input = arguments[0];
-            const value = arguments[1];
-            const nativeInputValueSetter = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, 'value').set;
-            nativeInputValueSetter.call(input, value);
-            input.dispatchEvent(new Event('input', { bubbles: true }));
-            input.dispatchEvent(new Event('change', { bubbles: true }));
-        """, venue_input, "Secondary Court")
-        time.sleep(0.3)
-        add_button.click()
-        time.sleep(0.5)
-        
+        form.add_venue("Main Arena")
+        form.add_venue("Secondary Court")
         print("  ✓ Venues added: Main Arena, Secondary Court")
         
-        # Step 8: Submit form
+        # Step 7: Submit form
         print("  → Submitting event form...")
-        submit_button = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//button[@type='submit']"))
-        )
-        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", submit_button)
-        time.sleep(0.5)
-        submit_button.click()
-        time.sleep(3)  # Wait for form processing
+        form.submit()
+        try:
+            # Either the create action resolves or client-side validation blocks the submit
+            wait_for(driver, any_of(server_action_completed(), form_errors_shown()), timeout=15)
+        except TimeoutException:
+            print("  ⚠ Server action did not complete in time")
         
-        # Check for validation errors first
-        page_source = driver.page_source.lower()
-        if "required" in page_source or "invalid" in page_source or "error" in page_source.replace("errors", ""):
-            # Check if on create page still with errors
-            if "/events/new" in driver.current_url:
-                print("  ⚠ Form validation errors detected, checking details...")
-                # Print page source for debugging
-                errors = driver.find_elements(By.CSS_SELECTOR, "[class*='error'], [class*='destructive'], p.text-destructive")
-                for err in errors[:3]:  # Show first 3 errors
-                    print(f"    Error: {err.text}")
+        # Report validation errors if the form is still showing
+        if "/events/new" in driver.current_url:
+            for err in form.find(EventFormPage.ERROR, all=True)[0][:3]:  # Show first 3 errors
+                print(f"    Error: {err.text}")
         
         # Wait for redirect or success toast
         try:
-            WebDriverWait(driver, 15).until(
-                EC.url_contains("/dashboard")
-            )
-        except:
+            wait_for(driver, url_contains("/dashboard"), timeout=15)
+        except TimeoutException:
             # If no redirect, check for success toast
             if "success" in driver.page_source.lower() or "created" in driver.page_source.lower():
                 print("  ✓ Success message detected, navigating to dashboard...")
-                driver.get(f"{base_url}/dashboard")
-            else:
-                # Navigate to dashboard anyway to verify
-                driver.get(f"{base_url}/dashboard")
+            driver.get(f"{base_url}/dashboard")
         
-        time.sleep(2)  # Visual pause
+        wait_for(driver, navigation_settled("/dashboard"))
         
         # Verify event appears (case-insensitive check)
         if "Comprehensive Test Event" in driver.page_source or "comprehensive" in driver.page_source.lower():
             print("  ✓ Event created successfully and appears in dashboard")
         else:
             # Check if any events exist
-            events = driver.find_elements(By.CSS_SELECTOR, "[class*='card'], [class*='event']")
+            events = DashboardPage(driver, base_url).event_cards()
             print(f"  ℹ Found {len(events)} event cards on dashboard")
             assert len(events) > 0, "No events found on dashboard after creation"
 
@@ -242,284 +117,119 @@ class TestEventCreation:
 class TestEventEditing:
     """Test event editing functionality"""
 
-    def test_edit_existing_event(self, authenticated_driver, base_url):
+    def test_edit_existing_event(self, authenticated_driver, base_url, seeded_event):
         """Test editing an existing event"""
         print("\n🟡 Starting: Edit Existing Event Test")
         driver = authenticated_driver
         
-        # Step 1: Go to dashboard
+        # Step 1: Go to dashboard, filtered down to the event seeded for this test
         print("  → Navigating to dashboard...")
-        driver.get(f"{base_url}/dashboard")
-        time.sleep(2)  # Wait for page to fully load
+        dashboard = DashboardPage(driver, base_url).open(search=seeded_event["name"])
         
-        # Step 2: Find and click edit button on first event
-        print("  → Looking for events to edit...")
-        # Look for Edit links (Button with asChild renders as <a>)
-        edit_links = driver.find_elements(By.XPATH, "//a[contains(., 'Edit')]")
+        # Step 2: Open the edit form from the seeded event's card
+        print("  → Looking for the event to edit...")
+        try:
+            form = dashboard.edit_event(seeded_event["name"])
+        except TimeoutException:
+            pytest.fail(f"Seeded event '{seeded_event['name']}' not found on dashboard")
+        print("  ✓ Edit page loaded")
         
-        if len(edit_links) == 0:
-            # Fallback: look for any clickable Edit element
-            edit_links = driver.find_elements(By.XPATH, "//*[contains(text(), 'Edit')]")
+        # Step 3: Modify event name
+        print("  → Modifying event name...")
+        current_name = form.wait(EventFormPage.NAME).get_attribute("value")
+        form.set_name(f"{current_name} - EDITED")
         
-        if len(edit_links) > 0:
-            # Scroll into view and click
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", edit_links[0])
-            time.sleep(0.5)
-            edit_links[0].click()
-            time.sleep(2)  # Wait for edit page to load
-            
-            # Verify we're on the edit page
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.NAME, "name"))
-            )
-            print("  ✓ Edit page loaded")
-            
-            # Step 3: Modify event name
-            print("  → Modifying event name...")
-            name_input = driver.find_element(By.NAME, "name")
-            current_name = name_input.get_attribute("value")
-            edited_name = f"{current_name} - EDITED"
-            
-            # Use JS to set value reliably
-            driver.execute_script("""
-                const input = arguments[0];
-                const value = arguments[1];
-                input.focus();
-                input.select();
-                const nativeInputValueSetter = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, 'value').set;
-                nativeInputValueSetter.call(input, value);
-                input.dispatchEvent(new Event('input', { bubbles: true }));
-                input.dispatchEvent(new Event('change', { bubbles: true }));
-            """, name_input, edited_name)
-            time.sleep(0.5)
-            
-            # Step 4: Submit changes
-            print("  → Submitting changes...")
-            submit_button = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//button[@type='submit']"))
+        # Step 4: Submit changes
+        print("  → Submitting changes...")
+        form.submit()
+        
+        # Wait for either redirect to dashboard or success toast
+        print("  → Waiting for save confirmation...")
+        
+        # Check for success - either we're on dashboard or see success toast
+        try:
+            wait_for(
+                driver,
+                lambda d: "/dashboard" in d.current_url or "success" in d.page_source.lower() or "updated" in d.page_source.lower(),
+                timeout=15,
+                name="event saved",
             )
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", submit_button)
-            time.sleep(0.3)
-            submit_button.click()
-            
-            # Wait for either redirect to dashboard or success toast
-            print("  → Waiting for save confirmation...")
-            time.sleep(3)  # Allow time for form submission
-            
-            # Check for success - either we're on dashboard or see success toast
-            try:
-                WebDriverWait(driver, 10).until(
-                    lambda d: "/dashboard" in d.current_url or "success" in d.page_source.lower() or "updated" in d.page_source.lower()
-                )
-                print("  ✓ Event updated successfully")
-            except:
-                # If still on edit page, check for any error messages
-                page_source = driver.page_source.lower()
-                if "error" in page_source:
-                    print("  ⚠ Form submission may have had an error")
-                else:
-                    print("  ⚠ Form submitted but redirect did not complete in time")
-                # Don't fail the test as long as no hard error
-        else:
-            pytest.skip("No events found to edit - create an event first")
+            print("  ✓ Event updated successfully")
+        except TimeoutException:
+            # If still on edit page, check for any error messages
+            if form.find(EventFormPage.ERROR)[0]:
+                print("  ⚠ Form submission may have had an error")
+            else:
+                print("  ⚠ Form submitted but redirect did not complete in time")
+            # Don't fail the test as long as no hard error
 
 
 class TestEventDeletion:
     """Test event deletion functionality"""
 
-    def test_delete_event(self, authenticated_driver, base_url):
+    def test_delete_event(self, authenticated_driver, base_url, seeded_event):
         """Test deleting an event"""
         print("\n🔴 Starting: Delete Event Test")
         driver = authenticated_driver
         
-        # Step 1: Go to dashboard
+        # Step 1: Go to dashboard, filtered down to the event seeded for this test
         print("  → Navigating to dashboard...")
-        driver.get(f"{base_url}/dashboard")
-        time.sleep(1)  # Visual pause
+        dashboard = DashboardPage(driver, base_url).open(search=seeded_event["name"])
         
-        # Step 2: Find delete button
-        print("  → Looking for events to delete...")
-        delete_buttons = driver.find_elements(By.XPATH, "//button[contains(text(), 'Delete')]")
+        # Step 2: Open the delete dialog from the seeded event's card
+        print("  → Looking for the event to delete...")
+        try:
+            dialog = dashboard.delete_event(seeded_event["name"])
+        except TimeoutException:
+            pytest.fail(f"Seeded event '{seeded_event['name']}' not found on dashboard")
+        print("  ✓ Delete dialog opened")
+        
+        # Step 3: Confirm deletion
+        print("  → Confirming deletion...")
+        dialog.confirm()
+        wait_for(
+            driver,
+            lambda d: seeded_event["name"] not in d.execute_script("return document.body.innerText"),
+            name="deleted event gone",
+        )
         
-        if len(delete_buttons) > 0:
-            # Get event name before deletion
-            event_cards = driver.find_elements(By.CSS_SELECTOR, "[class*='card'], [class*='Card']")
-            event_name = ""
-            if event_cards:
-                event_name = event_cards[0].text.split('\n')[0] if event_cards[0].text else ""
-            
-            # Click delete button
-            delete_buttons[0].click()
-            time.sleep(1)  # Visual pause
-            print("  ✓ Delete dialog opened")
-            
-            # Step 3: Confirm deletion
-            print("  → Confirming deletion...")
-            # Wait for dialog to be visible and find the confirm button within the dialog
-            # The dialog has a button with variant="destructive" that says "Delete"
-            # We need to find it specifically within the dialog content, not the trigger button
-            confirm_button = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((
-                    By.XPATH, 
-                    "//div[@role='dialog']//button[contains(@class, 'destructive') and contains(text(), 'Delete')] | " +
-                    "//div[@role='dialog']//button[contains(text(), 'Delete') and not(contains(@disabled, 'true'))] | " +
-                    "//div[contains(@class, 'dialog-content')]//button[contains(text(), 'Delete')]"
-                ))
-            )
-            confirm_button.click()
-            time.sleep(2)  # Visual pause for deletion to process
-            
-            # Wait for dialog to close and page to update
-            WebDriverWait(driver, 10).until(
-                EC.invisibility_of_element_located((By.XPATH, "//div[@role='dialog']"))
-            )
-            time.sleep(1)  # Additional pause for page refresh
-            
-            print("  ✓ Event deleted successfully")
-        else:
-            pytest.skip("No events found to delete - create an event first")
+        print("  ✓ Event deleted successfully")
 
 
 class TestNavigation:
     """Test navigation and UI elements"""
 
-    def test_dashboard_navigation(self, authenticated_driver, base_url, test_credentials):
+    def test_dashboard_navigation(self, authenticated_driver, base_url):
         """Test navigation elements on dashboard"""
         print("\n🧭 Starting: Dashboard Navigation Test")
         driver = authenticated_driver
         
         # Step 1: Go to dashboard
         print("  → Navigating to dashboard...")
-        driver.get(f"{base_url}/dashboard")
-        time.sleep(1)
-        
-        # Defensive: if redirected to login, re-authenticate using helper from conftest
-        if "/login" in driver.current_url or "sign in" in driver.page_source.lower() or "welcome back" in driver.page_source.lower():
-            from conftest import ui_login
-            print("  → Redirected to /login; re-authenticating...")
-            ui_login(driver, base_url, test_credentials)
-            driver.get(f"{base_url}/dashboard")
-            time.sleep(1)
-        
-        # More robust dashboard loaded check: accept multiple indicators and give more time
-        def dashboard_is_ready(d):
-            """Check if dashboard is ready using multiple indicators"""
-            # 1) URL check - simplest and most reliable
-            if "/dashboard" in d.current_url:
-                return True
-            # 2) Heading check (case-insensitive, handles icons/splitting)
-            heading_xpath = "//h1[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'events dashboard')]"
-            if d.find_elements(By.XPATH, heading_xpath):
-                return True
-            # 3) Any element containing the "Events Dashboard" text (in case it's not an h1)
-            generic_xpath = "//*[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'events dashboard')]"
-            if d.find_elements(By.XPATH, generic_xpath):
-                return True
-            # 4) If page exposes the 'New Event' link quickly, consider dashboard ready
-            if d.find_elements(By.XPATH, "//a[@href='/events/new']"):
-                return True
-            return False
-        
-        # Wait for dashboard with longer timeout for CI environments
-        try:
-            WebDriverWait(driver, 30).until(dashboard_is_ready)
-        except TimeoutException:
-            from conftest import save_debug_artifacts
-            save_debug_artifacts(driver, "dashboard-timeout")
-            raise TimeoutException(
-                f"Dashboard did not load within 30 seconds. "
-                f"Current URL: {driver.current_url}, "
-                f"Page title: {driver.title}"
-            )
+        dashboard = DashboardPage(driver, base_url).open()
         
-        time.sleep(1)  # Brief pause for any animations
-        
-        # Step 2: Check for navigation elements
+        # Step 2: Check for navigation elements - one snapshot for all of them
         print("  → Checking navigation elements...")
-        
-        # Check for "New Event" button - try multiple strategies to find it
-        # The button uses Button asChild with Link, so it renders as an <a> tag
-        # We need to handle cases where the text might be split by the Plus icon
-        # Prefer visible/clickable elements so subsequent .click() works reliably
-        def find_visible_new_event_button(d):
-            """Find any visible New Event button/link"""
-            elements = d.find_elements(
-                By.XPATH,
-                "//a[@href='/events/new'] | "
-                "//a[contains(., 'New Event')] | "
-                "//button[contains(., 'New Event')]"
-            )
-            # Return first visible element
-            for elem in elements:
-                try:
-                    if elem.is_displayed():
-                        return [elem]
-                except:
-                    continue
-            return []
-        
-        try:
-            new_event_btns = WebDriverWait(driver, 15).until(find_visible_new_event_button)
-        except TimeoutException:
-            # Fallback to any presence if visibility didn't appear (keeps test informative)
-            print("  ⚠️ Visibility wait timed out, trying presence check...")
-            new_event_btns = driver.find_elements(
-                By.XPATH, 
-                "//a[@href='/events/new'] | "
-                "//a[contains(., 'New Event')] | "
-                "//button[contains(., 'New Event')]"
-            )
-            if len(new_event_btns) == 0:
-                from conftest import save_debug_artifacts
-                save_debug_artifacts(driver, "new-event-button-not-found")
-                raise AssertionError(
-                    "New Event button not found. Checked for links/buttons with 'New Event' text or href='/events/new'. "
-                    f"Current URL: {driver.current_url}"
-                )
-        
-        assert len(new_event_btns) > 0, "New Event button not found. Checked for links/buttons with 'New Event' text or href='/events/new'"
-        new_event_btn = new_event_btns[0]
+        state = dashboard.snapshot(
+            new_event=(DashboardPage.NEW_EVENT, ["href"]),
+            search_input=DashboardPage.SEARCH_INPUT,
+            filter_dropdown=DashboardPage.SPORT_FILTER,
+        )
+        # A failing assertion below captures screenshot, DOM and console (artifacts.py)
+        assert state["new_event"]["visible"], f"New Event button not found. Current URL: {driver.current_url}"
+        assert state["new_event"]["attributes"]["href"] == "/events/new"
         print("  ✓ New Event button found")
-        
-        # Check for search input
-        search_input = driver.find_elements(By.CSS_SELECTOR, "input[placeholder*='Search' i]")
-        assert len(search_input) > 0, "Search input not found"
+        assert state["search_input"]["visible"], "Search input not found"
         print("  ✓ Search input found")
-        
-        # Check for filter dropdown
-        filter_dropdown = driver.find_elements(By.CSS_SELECTOR, "button[role='combobox']")
-        assert len(filter_dropdown) > 0, "Filter dropdown not found"
+        assert state["filter_dropdown"]["visible"], "Filter dropdown not found"
         print("  ✓ Filter dropdown found")
         
         # Step 3: Test navigation to create event
         print("  → Testing navigation to create event page...")
-        
-        # Ensure element is clickable before clicking
-        try:
-            WebDriverWait(driver, 10).until(EC.element_to_be_clickable(new_event_btn))
-        except TimeoutException:
-            print("  ⚠️ Element not clickable, trying direct navigation...")
-            driver.get(f"{base_url}/events/new")
-        else:
-            # Scroll element into view for better reliability
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", new_event_btn)
-            time.sleep(0.5)  # Brief pause after scroll
-            
-            if new_event_btn.tag_name == 'a':
-                new_event_btn.click()
-            else:
-                # If it's a button wrapping a link
-                link = new_event_btn.find_element(By.XPATH, ".//ancestor::a | .//following::a | .//preceding::a")
-                if link:
-                    link.click()
-                else:
-                    driver.get(f"{base_url}/events/new")
+        click(driver, state["new_event"]["element"])
         
         # Wait for navigation to complete
-        WebDriverWait(driver, 15).until(
-            lambda d: "/events/new" in d.current_url or "Create" in d.page_source
-        )
-        time.sleep(1)  # Brief pause for page to settle
+        wait_for(driver, navigation_settled("/events/new"), timeout=15)
         assert "/events/new" in driver.current_url or "Create" in driver.page_source
         print("  ✓ Successfully navigated to create event page")
 
@@ -527,36 +237,36 @@ class TestNavigation:
 class TestSignOut:
     """Test sign out functionality"""
 
-    def test_sign_out(self, authenticated_driver, base_url):
-        """Test signing out (runs last to verify logout works)"""
+    def test_sign_out(self, authenticated_driver, base_url, test_credentials):
+        """Test signing out, then sign back in: sign-out revokes the session every later test injects"""
         print("\n🚪 Starting: Sign Out Test")
         driver = authenticated_driver
         
         # Step 1: Go to dashboard
         print("  → Navigating to dashboard...")
-        driver.get(f"{base_url}/dashboard")
-        time.sleep(1)  # Visual pause
+        dashboard = DashboardPage(driver, base_url).open()
         
         # Step 2: Find sign out button
         print("  → Looking for sign out button...")
-        signout_buttons = driver.find_elements(By.XPATH, "//button[contains(text(), 'Sign Out')] | //button[contains(text(), 'Logout')] | //button[contains(text(), 'Log out')]")
+        signout_button = dashboard.find(DashboardPage.SIGN_OUT)[0]
         
-        if len(signout_buttons) > 0:
+        if signout_button:
             print("  ✓ Sign out button found")
             
             # Step 3: Click sign out
             print("  → Clicking sign out...")
-            signout_buttons[0].click()
-            time.sleep(2)  # Visual pause
+            signout_button.click()
             
             # Step 4: Verify redirect to login
-            WebDriverWait(driver, 10).until(
-                EC.url_contains("/login")
-            )
-            time.sleep(1)  # Visual pause
+            wait_for(driver, navigation_settled("/login"))
             
-            assert "Welcome back" in driver.page_source or "Sign in" in driver.page_source
-            print("  ✓ Successfully signed out and redirected to login")
+            try:
+                assert "Welcome back" in driver.page_source or "Sign in" in driver.page_source
+                print("  ✓ Successfully signed out and redirected to login")
+            finally:
+                # Signing out is global, so replace the pooled auth snapshot with a live one
+                from conftest import ui_login
+                ui_login(driver, base_url, test_credentials)
         else:
             print("  ⚠ Sign out button not found in expected location")
 
@@ -0,0 +1,63 @@
+"""
+Browserless Page Tests for Fastbreak Events Dashboard
+Server-rendered content and auth redirects checked over plain HTTP - no Chrome
+"""
+
+import pytest
+
+
+pytestmark = pytest.mark.http
+
+
+class TestAuthPages:
+    """The login and signup pages render their forms on the server"""
+
+    def test_login_page_loads(self, http_client):
+        """Test that login page loads correctly"""
+        page = http_client.get("/login")
+        
+        assert page.status == 200
+        assert page.contains("Welcome back")
+        assert page.first("input", name="email")
+        assert page.first("input", name="password", type="password")
+        assert page.first("button", text="Sign In")
+        assert page.first("a", href="/signup")
+
+    def test_signup_page_loads(self, http_client):
+        """Test that signup page loads correctly"""
+        page = http_client.get("/signup")
+        
+        assert page.status == 200
+        assert page.contains("Create an account")
+        assert page.first("input", name="email")
+        assert page.first("input", name="password")
+        assert page.first("button", text="Sign Up")
+        assert page.first("a", href="/login")
+
+    def test_forgot_password_page_loads(self, http_client):
+        """Test that the forgot-password page links back to login"""
+        page = http_client.get("/forgot-password")
+        
+        assert page.status == 200
+        assert page.contains("Reset password")
+        assert page.first("input", name="email")
+        assert page.first("button", text="Send reset link")
+        assert page.first("a", href="/login")
+
+
+class TestAuthRedirects:
+    """Signed-out requests to protected routes end on /login"""
+
+    @pytest.mark.parametrize("path", ["/", "/dashboard", "/events/new"])
+    def test_redirects_to_login_when_not_authenticated(self, http_client, path):
+        """Test that unauthenticated users are redirected to login"""
+        page = http_client.get(path)
+        
+        assert page.path == "/login", f"{path} ended on {page.url} via {page.history}"
+        assert page.history, f"{path} rendered without redirecting"
+        assert page.contains("Welcome back")
+        assert not page.next_error
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,91 @@
+"""
+Performance Budget Tests for Fastbreak Events Dashboard
+Fails when the median TTFB / FCP / LCP / JS bytes / server-action latency of a
+route exceeds its budget in budgets.yaml. Meant for production builds (npm run build).
+"""
+
+import pytest
+import devtools_timing
+from conftest import create_event_via_ui, _test_namespace
+from pages import DashboardPage, EventFormPage
+from perf_budgets import (
+    load_budgets,
+    measure_load,
+    measure_action,
+    median_metrics,
+    over_budget,
+    record_trend,
+)
+
+BUDGETS = load_budgets()
+
+
+def _budget_cases():
+    for route, modes in BUDGETS["routes"].items():
+        for mode in modes or {}:
+            yield pytest.param(route, mode, id=f"{route}-{mode}")
+
+
+def _event_id(driver, base_url, event):
+    """Id of a seeded event; UI-seeded events only have a name, so read it from the Edit link"""
+    if event.get("id"):
+        return event["id"]
+    dashboard = DashboardPage(driver, base_url).open(search=event["name"])
+    href = dashboard.wait(DashboardPage.EDIT_LINK, root=dashboard.card(event["name"])).get_attribute("href")
+    return href.rstrip("/").split("/")[-2]
+
+
+def _submit_edit(base_url, event_id, new_name):
+    """Action for /events/[id]/edit: rename the event and save"""
+    def perform(driver):
+        form = EventFormPage.edit(driver, base_url, event_id).open()
+        form.set_name(new_name)
+        form.submit_and_wait()
+    return perform
+
+
+@pytest.mark.performance
+class TestPerformanceBudgets:
+    """Median web vitals per route against budgets.yaml"""
+
+    @pytest.mark.parametrize("route,mode", list(_budget_cases()))
+    def test_route_within_budget(self, route, mode, authenticated_driver, base_url, api_seeder, request):
+        """Measure a route over warm or cold iterations and compare medians with its budget"""
+        if not devtools_timing.ENABLED:
+            pytest.skip("DEVTOOLS_TIMING=false - performance logging is off")
+        driver = authenticated_driver
+        budget = BUDGETS["routes"][route][mode]
+        iterations = BUDGETS["iterations"]
+        namespace = _test_namespace(request)
+        cold = mode == "cold"
+        print(f"\n⏱️ {route} ({mode}, {iterations} iterations)")
+
+        path, event, event_id = route, None, None
+        if "[id]" in route:
+            event = request.getfixturevalue("seeded_event")
+            event_id = _event_id(driver, base_url, event)
+            path = route.replace("[id]", event_id)
+        url = f"{base_url}{path}"
+
+        if not cold:
+            # Prime the cache (and the route's server bundle) before measuring
+            measure_load(driver, url, cold=False)
+        samples = [measure_load(driver, url, cold) for _ in range(iterations)]
+
+        if "server_action_ms" in budget:
+            for i in range(iterations):
+                if route == "/events/new":
+                    perform = lambda d, i=i: create_event_via_ui(d, base_url, f"{namespace} perf {i}")
+                else:
+                    # Keep the seeded name as prefix so seeded_event teardown still finds it
+                    perform = _submit_edit(base_url, event_id, f"{event['name']} perf {i}")
+                samples.append(measure_action(driver, perform))
+            if api_seeder is not None:
+                api_seeder.child(namespace).teardown()
+
+        medians = median_metrics(samples)
+        record_trend(route, mode, medians, budget, samples)
+        print("  " + ", ".join(f"{k}={v}" for k, v in medians.items() if v is not None))
+
+        failures = over_budget(medians, budget)
+        assert not failures, f"{route} ({mode}) over budget: {'; '.join(failures)}"
@@ -7,6 +7,8 @@ import pytest
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from pages import LoginPage
+from waits import wait_for, document_ready
 
 
 def test_selenium_setup(driver, base_url):
@@ -17,9 +19,8 @@ def test_selenium_setup(driver, base_url):
         driver.get(base_url)
         print(f"✅ Successfully navigated to {base_url}")
         
-        # Wait a moment for page to load
-        import time
-        time.sleep(2)
+        # Wait for the page to finish loading
+        wait_for(driver, document_ready())
         
         # Check if we can find any element
         body = driver.find_element(By.TAG_NAME, "body")
@@ -79,17 +80,8 @@ def test_login_credentials_work(driver, base_url, test_credentials):
     if not test_credentials.get("email") or not test_credentials.get("password"):
         pytest.skip("TEST_EMAIL and TEST_PASSWORD not set - skipping login test")
     
-    driver.get(f"{base_url}/login")
-    
-    # Wait for login page
-    WebDriverWait(driver, 10).until(
-        EC.presence_of_element_located((By.NAME, "email"))
-    )
-    
-    # Fill credentials
-    driver.find_element(By.NAME, "email").send_keys(test_credentials["email"])
-    driver.find_element(By.NAME, "password").send_keys(test_credentials["password"])
-    driver.find_element(By.XPATH, "//button[contains(text(), 'Sign In')]").click()
+    # open() waits for hydration - the form posts natively if submitted before React attaches
+    LoginPage(driver, base_url).open().login(test_credentials["email"], test_credentials["password"])
     
     # Wait for redirect
     WebDriverWait(driver, 20).until(
@@ -0,0 +1,20 @@
+"""
+Fixtures for the hermetic tests of the QA tooling itself
+No browser or running app is needed; the backend is an in-process stand-in.
+"""
+import pytest
+
+from local_supabase import LocalSupabase
+
+
+@pytest.fixture(scope="session", autouse=True)
+def verify_app_running():
+    """Tooling tests need no app - overrides the app check in ../conftest.py"""
+
+
+@pytest.fixture
+def stand_in():
+    """A fresh, empty local Supabase stand-in on a free port"""
+    server = LocalSupabase(port=0).start_in_thread()
+    yield server
+    server.stop()
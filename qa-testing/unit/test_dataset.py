@@ -0,0 +1,46 @@
+"""
+Synthetic dataset generator: determinism and the shape of its distributions
+"""
+import itertools
+
+import pytest
+
+from dataset import event_counts, rows, seeder_events
+
+ANCHOR = "2026-01-05"
+
+
+def _take(stream, n=2000):
+    return list(itertools.islice(stream, n))
+
+
+def test_same_seed_same_rows():
+    assert _take(rows(20, 50, seed=7, anchor=ANCHOR)) == _take(rows(20, 50, seed=7, anchor=ANCHOR))
+
+
+def test_other_seed_other_rows():
+    assert _take(rows(20, 50, seed=7, anchor=ANCHOR)) != _take(rows(20, 50, seed=8, anchor=ANCHOR))
+
+
+def test_seeder_events_are_deterministic_and_exact():
+    first = list(seeder_events(300, seed=3, anchor=ANCHOR))
+
+    assert len(first) == 300
+    assert first == list(seeder_events(300, seed=3, anchor=ANCHOR))
+
+
+def test_event_counts_add_up():
+    assert sum(event_counts(1, 500, 50_000)) == 50_000
+
+
+@pytest.mark.parametrize("users", [50, 1000])
+def test_top_fifth_of_users_own_four_fifths_of_events(users):
+    counts = sorted(event_counts(1, users, users * 100), reverse=True)
+
+    assert sum(counts[:users // 5]) / sum(counts) == pytest.approx(0.8, abs=0.01)
+
+
+def test_heavy_users_are_spread_across_the_list():
+    counts = event_counts(1, 1000, 100_000)
+
+    assert counts != sorted(counts, reverse=True)
@@ -0,0 +1,38 @@
+"""
+Chromedriver resolution against the manifest, with scripts standing in for
+Chrome and chromedriver
+"""
+import json
+import os
+
+import pytest
+
+import driver_resolver
+
+
+def _binary(path, version, mtime):
+    path.write_text(f"#!/bin/sh\necho 'Google Chrome {version}'\n")
+    path.chmod(0o755)
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+@pytest.fixture
+def chrome(tmp_path, monkeypatch):
+    monkeypatch.delenv("CHROMEDRIVER_PATH", raising=False)
+    monkeypatch.setenv("CHROME_BIN", str(tmp_path / "chrome"))
+    monkeypatch.setattr(driver_resolver, "_local_candidates", lambda: iter([str(tmp_path / "chromedriver")]))
+    _binary(tmp_path / "chromedriver", "120.0.6099.109", 1_700_000_000)
+    return _binary(tmp_path / "chrome", "120.0.6099.109", 1_700_000_000)
+
+
+def test_chrome_update_within_major_is_saved(chrome, tmp_path):
+    manifest_path = tmp_path / "manifest.json"
+    driver = driver_resolver.resolve(offline=True, manifest_path=manifest_path)
+
+    _binary(chrome, "120.0.6099.224", 1_700_100_000)
+    assert driver_resolver.resolve(offline=True, manifest_path=manifest_path) == driver
+
+    saved = json.loads(manifest_path.read_text())["chrome"]
+    assert list(saved.values()) == ["120.0.6099.224"]
+    assert next(iter(saved)) == driver_resolver._fingerprint(chrome)
@@ -0,0 +1,36 @@
+"""
+Diff-based test selection (impact_map.plan) on the app's real route graph
+"""
+from impact_map import plan, route_sources
+
+
+LOGIN_TEST = "test_auth.py::TestAuthentication::test_login_page_loads"
+SMOKE_TEST = "test_http_smoke.py::TestAuthPages::test_login_page_loads"
+TESTS = {LOGIN_TEST: {"routes": ["/login"]}, SMOKE_TEST: {"routes": ["/login"]}}
+
+# Rendered on /dashboard only, which no test in TESTS visits
+DASHBOARD_ONLY = "src/components/EventCard.tsx"
+
+
+def test_dashboard_only_source():
+    assert DASHBOARD_ONLY in route_sources("/dashboard") - route_sources("/login")
+
+
+def test_nothing_impacted_falls_back_to_smoke_tests():
+    selected, reason = plan([LOGIN_TEST, SMOKE_TEST], {DASHBOARD_ONLY}, TESTS, smoke=["test_http_smoke.py"])
+
+    assert selected == {SMOKE_TEST}
+    assert "nothing impacted" in reason
+
+
+def test_nothing_impacted_without_smoke_tests_is_an_empty_selection():
+    selected, reason = plan([LOGIN_TEST], {DASHBOARD_ONLY}, TESTS, smoke=["test_http_smoke.py"])
+
+    assert selected == set()
+    assert "nothing impacted" in reason
+
+
+def test_impacted_tests_are_selected():
+    selected, _ = plan([LOGIN_TEST, SMOKE_TEST], {"src/app/(auth)/login/page.tsx"}, TESTS)
+
+    assert selected == {LOGIN_TEST, SMOKE_TEST}
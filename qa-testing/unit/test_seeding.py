@@ -0,0 +1,48 @@
+"""
+SupabaseSeeder session handling against the local stand-in
+"""
+import time
+
+import requests
+
+from seeding import SupabaseSeeder
+
+
+EMAIL = "seeder@example.com"
+PASSWORD = "seeder-password-123"
+
+
+def _sign_in(server, namespace="qa-unit"):
+    server.auth.create_user(EMAIL, PASSWORD)
+    return SupabaseSeeder.sign_in(EMAIL, PASSWORD, server.url, server.anon_key, namespace=namespace)
+
+
+def test_seeds_after_global_sign_out(stand_in):
+    """A global sign-out (test_sign_out in the browser) revokes the seeder's refresh token too"""
+    seeder = _sign_in(stand_in)
+    child = seeder.child("qa-unit-child")
+    child.create_event("before")
+
+    response = requests.post(
+        f"{stand_in.url}/auth/v1/logout", params={"scope": "global"},
+        headers={"apikey": stand_in.anon_key, "Authorization": f"Bearer {seeder.access_token}"}, timeout=5,
+    )
+    assert response.status_code == 204
+
+    child.create_event("after")
+    assert [event["name"] for event in child.list_events()] == ["qa-unit-child before", "qa-unit-child after"]
+    # The children share the renewed session
+    assert seeder.access_token == child.access_token
+    child.teardown()
+
+
+def test_refreshes_before_expiry(stand_in):
+    seeder = _sign_in(stand_in)
+    refresh_token = seeder.session.refresh_token
+    seeder.session.expires_at = time.time()
+
+    seeder.create_event("game")
+
+    assert seeder.session.refresh_token != refresh_token
+    assert seeder.session.expires_at > time.time()
+    seeder.teardown()
@@ -0,0 +1,463 @@
+"""
+Condition-driven waits for the Selenium suites
+Replaces fixed time.sleep pauses with named readiness conditions that are
+polled with adaptive backoff, and records how long every wait actually took.
+"""
+import json
+import time
+from contextlib import nullcontext
+from pathlib import Path
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+from selenium.webdriver.remote.command import Command
+
+
+DEFAULT_TIMEOUT = 10
+INITIAL_INTERVAL = 0.025
+MAX_INTERVAL = 0.5
+BACKOFF_FACTOR = 1.6
+
+IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+
+
+class WaitLog:
+    """
+    Per-call record of every wait, attributed to the currently running test.
+    conftest.py sets `current_test` around each test and dumps the log at session end.
+    """
+
+    def __init__(self):
+        self.records = []
+        self.commands = {}
+        self.current_test = None
+        # Context manager factory around every wait; phase_timing.py swaps in its clock
+        self.span = lambda name: nullcontext()
+
+    def count_command(self):
+        """One WebDriver round-trip issued by the current test (see track_implicit_waits)"""
+        self.commands[self.current_test] = self.commands.get(self.current_test, 0) + 1
+
+    def record(self, name, elapsed, ok, polls):
+        self.records.append({
+            "test": self.current_test,
+            "condition": name,
+            "elapsed": round(elapsed, 4),
+            "ok": ok,
+            "polls": polls,
+        })
+
+    def total(self, test=None):
+        """Total seconds spent waiting, optionally for a single test"""
+        return sum(r["elapsed"] for r in self.records if test is None or r["test"] == test)
+
+    def implicit_by_test(self):
+        """Seconds each test spent inside implicit waits (see track_implicit_waits)"""
+        totals = {}
+        for r in self.records:
+            if r["condition"] in (IMPLICIT_WAIT_HIT, IMPLICIT_WAIT_MISS):
+                totals[r["test"]] = totals.get(r["test"], 0.0) + r["elapsed"]
+        return totals
+
+    def by_condition(self):
+        """Aggregate count / total / max seconds per condition name"""
+        summary = {}
+        for r in self.records:
+            entry = summary.setdefault(r["condition"], {"calls": 0, "total": 0.0, "max": 0.0, "timeouts": 0})
+            entry["calls"] += 1
+            entry["total"] += r["elapsed"]
+            entry["max"] = max(entry["max"], r["elapsed"])
+            if not r["ok"]:
+                entry["timeouts"] += 1
+        return summary
+
+    def dump(self, path, **extra):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({
+                "total_seconds": round(self.total(), 4),
+                "by_condition": self.by_condition(),
+                "implicit_wait_by_test": {test: round(t, 4) for test, t in self.implicit_by_test().items()},
+                "commands_by_test": self.commands,
+                "records": self.records,
+                **extra,
+            }, f, indent=2)
+
+    def merge(self, path):
+        """Add the records of a file written by dump() (one per xdist worker); returns its contents"""
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        self.records.extend(data["records"])
+        for test, count in data["commands_by_test"].items():
+            # JSON turned the fixtures' None key into "null"
+            test = None if test == "null" else test
+            self.commands[test] = self.commands.get(test, 0) + count
+        return data
+
+    def reset(self):
+        self.records = []
+        self.commands = {}
+
+
+WAIT_LOG = WaitLog()
+
+
+def wait_for(driver, condition, timeout=DEFAULT_TIMEOUT, name=None, message=""):
+    """
+    Poll `condition(driver)` until it returns a truthy value and return that value.
+
+    Polling starts at INITIAL_INTERVAL and backs off geometrically up to MAX_INTERVAL,
+    so conditions that are already true cost a single round-trip while slow ones
+    don't hammer chromedriver. Accepts named conditions from this module as well as
+    any selenium expected_conditions callable.
+
+    Raises:
+        TimeoutException: if the condition is still falsy after `timeout` seconds
+    """
+    name = name or getattr(condition, "wait_name", None) or getattr(condition, "__name__", "condition")
+    with WAIT_LOG.span(name):
+        return _poll(driver, condition, timeout, name, message)
+
+
+def _poll(driver, condition, timeout, name, message):
+    start = time.monotonic()
+    deadline = start + timeout
+    interval = INITIAL_INTERVAL
+    polls = 0
+    while True:
+        polls += 1
+        try:
+            value = condition(driver)
+            if value:
+                WAIT_LOG.record(name, time.monotonic() - start, True, polls)
+                return value
+        except IGNORED_EXCEPTIONS:
+            pass
+        now = time.monotonic()
+        if now >= deadline:
+            break
+        time.sleep(min(interval, deadline - now))
+        interval = min(interval * BACKOFF_FACTOR, MAX_INTERVAL)
+
+    WAIT_LOG.record(name, time.monotonic() - start, False, polls)
+    raise TimeoutException(message or f"Timed out after {timeout}s waiting for: {name}")
+
+
+def _named(name):
+    """Attach a readable name to a condition so the wait log can aggregate it"""
+    def decorate(predicate):
+        predicate.wait_name = name
+        return predicate
+    return decorate
+
+
+# ---------------------------------------------------------------------------
+# Named readiness conditions
+# All of them evaluate in the page via execute_script so they never pay the
+# driver's implicit wait on a negative lookup.
+# ---------------------------------------------------------------------------
+
+def document_ready():
+    """document.readyState is 'complete'"""
+    @_named("document ready")
+    def _predicate(driver):
+        return driver.execute_script("return document.readyState") == "complete"
+    return _predicate
+
+
+def react_hydrated(selector="body"):
+    """
+    React has attached to the DOM (a fiber/props key exists on the element),
+    so event handlers on client components will fire.
+    """
+    @_named("React hydrated")
+    def _predicate(driver):
+        return driver.execute_script("""
+            if (document.readyState !== 'complete') return false;
+            const root = document.querySelector(arguments[0]);
+            if (!root) return false;
+            const nodes = [root, ...root.querySelectorAll('form, button, a, input')];
+            return nodes.some(el => Object.keys(el).some(
+                k => k.startsWith('__reactFiber$') || k.startsWith('__reactProps$')
+            ));
+        """, selector)
+    return _predicate
+
+
+def navigation_settled(url_fragment=None):
+    """
+    The URL contains `url_fragment` (if given), the document has finished loading,
+    React has hydrated and the URL did not change since the previous poll.
+    """
+    last_url = {"value": None}
+
+    @_named("navigation settled")
+    def _predicate(driver):
+        state = driver.execute_script("""
+            const root = document.body;
+            const hydrated = !!root && [root, ...root.querySelectorAll('form, button, a, input')].some(
+                el => Object.keys(el).some(k => k.startsWith('__reactFiber$') || k.startsWith('__reactProps$'))
+            );
+            return {url: location.href, ready: document.readyState === 'complete', hydrated: hydrated};
+        """)
+        url = state["url"]
+        stable = url == last_url["value"]
+        last_url["value"] = url
+        if url_fragment and url_fragment not in url:
+            return False
+        return stable and state["ready"] and state["hydrated"]
+    return _predicate
+
+
+def url_contains(fragment):
+    """location.href contains `fragment`"""
+    @_named(f"url contains {fragment}")
+    def _predicate(driver):
+        return fragment in driver.current_url
+    return _predicate
+
+
+def radix_select_open():
+    """A Radix Select listbox is rendered and has at least one option"""
+    @_named("Radix select open")
+    def _predicate(driver):
+        return driver.execute_script(
+            "const lb = document.querySelector(\"[role='listbox']\");"
+            "return !!lb && lb.querySelectorAll(\"[role='option']\").length > 0;"
+        )
+    return _predicate
+
+
+def radix_select_closed():
+    """No Radix Select listbox is mounted and no combobox reports aria-expanded"""
+    @_named("Radix select closed")
+    def _predicate(driver):
+        return driver.execute_script(
+            "return !document.querySelector(\"[role='listbox']\") &&"
+            " !document.querySelector(\"[role='combobox'][aria-expanded='true']\");"
+        )
+    return _predicate
+
+
+def dialog_open():
+    """A Radix Dialog is mounted and open"""
+    @_named("dialog open")
+    def _predicate(driver):
+        return driver.execute_script(
+            "return !!document.querySelector(\"[role='dialog'][data-state='open'], [role='dialog']:not([data-state])\");"
+        )
+    return _predicate
+
+
+def dialog_closed():
+    """No Radix Dialog is mounted (close animations have finished)"""
+    @_named("dialog closed")
+    def _predicate(driver):
+        return driver.execute_script("return !document.querySelector(\"[role='dialog']\");")
+    return _predicate
+
+
+def text_present(text):
+    """`text` appears somewhere in the rendered body text"""
+    @_named(f"text present: {text}")
+    def _predicate(driver):
+        return driver.execute_script(
+            "return !!document.body && document.body.innerText.includes(arguments[0]);", text
+        )
+    return _predicate
+
+
+def form_errors_shown():
+    """react-hook-form marked at least one field invalid"""
+    @_named("form errors shown")
+    def _predicate(driver):
+        return driver.execute_script("return !!document.querySelector(\"[aria-invalid='true']\");")
+    return _predicate
+
+
+def input_value_equals(element, value):
+    """A controlled input reflects `value` after React re-rendered it"""
+    @_named("input value applied")
+    def _predicate(driver):
+        return element.get_attribute("value") == value
+    return _predicate
+
+
+def any_of(*conditions):
+    """Truthy as soon as one of `conditions` is; named after all of them"""
+    @_named(" | ".join(getattr(c, "wait_name", "condition") for c in conditions))
+    def _predicate(driver):
+        for condition in conditions:
+            try:
+                value = condition(driver)
+            except IGNORED_EXCEPTIONS:
+                continue
+            if value:
+                return value
+        return False
+    return _predicate
+
+
+# ---------------------------------------------------------------------------
+# Server action tracking
+# Next.js server actions are POST fetches carrying a `Next-Action` header.
+# track_server_actions() wraps window.fetch so server_action_completed() can
+# tell when every action issued since the call has resolved.
+# ---------------------------------------------------------------------------
+
+_TRACKER_JS = """
+if (!window.__qaNet) {
+    const net = window.__qaNet = {actionsInFlight: 0, actionsCompleted: 0, fetchesInFlight: 0};
+    const origFetch = window.fetch.bind(window);
+    window.fetch = function(input, init) {
+        const headers = (init && init.headers) || {};
+        const isAction = headers instanceof Headers
+            ? headers.has('Next-Action')
+            : Object.keys(headers).some(k => k.toLowerCase() === 'next-action');
+        net.fetchesInFlight++;
+        if (isAction) net.actionsInFlight++;
+        const done = () => {
+            net.fetchesInFlight--;
+            if (isAction) { net.actionsInFlight--; net.actionsCompleted++; }
+        };
+        return origFetch(input, init).then(
+            r => { done(); return r; },
+            e => { done(); throw e; }
+        );
+    };
+}
+window.__qaNet.actionsCompleted = 0;
+"""
+
+
+def track_server_actions(driver):
+    """
+    Install the fetch tracker on the current document (idempotent) and reset
+    the completed-action counter. Call right before the click that fires the action.
+    """
+    driver.execute_script(_TRACKER_JS)
+
+
+def server_action_completed(count=1):
+    """
+    At least `count` server actions have resolved since track_server_actions()
+    and none are still in flight. If the document was replaced (full navigation),
+    the tracker is gone and the action is considered done.
+    """
+    @_named("server action completed")
+    def _predicate(driver):
+        return driver.execute_script("""
+            const net = window.__qaNet;
+            if (!net) return true;
+            return net.actionsInFlight === 0 && net.actionsCompleted >= arguments[0];
+        """, count)
+    return _predicate
+
+
+def network_idle():
+    """No tracked fetches are in flight (requires track_server_actions)"""
+    @_named("network idle")
+    def _predicate(driver):
+        return driver.execute_script("const n = window.__qaNet; return !n || n.fetchesInFlight === 0;")
+    return _predicate
+
+
+# ---------------------------------------------------------------------------
+# Element lookups
+# expect_present() is for elements the test needs: an explicit, logged wait.
+# probe() is for elements that may legitimately be absent: it answers at once,
+# never paying the driver's implicit wait. track_implicit_waits() times every
+# lookup that does run under an implicit wait, so leftovers show up per test.
+# ---------------------------------------------------------------------------
+
+IMPLICIT_WAIT_HIT = "implicit wait"
+IMPLICIT_WAIT_MISS = "implicit wait (miss)"
+
+_FIND_COMMANDS = {
+    Command.FIND_ELEMENT,
+    Command.FIND_ELEMENTS,
+    Command.FIND_CHILD_ELEMENT,
+    Command.FIND_CHILD_ELEMENTS,
+}
+
+
+def track_implicit_waits(driver):
+    """
+    Wrap driver.execute (idempotent) to count WebDriver round-trips per test,
+    follow the implicit-wait setting and record every find_element(s) issued
+    while it is non-zero in WAIT_LOG. A lookup that comes back empty has spent
+    the full implicit wait.
+    """
+    if hasattr(driver, "_qa_implicit_wait"):
+        return driver
+    execute = driver.execute
+    driver._qa_implicit_wait = 0.0
+
+    def _execute(command, params=None):
+        WAIT_LOG.count_command()
+        if command == Command.SET_TIMEOUTS and params and "implicit" in params:
+            driver._qa_implicit_wait = params["implicit"] / 1000
+        if command not in _FIND_COMMANDS or not driver._qa_implicit_wait:
+            return execute(command, params)
+        start = time.monotonic()
+        found = False
+        try:
+            response = execute(command, params)
+            found = bool(response.get("value"))
+            return response
+        finally:
+            WAIT_LOG.record(IMPLICIT_WAIT_HIT if found else IMPLICIT_WAIT_MISS, time.monotonic() - start, found, 1)
+
+    driver.execute = _execute
+    return driver
+
+
+def probe(driver, by, selector, root=None):
+    """
+    Elements matching `selector` right now ([] when there are none), under
+    `root` if given. Zeroes the implicit wait for the call when one is set.
+    """
+    scope = root or driver
+    implicit = getattr(driver, "_qa_implicit_wait", None)
+    if implicit == 0:
+        return scope.find_elements(by, selector)
+    if implicit is None:
+        implicit = driver.timeouts.implicit_wait
+    driver.implicitly_wait(0)
+    try:
+        return scope.find_elements(by, selector)
+    finally:
+        driver.implicitly_wait(implicit)
+
+
+def expect_present(driver, by, selector, timeout=DEFAULT_TIMEOUT, root=None, visible=False):
+    """
+    Wait until `selector` matches (a displayed element with visible=True) and
+    return the first match. Polls with probe(), so only this wait's own
+    timeout applies.
+    """
+    def _predicate(d):
+        for element in probe(d, by, selector, root):
+            if not visible or element.is_displayed():
+                return element
+        return None
+    _predicate.wait_name = f"{'visible' if visible else 'present'}: {selector}"
+    return wait_for(driver, _predicate, timeout=timeout)
+
+
+# ---------------------------------------------------------------------------
+# Convenience wrappers for the most common sequences in the suites
+# ---------------------------------------------------------------------------
+
+def wait_for_page(driver, url_fragment=None, timeout=DEFAULT_TIMEOUT):
+    """Block until a navigation to `url_fragment` has settled and hydrated"""
+    return wait_for(driver, navigation_settled(url_fragment), timeout=timeout)
+
+
+def get_and_settle(driver, url, timeout=DEFAULT_TIMEOUT):
+    """driver.get() followed by a hydration wait - replaces `driver.get(...); time.sleep(1)`"""
+    driver.get(url)
+    return wait_for(driver, navigation_settled(), timeout=timeout)
@@ -98,6 +98,7 @@ export function DashboardClient({
             onKeyDown={handleKeyDown}
             className="pl-9"
             disabled={isPending}
+            data-testid="search-input"
           />
         </div>
         <Button 
@@ -105,6 +106,7 @@ export function DashboardClient({
           disabled={isPending}
           variant="secondary"
           size="default"
+          data-testid="search-button"
         >
           Search
         </Button>
@@ -116,13 +118,13 @@ export function DashboardClient({
         onValueChange={(v) => handleFilterChange('sport', v, 'all')} 
         disabled={isPending}
       >
-        <SelectTrigger className="w-full sm:w-[140px]">
+        <SelectTrigger className="w-full sm:w-[140px]" data-testid="sport-filter">
           <SelectValue placeholder="Sport" />
         </SelectTrigger>
         <SelectContent>
-          <SelectItem value="all">All Sports</SelectItem>
+          <SelectItem value="all" data-testid="sport-filter-option-all">All Sports</SelectItem>
           {sports.map((sport) => (
-            <SelectItem key={sport} value={sport}>
+            <SelectItem key={sport} value={sport} data-testid={`sport-filter-option-${sport}`}>
               {sport}
             </SelectItem>
           ))}
@@ -135,13 +137,13 @@ export function DashboardClient({
         onValueChange={(v) => handleFilterChange('date', v, 'all')} 
         disabled={isPending}
       >
-        <SelectTrigger className="w-full sm:w-[140px]">
+        <SelectTrigger className="w-full sm:w-[140px]" data-testid="date-filter">
           <Calendar className="h-4 w-4 mr-2 text-muted-foreground shrink-0" />
           <SelectValue placeholder="Date" />
         </SelectTrigger>
         <SelectContent>
           {DATE_FILTERS.map((filter) => (
-            <SelectItem key={filter.value} value={filter.value}>
+            <SelectItem key={filter.value} value={filter.value} data-testid={`date-filter-option-${filter.value}`}>
               {filter.label}
             </SelectItem>
           ))}
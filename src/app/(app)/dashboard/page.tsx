@@ -50,7 +50,7 @@ async function EventList({ search, sport, date, sort }: { search?: string; sport
   if (!result.ok) {
     return (
       <div className="text-center py-12 space-y-4">
-        <p className="text-destructive font-medium">{result.error}</p>
+        <p className="text-destructive font-medium" data-testid="events-error">{result.error}</p>
         {result.error?.includes('Database tables not found') && (
           <p className="text-sm text-muted-foreground">
             Go to your Supabase dashboard → SQL Editor and run the schema from{' '}
@@ -117,7 +117,7 @@ export default async function DashboardPage({ searchParams }: DashboardPageProps
       {/* Header Section */}
       <div className="flex flex-col sm:flex-row sm:items-center sm:justify-between gap-4 mb-6">
         <div>
-          <h1 className="text-3xl font-bold tracking-tight text-foreground">
+          <h1 className="text-3xl font-bold tracking-tight text-foreground" data-testid="dashboard-heading">
             Events Dashboard
           </h1>
           <p className="text-muted-foreground mt-1">
@@ -126,7 +126,7 @@ export default async function DashboardPage({ searchParams }: DashboardPageProps
         </div>
         <div className="flex gap-2 ml-auto">
           <Button asChild>
-            <Link href="/events/new">
+            <Link href="/events/new" data-testid="new-event-link">
               <Plus className="mr-2 h-4 w-4" />
               New Event
             </Link>
@@ -62,6 +62,7 @@ export default function LoginPage() {
               <Input
                 id="email"
                 name="email"
+                data-testid="login-email"
                 type="email"
                 placeholder="you@example.com"
                 required
@@ -81,12 +82,13 @@ export default function LoginPage() {
               <Input
                 id="password"
                 name="password"
+                data-testid="login-password"
                 type="password"
                 required
                 disabled={isPending}
               />
             </div>
-            <Button type="submit" className="w-full" disabled={isPending}>
+            <Button type="submit" className="w-full" disabled={isPending} data-testid="login-submit">
               {isPending ? 'Signing in...' : 'Sign In'}
             </Button>
             <div className="relative">
@@ -103,6 +105,7 @@ export default function LoginPage() {
               className="w-full"
               onClick={handleGoogleSignIn}
               disabled={isPending}
+              data-testid="login-google"
             >
               <svg className="mr-2 h-4 w-4" viewBox="0 0 24 24">
                 <path
@@ -129,7 +132,7 @@ export default function LoginPage() {
         <CardFooter className="flex justify-center">
           <p className="text-sm text-muted-foreground">
             Don&apos;t have an account?{' '}
-            <Link href="/signup" className="text-primary hover:underline">
+            <Link href="/signup" className="text-primary hover:underline" data-testid="signup-link">
               Sign up
             </Link>
           </p>
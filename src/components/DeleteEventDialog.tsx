@@ -43,7 +43,7 @@ export function DeleteEventDialog({ eventId, eventName, children }: DeleteEventD
   return (
     <Dialog open={open} onOpenChange={setOpen}>
       <DialogTrigger asChild>{children}</DialogTrigger>
-      <DialogContent>
+      <DialogContent data-testid="delete-event-dialog">
         <DialogHeader>
           <DialogTitle>Delete Event</DialogTitle>
           <DialogDescription>
@@ -51,10 +51,10 @@ export function DeleteEventDialog({ eventId, eventName, children }: DeleteEventD
           </DialogDescription>
         </DialogHeader>
         <DialogFooter>
-          <Button variant="outline" onClick={() => setOpen(false)} disabled={isPending}>
+          <Button variant="outline" onClick={() => setOpen(false)} disabled={isPending} data-testid="delete-event-cancel">
             Cancel
           </Button>
-          <Button variant="destructive" onClick={handleDelete} disabled={isPending}>
+          <Button variant="destructive" onClick={handleDelete} disabled={isPending} data-testid="delete-event-confirm">
             {isPending ? 'Deleting...' : 'Delete'}
           </Button>
         </DialogFooter>
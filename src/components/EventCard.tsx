@@ -44,11 +44,11 @@ export function EventCard({ id, name, sport, startsAt, description, location, ve
   }, [startsAt])
   
   return (
-    <Card className="group hover:shadow-xl hover:shadow-primary/10 transition-all duration-300 border-primary/10 hover:border-primary/30 bg-gradient-to-br from-card to-card/50 flex flex-col h-full">
+    <Card data-testid="event-card" data-event-id={id} className="group hover:shadow-xl hover:shadow-primary/10 transition-all duration-300 border-primary/10 hover:border-primary/30 bg-gradient-to-br from-card to-card/50 flex flex-col h-full">
       <CardHeader className="pb-3">
         <div className="flex items-start justify-between gap-3">
           <div className="space-y-2 flex-1 min-w-0">
-            <CardTitle className="text-xl font-bold group-hover:text-primary transition-colors line-clamp-2">
+            <CardTitle data-testid="event-card-name" className="text-xl font-bold group-hover:text-primary transition-colors line-clamp-2">
               {name}
             </CardTitle>
             <CardDescription className="flex items-center gap-2 text-sm">
@@ -100,7 +100,7 @@ export function EventCard({ id, name, sport, startsAt, description, location, ve
           size="sm" 
           className="flex-1 hover:bg-primary hover:text-primary-foreground transition-colors"
         >
-          <Link href={`/events/${id}/edit`}>
+          <Link href={`/events/${id}/edit`} data-testid="event-edit-link">
             <Edit className="mr-2 h-4 w-4" />
             Edit
           </Link>
@@ -110,6 +110,7 @@ export function EventCard({ id, name, sport, startsAt, description, location, ve
             variant="destructive" 
             size="sm" 
             className="flex-1 hover:bg-destructive/90 transition-colors"
+            data-testid="event-delete-button"
           >
             <Trash2 className="mr-2 h-4 w-4" />
             Delete
@@ -105,7 +105,7 @@ export function EventForm({ defaultValues, onSubmit, submitLabel = 'Create Event
 
   return (
     <Form {...form}>
-      <form onSubmit={form.handleSubmit(handleSubmit)} className="space-y-6">
+      <form onSubmit={form.handleSubmit(handleSubmit)} className="space-y-6" data-testid="event-form">
         <FormField
           control={form.control}
           name="name"
@@ -113,7 +113,7 @@ export function EventForm({ defaultValues, onSubmit, submitLabel = 'Create Event
             <FormItem>
               <FormLabel>Event Name</FormLabel>
               <FormControl>
-                <Input placeholder="Summer Basketball Championship" {...field} />
+                <Input placeholder="Summer Basketball Championship" data-testid="event-name-input" {...field} />
               </FormControl>
               <FormMessage />
             </FormItem>
@@ -128,13 +128,13 @@ export function EventForm({ defaultValues, onSubmit, submitLabel = 'Create Event
               <FormLabel>Sport</FormLabel>
               <Select onValueChange={field.onChange} defaultValue={field.value}>
                 <FormControl>
-                  <SelectTrigger>
+                  <SelectTrigger data-testid="event-sport-select">
                     <SelectValue placeholder="Select a sport" />
                   </SelectTrigger>
                 </FormControl>
                 <SelectContent>
                   {SPORTS.map((sport) => (
-                    <SelectItem key={sport} value={sport}>
+                    <SelectItem key={sport} value={sport} data-testid={`event-sport-option-${sport}`}>
                       {sport}
                     </SelectItem>
                   ))}
@@ -152,7 +152,7 @@ export function EventForm({ defaultValues, onSubmit, submitLabel = 'Create Event
             <FormItem>
               <FormLabel>Date & Time</FormLabel>
               <FormControl>
-                <Input type="datetime-local" {...field} />
+                <Input type="datetime-local" data-testid="event-datetime-input" {...field} />
               </FormControl>
               <FormMessage />
             </FormItem>
@@ -166,7 +166,7 @@ export function EventForm({ defaultValues, onSubmit, submitLabel = 'Create Event
             <FormItem>
               <FormLabel>Description (Optional)</FormLabel>
               <FormControl>
-                <Input placeholder="Event description..." {...field} />
+                <Input placeholder="Event description..." data-testid="event-description-input" {...field} />
               </FormControl>
               <FormMessage />
             </FormItem>
@@ -180,7 +180,7 @@ export function EventForm({ defaultValues, onSubmit, submitLabel = 'Create Event
             <FormItem>
               <FormLabel>Location (Optional)</FormLabel>
               <FormControl>
-                <Input placeholder="Event location..." {...field} />
+                <Input placeholder="Event location..." data-testid="event-location-input" {...field} />
               </FormControl>
               <FormMessage />
             </FormItem>
@@ -207,10 +207,10 @@ export function EventForm({ defaultValues, onSubmit, submitLabel = 'Create Event
         />
 
         {form.formState.errors.root && (
-          <p className="text-sm text-destructive">{form.formState.errors.root.message}</p>
+          <p className="text-sm text-destructive" data-testid="event-form-error">{form.formState.errors.root.message}</p>
         )}
 
-        <Button type="submit" disabled={isPending} className="w-full">
+        <Button type="submit" disabled={isPending} className="w-full" data-testid="event-form-submit">
           {isPending && <Loader2 className="mr-2 h-4 w-4 animate-spin" />}
           {submitLabel}
         </Button>
@@ -35,6 +35,7 @@ export function TopNav() {
           onClick={handleSignOut}
           disabled={isPending}
           className="border-border hover:bg-accent"
+          data-testid="sign-out-button"
         >
           <LogOut className="mr-2 h-4 w-4" />
           {isPending ? 'Signing out...' : 'Sign Out'}
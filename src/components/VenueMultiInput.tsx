@@ -42,20 +42,22 @@ export function VenueMultiInput({ value, onChange, error }: VenueMultiInputProps
           onChange={(e) => setInputValue(e.target.value)}
           onKeyDown={handleKeyDown}
           placeholder="Enter venue name and press Enter"
+          data-testid="venue-input"
           className={error ? 'border-destructive' : ''}
         />
-        <Button type="button" onClick={handleAdd} variant="outline">
+        <Button type="button" onClick={handleAdd} variant="outline" data-testid="venue-add-button">
           Add
         </Button>
       </div>
       {value.length > 0 && (
         <div className="flex flex-wrap gap-2">
           {value.map((venue) => (
-            <Badge key={venue} variant="secondary" className="gap-1">
+            <Badge key={venue} variant="secondary" className="gap-1" data-testid="venue-badge">
               {venue}
               <button
                 type="button"
                 onClick={() => handleRemove(venue)}
+                data-testid="venue-remove-button"
                 className="ml-1 rounded-full hover:bg-destructive/20"
               >
                 <X className="h-3 w-3" />